@@ -1,41 +1,31 @@
-"""This file is for LangGraph Studio testing."""
+"""
+This file is for LangGraph Studio testing.
 
-from langchain_neo4j import Neo4jGraph
-from langchain_openai import ChatOpenAI
+`graph` is a graph factory, so importing this module neither connects to Neo4j nor reads the schema.
+The workflow is created on the first run and reused by every later run.
+"""
+
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
 
-from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
 from neo4j_text2cypher.utils.config import ConfigLoader
-from neo4j_text2cypher.utils.debug import setup_debug_logging
-from neo4j_text2cypher.workflows.neo4j_text2cypher_workflow import (
-    create_neo4j_text2cypher_workflow,
-)
+from neo4j_text2cypher.workflows.resources import create_workflow_from_config
 
 # Use unified configuration
 config_path = "example_apps/iqs_data_explorer/app-config.yml"
-config_loader = ConfigLoader(config_path)
-
-# Setup debug logging from config
-debug_config = config_loader.get_debug_config()
-setup_debug_logging(debug_config)
-
-# Initialize Neo4j connection with app-specific settings
-neo4j_params = config_loader.get_neo4j_connection_params()
-neo4j_graph = Neo4jGraph(**neo4j_params)
 
-# Initialize LLM
-llm = ChatOpenAI(model="gpt-4o", temperature=0)
 
-# Use unified config retriever
-cypher_example_retriever = ConfigCypherExampleRetriever(config_path=config_path)
+@lru_cache(maxsize=1)
+def create_agent_workflow() -> CompiledStateGraph:
+    """Connect to Neo4j and compile the workflow of the app config, once per process."""
+    _, workflow = create_workflow_from_config(
+        ConfigLoader(config_path), attempt_cypher_execution_on_final_attempt=True
+    )
+    return workflow
 
-# Get scope description from config
-streamlit_config = config_loader.get_streamlit_config()
 
-# Create the graph to be found by LangGraph Studio
-graph = create_neo4j_text2cypher_workflow(
-    llm=llm,
-    graph=neo4j_graph,
-    cypher_example_retriever=cypher_example_retriever,
-    scope_description=streamlit_config.scope_description,
-    attempt_cypher_execution_on_final_attempt=True,
-)
+def graph(config: RunnableConfig) -> CompiledStateGraph:
+    """Get the graph to be found by LangGraph Studio, creating it on first use."""
+    return create_agent_workflow()
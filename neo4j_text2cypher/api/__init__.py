@@ -0,0 +1,15 @@
+"""This module contains the ASGI service."""
+
+from .app import create_app, create_multi_tenant_app, create_workflow_from_config
+from .models import AskRequest
+from .service import Text2CypherService
+from .tenants import TenantRegistry
+
+__all__ = [
+    "AskRequest",
+    "TenantRegistry",
+    "Text2CypherService",
+    "create_app",
+    "create_multi_tenant_app",
+    "create_workflow_from_config",
+]
@@ -0,0 +1,295 @@
+"""
+ASGI service answering questions over HTTP.
+
+Run it with:
+    TEXT2CYPHER_CONFIG=example_apps/iqs_data_explorer/app-config.yml uvicorn --factory neo4j_text2cypher.api:create_app
+
+or serve several app configs with:
+    TEXT2CYPHER_CONFIGS="example_apps/*/app-config.yml" uvicorn --factory neo4j_text2cypher.api:create_multi_tenant_app
+"""
+
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Sequence, Union
+
+from langchain_neo4j import Neo4jGraph
+from langgraph.graph.state import CompiledStateGraph
+from pydantic import ValidationError
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from neo4j_text2cypher.api.models import AskRequest
+from neo4j_text2cypher.api.service import Text2CypherService
+from neo4j_text2cypher.api.tenants import TenantRegistry
+from neo4j_text2cypher.exceptions import InvalidRequestError, UnknownTenantError
+from neo4j_text2cypher.utils.config import BudgetConfig, CheckpointConfig, ConfigLoader
+from neo4j_text2cypher.utils.schema_utils import get_schema_version
+from neo4j_text2cypher.workflows.checkpointing import open_checkpointer
+from neo4j_text2cypher.workflows.resources import create_workflow_from_config
+
+DEFAULT_CONFIG_PATH = "example_apps/iqs_data_explorer/app-config.yml"
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    # records may hold Neo4j temporal and spatial values
+    return Response(
+        json.dumps(content, default=str),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def _parse_request(request: Request) -> AskRequest:
+    return AskRequest.model_validate(await request.json())
+
+
+async def ask(request: Request) -> Response:
+    service: Text2CypherService = request.app.state.service
+    try:
+        ask_request = await _parse_request(request)
+    except (ValidationError, ValueError) as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    # errors raised while running the workflow are server errors
+    try:
+        return _json_response(await service.ask(ask_request))
+    except InvalidRequestError as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+
+
+async def ask_stream(request: Request) -> Response:
+    service: Text2CypherService = request.app.state.service
+    try:
+        ask_request = await _parse_request(request)
+    except (ValidationError, ValueError) as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    try:
+        events = service.stream(ask_request)
+    except InvalidRequestError as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def health(request: Request) -> Response:
+    return JSONResponse({"status": "ok"})
+
+
+def create_app(
+    config_path: Optional[str] = None,
+    workflow: Optional[CompiledStateGraph] = None,
+    request_timeout: Optional[float] = None,
+    checkpoint_config: Optional[CheckpointConfig] = None,
+    budget_config: Optional[BudgetConfig] = None,
+) -> Starlette:
+    """
+    Create the ASGI application.
+
+    The workflow is compiled once at startup and shared by all requests.
+
+    Parameters
+    ----------
+    config_path : Optional[str], optional
+        The app config, by default the `TEXT2CYPHER_CONFIG` environment variable or the example app config
+        Ignored if `workflow` is provided.
+    workflow : Optional[CompiledStateGraph], optional
+        A compiled workflow to serve instead of the one described by the app config, by default None
+    request_timeout : Optional[float], optional
+        The deadline of a request in seconds, by default the `timeouts.request_seconds` of the app config
+    checkpoint_config : Optional[CheckpointConfig], optional
+        Conversation checkpointing for requests with a `thread_id`, by default the `checkpoints` section of the app config
+    budget_config : Optional[BudgetConfig], optional
+        The token and cost budget of a request, by default the `budget` section of the app config
+
+    Returns
+    -------
+    Starlette
+        The application.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        graph: Optional[Neo4jGraph] = None
+        served_workflow = workflow
+        timeout = request_timeout
+        checkpoints = checkpoint_config or CheckpointConfig()
+        budget = budget_config
+        schema_version = ""
+
+        if served_workflow is None:
+            config_loader = ConfigLoader(
+                config_path or os.getenv("TEXT2CYPHER_CONFIG", DEFAULT_CONFIG_PATH)
+            )
+            # connecting and reading the schema block, so keep them off the event loop
+            graph, served_workflow = await asyncio.to_thread(
+                create_workflow_from_config, config_loader
+            )
+            schema_version = get_schema_version(graph)
+            if timeout is None:
+                timeout = config_loader.get_timeout_config().request_seconds
+            checkpoints = checkpoint_config or config_loader.get_checkpoint_config()
+            budget = budget_config or config_loader.get_budget_config()
+
+        try:
+            async with open_checkpointer(checkpoints) as checkpointer:
+                app.state.service = Text2CypherService(
+                    served_workflow,
+                    checkpointer=checkpointer,
+                    request_timeout=timeout,
+                    schema_version=schema_version,
+                    budget_config=budget,
+                )
+                yield
+        finally:
+            if graph is not None:
+                graph.close()
+
+    return Starlette(
+        routes=[
+            Route("/ask", ask, methods=["POST"]),
+            Route("/ask/stream", ask_stream, methods=["POST"]),
+            Route("/health", health, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def _unknown_tenant_response(error: UnknownTenantError) -> Response:
+    return JSONResponse({"detail": str(error)}, status_code=404)
+
+
+async def list_tenants(request: Request) -> Response:
+    registry: TenantRegistry = request.app.state.registry
+    return JSONResponse(
+        {
+            "tenants": [
+                {"tenant_id": tenant_id, "loaded": registry.is_loaded(tenant_id)}
+                for tenant_id in registry.tenant_ids
+            ]
+        }
+    )
+
+
+async def ask_tenant(request: Request) -> Response:
+    registry: TenantRegistry = request.app.state.registry
+    tenant_id = request.path_params["tenant"]
+    try:
+        ask_request = await _parse_request(request)
+    except (ValidationError, ValueError) as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    # a tenant that fails to load is a server error, not a bad request
+    try:
+        service = await registry.acquire(tenant_id)
+    except UnknownTenantError as e:
+        return _unknown_tenant_response(e)
+    try:
+        return _json_response(await service.ask(ask_request))
+    except InvalidRequestError as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    finally:
+        registry.release(tenant_id)
+
+
+async def ask_tenant_stream(request: Request) -> Response:
+    registry: TenantRegistry = request.app.state.registry
+    tenant_id = request.path_params["tenant"]
+    try:
+        ask_request = await _parse_request(request)
+    except (ValidationError, ValueError) as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    try:
+        service = await registry.acquire(tenant_id)
+    except UnknownTenantError as e:
+        return _unknown_tenant_response(e)
+    try:
+        stream = service.stream(ask_request)
+    except InvalidRequestError as e:
+        registry.release(tenant_id)
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    except BaseException:
+        registry.release(tenant_id)
+        raise
+
+    async def events() -> AsyncIterator[str]:
+        # the tenant must not be evicted before the stream ends
+        try:
+            async for event in stream:
+                yield event
+        finally:
+            registry.release(tenant_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def create_multi_tenant_app(
+    config_paths: Optional[Sequence[Union[str, os.PathLike]]] = None,
+    cache_dir: str = ".cache/tenants",
+    idle_seconds: Optional[float] = 900.0,
+    eviction_interval: float = 60.0,
+) -> Starlette:
+    """
+    Create an ASGI application serving many app configs, each under `/tenants/{tenant}`.
+
+    A tenant is named by the directory of its app config. Its workflow is compiled on its first request
+    and closed once it has been idle for `idle_seconds`. See `TenantRegistry`.
+
+    Parameters
+    ----------
+    config_paths : Optional[Sequence[Union[str, os.PathLike]]], optional
+        The app configs or glob patterns, by default the comma separated `TEXT2CYPHER_CONFIGS` environment variable
+    cache_dir : str, optional
+        The directory holding the cache files each tenant keeps in `.cache`, by default ".cache/tenants"
+    idle_seconds : Optional[float], optional
+        How long a tenant without requests stays compiled, by default 900.0
+        If None, tenants are never evicted.
+    eviction_interval : float, optional
+        Seconds between checks for idle tenants, by default 60.0
+
+    Returns
+    -------
+    Starlette
+        The application.
+    """
+    if config_paths is None:
+        config_paths = [
+            path.strip()
+            for path in os.getenv("TEXT2CYPHER_CONFIGS", "").split(",")
+            if path.strip()
+        ]
+    registry = TenantRegistry.from_paths(
+        config_paths, cache_dir=cache_dir, idle_seconds=idle_seconds
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        app.state.registry = registry
+        eviction = asyncio.create_task(registry.run_eviction(eviction_interval))
+        try:
+            yield
+        finally:
+            eviction.cancel()
+            try:
+                await eviction
+            except asyncio.CancelledError:
+                pass
+            await registry.aclose()
+
+    return Starlette(
+        routes=[
+            Route("/tenants", list_tenants, methods=["GET"]),
+            Route("/tenants/{tenant}/ask", ask_tenant, methods=["POST"]),
+            Route("/tenants/{tenant}/ask/stream", ask_tenant_stream, methods=["POST"]),
+            Route("/health", health, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
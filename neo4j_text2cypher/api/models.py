@@ -0,0 +1,19 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from neo4j_text2cypher.components.state import HistoryRecord
+
+
+class AskRequest(BaseModel):
+    """The body of an `/ask` or `/ask/stream` request."""
+
+    question: str = Field(min_length=1, description="The user question")
+    thread_id: Optional[str] = Field(
+        default=None,
+        description="The conversation thread. Requires checkpointing, which then supplies the history.",
+    )
+    history: List[HistoryRecord] = Field(
+        default=[],
+        description="Previous turns of the conversation, for clients that keep the history themselves",
+    )
@@ -0,0 +1,225 @@
+"""A Text2Cypher workflow shared by concurrent API requests."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.api.models import AskRequest
+from neo4j_text2cypher.components.state import InputState, OutputState
+from neo4j_text2cypher.exceptions import InvalidRequestError
+from neo4j_text2cypher.utils.budget import with_request_budget
+from neo4j_text2cypher.utils.config import BudgetConfig
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+from neo4j_text2cypher.workflows.checkpointing import (
+    get_thread_config,
+    with_checkpointer,
+)
+from neo4j_text2cypher.workflows.coalescer import RequestCoalescer
+from neo4j_text2cypher.workflows.deadlines import (
+    DEADLINE_EXCEEDED_ANSWER,
+    ainvoke_with_deadline,
+)
+
+RECURSION_LIMIT = 30
+# the node whose LLM tokens are streamed to clients
+STREAMED_NODE = "summarize"
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format a server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def get_output(values: Dict[str, Any]) -> OutputState:
+    """Keep the `OutputState` keys of the workflow state."""
+    return OutputState(
+        **{key: values[key] for key in OutputState.__annotations__ if key in values}  # type: ignore[typeddict-item]
+    )
+
+
+class Text2CypherService:
+    """
+    Answer questions for API clients with one compiled workflow.
+
+    The workflow, and with it the Neo4j driver pool and LLM clients, is shared by every request.
+    Identical stateless questions asked concurrently share one workflow run.
+    """
+
+    def __init__(
+        self,
+        workflow: CompiledStateGraph,
+        checkpointer: Optional[BaseCheckpointSaver] = None,  # type: ignore[type-arg]
+        request_timeout: Optional[float] = None,
+        schema_version: str = "",
+        metrics: Optional[MetricsRecorder] = None,
+        budget_config: Optional[BudgetConfig] = None,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Parameters
+        ----------
+        workflow : CompiledStateGraph
+            The compiled Text2Cypher workflow.
+        checkpointer : Optional[BaseCheckpointSaver], optional
+            Keeps the state of conversations that send a `thread_id`, by default None
+        request_timeout : Optional[float], optional
+            The deadline of a request in seconds, by default None
+        schema_version : str, optional
+            The version stamp of the graph schema the workflow was built with, by default ""
+        metrics : Optional[MetricsRecorder], optional
+            Where to record request metrics, by default the process-wide recorder
+        budget_config : Optional[BudgetConfig], optional
+            The token and cost budget of a request, by default None, which only tracks usage
+        """
+        self.workflow = workflow
+        self.checkpointed_workflow = with_checkpointer(workflow, checkpointer)
+        self.checkpointer = checkpointer
+        self.request_timeout = request_timeout
+        self.metrics = metrics or get_metrics()
+        self.budget_config = budget_config or BudgetConfig()
+        self.coalescer = RequestCoalescer(
+            workflow,
+            schema_version=schema_version,
+            metrics=self.metrics,
+            request_timeout=request_timeout,
+        )
+
+    def _prepare(
+        self, request: AskRequest
+    ) -> Tuple[CompiledStateGraph, InputState, RunnableConfig]:
+        """
+        Get the workflow, input and run config of a request.
+
+        Raises
+        ------
+        InvalidRequestError
+            If the request has a `thread_id` but checkpointing is disabled.
+        """
+        config = with_request_budget(
+            self.budget_config,
+            RunnableConfig(recursion_limit=RECURSION_LIMIT),
+            metrics=self.metrics,
+        )
+        if request.thread_id is not None:
+            if self.checkpointer is None:
+                raise InvalidRequestError("`thread_id` requires checkpointing to be enabled.")
+            return (
+                self.checkpointed_workflow,
+                InputState(question=request.question),  # type: ignore[typeddict-item]
+                get_thread_config(request.thread_id, config),
+            )
+        return (
+            self.workflow,
+            InputState(question=request.question, data=[], history=request.history),
+            config,
+        )
+
+    async def ask(self, request: AskRequest) -> OutputState:
+        """
+        Answer a question.
+
+        Parameters
+        ----------
+        request : AskRequest
+            The request.
+
+        Returns
+        -------
+        OutputState
+            The workflow output. If the request deadline passes, the run is cancelled and the partial output
+            is returned, with `deadline_exceeded` as its last step.
+        """
+        self.metrics.increment("api.requests")
+        workflow, input, config = self._prepare(request)
+        if workflow is self.workflow:
+            result = await self.coalescer.ainvoke(input, config=config)
+        else:
+            result = await ainvoke_with_deadline(
+                workflow, input, config=config, timeout=self.request_timeout
+            )
+        return get_output(dict(result))
+
+    def stream(self, request: AskRequest) -> AsyncIterator[str]:
+        """
+        Answer a question as server-sent events.
+
+        * `node`: a workflow node finished. `path` holds the enclosing subgraph nodes.
+        * `token`: a token of the summary.
+        * `answer`: the workflow output. This is the last event of a successful run.
+        * `error`: the run failed or passed its deadline. This is the last event.
+
+        Parameters
+        ----------
+        request : AskRequest
+            The request.
+
+        Returns
+        -------
+        AsyncIterator[str]
+            The formatted events.
+        """
+        self.metrics.increment("api.streams")
+        workflow, input, config = self._prepare(request)
+        return self._stream(workflow, input, config)
+
+    async def _stream(
+        self, workflow: CompiledStateGraph, input: InputState, config: RunnableConfig
+    ) -> AsyncIterator[str]:
+        events: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+        async def produce() -> None:
+            values: Dict[str, Any] = dict()
+            async for namespace, mode, chunk in workflow.astream(
+                input,
+                config=config,
+                stream_mode=["updates", "messages", "values"],
+                subgraphs=True,
+            ):
+                path = [node.split(":")[0] for node in namespace]
+                if mode == "values" and not namespace:
+                    values = chunk
+                elif mode == "updates":
+                    for node in chunk:
+                        await events.put(format_sse("node", {"node": node, "path": path}))
+                elif mode == "messages":
+                    message, metadata = chunk
+                    if (
+                        isinstance(message, AIMessageChunk)
+                        and metadata.get("langgraph_node") == STREAMED_NODE
+                        and message.content
+                    ):
+                        await events.put(format_sse("token", {"text": message.content}))
+            await events.put(format_sse("answer", get_output(values)))
+
+        producer = asyncio.ensure_future(produce())
+        producer.add_done_callback(lambda _: events.put_nowait(None))
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self.request_timeout
+            if self.request_timeout is not None
+            else None
+        )
+        try:
+            while True:
+                timeout = deadline - loop.time() if deadline is not None else None
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    self.metrics.increment("deadlines.request.exceeded")
+                    yield format_sse("error", {"detail": DEADLINE_EXCEEDED_ANSWER})
+                    return
+                if event is None:
+                    break
+                yield event
+            if not producer.cancelled() and producer.exception() is not None:
+                yield format_sse("error", {"detail": str(producer.exception())})
+        finally:
+            # also reached when the client disconnects
+            producer.cancel()
+            await asyncio.wait([producer])
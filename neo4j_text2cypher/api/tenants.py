@@ -0,0 +1,291 @@
+"""A registry serving the workflows of many app configs from one process."""
+
+import asyncio
+import glob
+import time
+from collections import Counter
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Union
+
+from langchain_core.language_models import BaseChatModel
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.api.service import Text2CypherService
+from neo4j_text2cypher.exceptions import UnknownTenantError
+from neo4j_text2cypher.utils.config import ConfigLoader
+from neo4j_text2cypher.utils.connections import Neo4jDriverPool
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+from neo4j_text2cypher.utils.schema_utils import get_schema_version
+from neo4j_text2cypher.workflows.checkpointing import open_checkpointer
+from neo4j_text2cypher.workflows.resources import create_workflow_from_config
+
+
+# the directory the stock defaults and example app configs cache to
+_SHARED_CACHE_DIR = Path(".cache")
+
+
+def partition_cache_paths(config_loader: ConfigLoader, directory: Union[str, Path]) -> None:
+    """
+    Move the cache files that an app config keeps in the shared `.cache` directory, as at their default path
+    or as in the example app configs, into a directory of its own, so that tenants do not overwrite each other's
+    schema snapshot, checkpoints, verified queries or property value index. Other paths set in the config are kept.
+    """
+    config = config_loader.load_config()
+    for section in (
+        config.schema_snapshot,
+        config.checkpoints,
+        config.verified_queries,
+        config.property_value_index,
+    ):
+        if section.path is not None and Path(section.path).parent == _SHARED_CACHE_DIR:
+            section.path = str(Path(directory) / Path(section.path).name)
+
+
+def get_cache_paths(config_loader: ConfigLoader) -> List[str]:
+    """Get the files an app config caches to."""
+    config = config_loader.load_config()
+    paths = [
+        config.schema_snapshot.path if config.schema_snapshot.enabled else None,
+        config.checkpoints.path if config.checkpoints.enabled else None,
+        config.verified_queries.path if config.verified_queries.enabled else None,
+        config.property_value_index.path if config.property_value_index.enabled else None,
+    ]
+    return [str(Path(path).resolve()) for path in paths if path is not None]
+
+
+class Tenant:
+    """One app config of a registry, and its service once it has been compiled."""
+
+    def __init__(self, tenant_id: str, config_loader: ConfigLoader) -> None:
+        self.tenant_id = tenant_id
+        self.config_loader = config_loader
+        self.service: Optional[Text2CypherService] = None
+        self.graph: Optional[Neo4jGraph] = None
+        self.active = 0
+        self.last_used = time.monotonic()
+        self.lock = asyncio.Lock()
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+
+class TenantRegistry:
+    """
+    Serves the workflows of many app configs, or tenants, from one process.
+
+    A tenant's workflow is compiled on its first request and closed again once it has been idle for `idle_seconds`.
+    Tenants share Neo4j drivers when they connect to the same DBMS with the same credentials, and LLM clients when their
+    model settings match. Each tenant keeps its own graph schema, concurrency limits, request coalescing, verified queries,
+    property value index and checkpoints. Cache files kept directly in `.cache` are moved to `cache_dir/<tenant id>`.
+    """
+
+    def __init__(
+        self,
+        config_paths: Mapping[str, Union[str, Path]],
+        cache_dir: Union[str, Path] = ".cache/tenants",
+        idle_seconds: Optional[float] = 900.0,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        """
+        Load the app configs. No workflow is compiled until it is used.
+
+        Parameters
+        ----------
+        config_paths : Mapping[str, Union[str, Path]]
+            The app config of each tenant by tenant id.
+        cache_dir : Union[str, Path], optional
+            The directory holding a cache directory for each tenant, by default ".cache/tenants"
+        idle_seconds : Optional[float], optional
+            How long a tenant without requests stays compiled, by default 900.0
+            If None, tenants are never evicted.
+        metrics : Optional[MetricsRecorder], optional
+            Where to record tenant and request metrics, by default the process-wide recorder
+
+        Raises
+        ------
+        ValueError
+            If two tenants cache to the same file.
+        """
+        self.idle_seconds = idle_seconds
+        self.metrics = metrics or get_metrics()
+        self.driver_pool = Neo4jDriverPool(metrics=self.metrics)
+        self.llm_clients: Dict[str, BaseChatModel] = dict()
+        self._tenants: Dict[str, Tenant] = dict()
+        for tenant_id, config_path in config_paths.items():
+            config_loader = ConfigLoader(str(config_path))
+            partition_cache_paths(config_loader, Path(cache_dir) / tenant_id)
+            self._tenants[tenant_id] = Tenant(tenant_id, config_loader)
+
+        shared = [
+            path
+            for path, count in Counter(
+                path
+                for tenant in self._tenants.values()
+                for path in get_cache_paths(tenant.config_loader)
+            ).items()
+            if count > 1
+        ]
+        if shared:
+            raise ValueError(f"Tenants must not share cache files: {sorted(shared)}")
+
+    @classmethod
+    def from_paths(
+        cls, config_paths: Iterable[Union[str, Path]], **kwargs: Any
+    ) -> "TenantRegistry":
+        """
+        Create a registry of app configs, each named by the directory it is in, as `iqs_data_explorer`
+        for `example_apps/iqs_data_explorer/app-config.yml`. Paths may be glob patterns.
+
+        Raises
+        ------
+        ValueError
+            If no app config is found, or two are in directories of the same name.
+        """
+        paths = [
+            Path(match)
+            for config_path in config_paths
+            for match in (sorted(glob.glob(str(config_path))) or [config_path])
+        ]
+        if not paths:
+            raise ValueError("No app configs were provided.")
+        tenant_ids = [path.resolve().parent.name for path in paths]
+        duplicates = sorted(
+            tenant_id for tenant_id, count in Counter(tenant_ids).items() if count > 1
+        )
+        if duplicates:
+            raise ValueError(f"App configs must be in directories of different names: {duplicates}")
+        return cls(dict(zip(tenant_ids, paths)), **kwargs)
+
+    @property
+    def tenant_ids(self) -> List[str]:
+        """The ids of all tenants."""
+        return sorted(self._tenants)
+
+    def is_loaded(self, tenant_id: str) -> bool:
+        """Whether the workflow of a tenant is compiled."""
+        tenant = self._tenants.get(tenant_id)
+        return tenant is not None and tenant.service is not None
+
+    async def acquire(self, tenant_id: str) -> Text2CypherService:
+        """
+        Get the service of a tenant, compiling its workflow if needed.
+        The tenant is not evicted until each acquire is followed by a `release`. See also `use`.
+
+        Raises
+        ------
+        UnknownTenantError
+            If the registry has no such tenant.
+        """
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            raise UnknownTenantError(f"Unknown tenant: {tenant_id}")
+        tenant.active += 1
+        try:
+            async with tenant.lock:
+                if tenant.service is None:
+                    await self._load(tenant)
+                    assert tenant.service is not None
+                return tenant.service
+        except BaseException:
+            self.release(tenant_id)
+            raise
+
+    def release(self, tenant_id: str) -> None:
+        """Release a service from `acquire`."""
+        tenant = self._tenants[tenant_id]
+        tenant.active -= 1
+        tenant.last_used = time.monotonic()
+
+    @asynccontextmanager
+    async def use(self, tenant_id: str) -> AsyncIterator[Text2CypherService]:
+        """Use the service of a tenant, which is not evicted while in use."""
+        service = await self.acquire(tenant_id)
+        try:
+            yield service
+        finally:
+            self.release(tenant_id)
+
+    async def _load(self, tenant: Tenant) -> None:
+        config_loader = tenant.config_loader
+        start = time.perf_counter()
+        # connecting and reading the schema block, so keep them off the event loop
+        graph, workflow = await asyncio.to_thread(
+            create_workflow_from_config,
+            config_loader,
+            driver_pool=self.driver_pool,
+            llm_clients=self.llm_clients,
+        )
+        exit_stack = AsyncExitStack()
+        try:
+            checkpointer = await exit_stack.enter_async_context(
+                open_checkpointer(config_loader.get_checkpoint_config())
+            )
+        except BaseException:
+            graph.close()
+            raise
+        tenant.graph = graph
+        tenant._exit_stack = exit_stack
+        tenant.service = Text2CypherService(
+            workflow,
+            checkpointer=checkpointer,
+            request_timeout=config_loader.get_timeout_config().request_seconds,
+            schema_version=get_schema_version(graph),
+            metrics=self.metrics,
+            budget_config=config_loader.get_budget_config(),
+        )
+        self.metrics.increment("tenants.loaded")
+        self.metrics.observe("tenants.load_seconds", time.perf_counter() - start)
+        get_validation_logger().debug(
+            f"🔍 TENANTS DEBUG - Loaded {tenant.tenant_id} from {config_loader.config_path}"
+        )
+
+    async def _unload(self, tenant: Tenant) -> None:
+        if tenant._exit_stack is not None:
+            await tenant._exit_stack.aclose()
+        if tenant.graph is not None:
+            tenant.graph.close()
+        tenant.service = None
+        tenant.graph = None
+        tenant._exit_stack = None
+
+    async def evict_idle(self) -> List[str]:
+        """
+        Close the workflows of tenants that have been idle for longer than `idle_seconds`.
+
+        Returns
+        -------
+        List[str]
+            The ids of the evicted tenants.
+        """
+        if self.idle_seconds is None:
+            return list()
+        evicted = list()
+        for tenant in self._tenants.values():
+            if tenant.service is None or tenant.active:
+                continue
+            if time.monotonic() - tenant.last_used < self.idle_seconds:
+                continue
+            async with tenant.lock:
+                # a request may have arrived while waiting for the lock
+                if tenant.service is None or tenant.active:
+                    continue
+                await self._unload(tenant)
+            evicted.append(tenant.tenant_id)
+            self.metrics.increment("tenants.evicted")
+            get_validation_logger().debug(
+                f"🔍 TENANTS DEBUG - Evicted {tenant.tenant_id} after {self.idle_seconds} idle seconds"
+            )
+        return evicted
+
+    async def run_eviction(self, interval: float = 60.0) -> None:
+        """Evict idle tenants every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.evict_idle()
+
+    async def aclose(self) -> None:
+        """Close every compiled workflow and the shared Neo4j drivers."""
+        for tenant in self._tenants.values():
+            async with tenant.lock:
+                await self._unload(tenant)
+        self.driver_pool.close()
@@ -1,6 +1,7 @@
 from typing import Any, Callable, Coroutine
 
 from neo4j_text2cypher.components.state import OverallState
+from neo4j_text2cypher.utils.budget import get_request_budget
 
 
 def create_final_answer_node() -> (
@@ -8,6 +9,7 @@ def create_final_answer_node() -> (
 ):
     """
     Create a final_answer node for a LangGraph workflow.
+    If the run has a request budget, its LLM usage and what was skipped to stay within it are reported in `usage`.
 
     Parameters
     ----------
@@ -42,10 +44,13 @@ def create_final_answer_node() -> (
             ],
         }
 
+        budget = get_request_budget()
+
         return {
             "answer": answer,
             "steps": ["final_answer"],
             "history": [history_record],
+            "usage": budget.report() if budget is not None else None,
         }
 
     return final_answer
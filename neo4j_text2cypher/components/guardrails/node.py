@@ -13,12 +13,14 @@ from neo4j_text2cypher.components.guardrails.prompts import (
     create_guardrails_prompt_template,
 )
 from neo4j_text2cypher.components.state import InputState
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
 
 
 def create_guardrails_node(
     llm: BaseChatModel,
     graph: Optional[Neo4jGraph] = None,
     scope_description: Optional[str] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> Callable[[InputState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create a guardrails node to be used in a LangGraph workflow.
@@ -31,6 +33,8 @@ def create_guardrails_node(
         The `Neo4jGraph` object used to generated a schema definition, by default None
     scope_description : Optional[str], optional
         A description of the application scope, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the prompt, by default None
 
     Returns
     -------
@@ -39,7 +43,9 @@ def create_guardrails_node(
     """
 
     guardrails_prompt = create_guardrails_prompt_template(
-        graph=graph, scope_description=scope_description
+        graph=graph,
+        scope_description=scope_description,
+        schema_prompt_config=schema_prompt_config,
     )
 
     guardrails_chain: Runnable[Dict[str, Any], Any] = (
@@ -7,6 +7,7 @@ from typing import Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_neo4j import Neo4jGraph
 
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
 from neo4j_text2cypher.utils.schema_utils import (
     retrieve_and_parse_schema_from_graph_for_prompts,
 )
@@ -20,7 +21,9 @@ Provide only the specified output: "planner" or "end".
 
 
 def create_guardrails_prompt_template(
-    graph: Optional[Neo4jGraph] = None, scope_description: Optional[str] = None
+    graph: Optional[Neo4jGraph] = None,
+    scope_description: Optional[str] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> ChatPromptTemplate:
     """
     Create a guardrails prompt template.
@@ -31,6 +34,8 @@ def create_guardrails_prompt_template(
         The `Neo4jGraph` object used to generated a schema definition, by default None
     scope_description : Optional[str], optional
         A description of the application scope, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the prompt, by default None
 
     Returns
     -------
@@ -42,8 +47,12 @@ def create_guardrails_prompt_template(
         if scope_description is not None
         else ""
     )
+    # the schema is part of the template, so its braces must not be read as variables
     graph_context = (
-        f"\nUse the graph schema to inform your answer:\n{retrieve_and_parse_schema_from_graph_for_prompts(graph)}"
+        "\nUse the graph schema to inform your answer:\n"
+        + retrieve_and_parse_schema_from_graph_for_prompts(
+            graph, schema_prompt_config
+        ).replace("{", "{{").replace("}", "}}")
         if graph is not None
         else ""
     )
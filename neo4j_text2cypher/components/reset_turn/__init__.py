@@ -0,0 +1,3 @@
+from .node import create_reset_turn_node
+
+__all__ = ["create_reset_turn_node"]
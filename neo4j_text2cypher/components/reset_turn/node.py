@@ -0,0 +1,41 @@
+from typing import Any, Callable, Coroutine, Optional
+
+from neo4j_text2cypher.components.state import OverallState
+from neo4j_text2cypher.utils.scheduling import get_deadline
+
+
+def create_reset_turn_node(
+    request_seconds: Optional[float] = None,
+) -> Callable[[OverallState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a reset_turn node for a LangGraph workflow.
+    A checkpointed conversation restores the previous turn's state, so everything but the question and history is cleared first.
+    The deadline of the turn is set here, so that text2cypher tasks can plan their corrections around it.
+
+    Parameters
+    ----------
+    request_seconds : Optional[float], optional
+        The deadline of a turn in seconds, by default None
+
+    Returns
+    -------
+    Callable[[OverallState], Coroutine[Any, Any, dict[str, Any]]]
+        The LangGraph node.
+    """
+
+    async def reset_turn(state: OverallState) -> dict[str, Any]:
+        """
+        Clear the state of the previous turn.
+        """
+
+        return {
+            "tasks": None,
+            "next_action": "",
+            "cyphers": None,
+            "summary": None,
+            "steps": None,
+            "usage": None,
+            "deadline": get_deadline(request_seconds),
+        }
+
+    return reset_turn
@@ -1,10 +1,12 @@
-from operator import add
-from typing import Annotated, Any, Dict, List
+from typing import Annotated, Any, Dict, List, Optional, TypeVar
 
 from typing_extensions import TypedDict
 
 from neo4j_text2cypher.components.models import Task
 from neo4j_text2cypher.components.text2cypher.state import CypherOutputState
+from neo4j_text2cypher.utils.budget import BudgetReport
+
+T = TypeVar("T")
 
 
 class CypherHistoryRecord(TypedDict):
@@ -44,8 +46,30 @@ def update_history(
 
     SIZE: int = 5
 
-    history.extend(new)
-    return history[-SIZE:]
+    return (history + new)[-SIZE:]
+
+
+def add_or_reset(current: List[T], new: Optional[List[T]]) -> List[T]:
+    """
+    Concatenate lists like `operator.add`, or clear the list if the update is None.
+    Lists that accumulate within a turn are cleared at the start of the next turn of a checkpointed conversation.
+
+    Parameters
+    ----------
+    current : List[T]
+        The current list.
+    new : Optional[List[T]]
+        The items to add, or None to clear the list.
+
+    Returns
+    -------
+    List[T]
+        A new List.
+    """
+
+    if new is None:
+        return list()
+    return current + new
 
 
 class InputState(TypedDict):
@@ -60,12 +84,14 @@ class OverallState(TypedDict):
     """The main state in text2cypher workflows."""
 
     question: str
-    tasks: Annotated[List[Task], add]
+    tasks: Annotated[List[Task], add_or_reset]
     next_action: str
-    cyphers: Annotated[List[CypherOutputState], add]
+    cyphers: Annotated[List[CypherOutputState], add_or_reset]
     summary: str
-    steps: Annotated[List[Any], add]
+    steps: Annotated[List[Any], add_or_reset]
     history: Annotated[List[HistoryRecord], update_history]
+    usage: Optional[BudgetReport]
+    deadline: Optional[float]
 
 
 class OutputState(TypedDict):
@@ -76,6 +102,7 @@ class OutputState(TypedDict):
     steps: List[Any]
     cyphers: List[CypherOutputState]
     history: Annotated[List[HistoryRecord], update_history]
+    usage: Optional[BudgetReport]
 
 
 class TaskState(TypedDict):
@@ -11,6 +11,8 @@ from neo4j_text2cypher.components.state import OverallState
 from neo4j_text2cypher.components.summarize.prompts import (
     create_summarization_prompt_template,
 )
+from neo4j_text2cypher.components.text2cypher.state import CypherOutputState
+from neo4j_text2cypher.utils.budget import get_request_budget
 
 generate_summary_prompt = create_summarization_prompt_template()
 
@@ -40,11 +42,39 @@ def format_conversation_history_for_summary(history: List[Dict[str, Any]]) -> st
     return formatted_history
 
 
+def format_results_without_summary(
+    cyphers: List[CypherOutputState], max_records: int = 3
+) -> str:
+    """
+    Describe the Cypher results of a question without an LLM, for requests that have exhausted their budget.
+
+    Parameters
+    ----------
+    cyphers : List[CypherOutputState]
+        The Cypher outputs of the question's tasks.
+    max_records : int, optional
+        The records shown per task, by default 3
+
+    Returns
+    -------
+    str
+        The answer.
+    """
+    lines = ["The request reached its LLM budget, so the results are listed without a summary."]
+    for cypher in cyphers:
+        records = cypher.get("records") or list()
+        lines.append(f"- {cypher.get('task', '')}: {len(records)} records")
+        lines.extend(f"  - {record}" for record in records[:max_records])
+    return "\n".join(lines)
+
+
 def create_summarization_node(
     llm: BaseChatModel,
 ) -> Callable[[OverallState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create a Summarization node for a LangGraph workflow.
+    Once the request budget is degraded, the summary is given fewer records per result,
+    and once it is exhausted, the results are listed without an LLM call.
 
     Parameters
     ----------
@@ -70,7 +100,17 @@ def create_summarization_node(
             if cypher.get("records") is not None
         ]
 
-        if results:
+        budget = get_request_budget()
+        if results and budget is not None and budget.exhausted:
+            budget.skip("llm_summary")
+            summary = format_results_without_summary(state.get("cyphers", list()))
+
+        elif results:
+            if budget is not None and budget.degraded:
+                if any(len(r) > budget.summary_max_records for r in results):
+                    budget.skip("summary_records")
+                results = [r[: budget.summary_max_records] for r in results]
+
             # Format conversation history for context
             history = state.get("history", [])
             conversation_history = format_conversation_history_for_summary(history)
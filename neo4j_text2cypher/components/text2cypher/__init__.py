@@ -1,13 +1,21 @@
 from .correction import create_text2cypher_correction_node
+from .cost_gate import create_text2cypher_cost_gate_node
 from .execution import create_text2cypher_execution_node
 from .generation import create_text2cypher_generation_node
+from .parameterization import create_text2cypher_parameterization_node
+from .rewrite import create_text2cypher_fulltext_rewrite_node
 from .schema import get_text2cypher_schema
 from .validation import create_text2cypher_validation_node
+from .verified_lookup import create_text2cypher_verified_lookup_node
 
 __all__ = [
     "create_text2cypher_correction_node",
+    "create_text2cypher_cost_gate_node",
     "create_text2cypher_execution_node",
+    "create_text2cypher_fulltext_rewrite_node",
     "create_text2cypher_generation_node",
+    "create_text2cypher_parameterization_node",
     "create_text2cypher_validation_node",
+    "create_text2cypher_verified_lookup_node",
     "get_text2cypher_schema",
 ]
@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CypherEdit(BaseModel):
+    """
+    A single find and replace edit to apply to a Cypher statement.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    find: str = Field(
+        description="An exact, unique substring of the current Cypher statement to replace."
+    )
+    replace: str = Field(description="The text to replace the substring with.")
+
+
+class CorrectCypherOutput(BaseModel):
+    """
+    The correction of a Cypher statement, expressed as edits to the current statement.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    edits: List[CypherEdit] = Field(
+        default=[],
+        description="Minimal find and replace edits that fix the errors in the Cypher statement.",
+    )
+    statement: Optional[str] = Field(
+        default=None,
+        description="A complete corrected Cypher statement. Only provide this if the errors can not be fixed with edits.",
+    )
@@ -2,25 +2,88 @@
 This code is based on content found in the LangGraph documentation: https://python.langchain.com/docs/tutorials/graph/#advanced-implementation-with-langgraph
 """
 
-from typing import Any, Callable, Coroutine, Dict
+import re
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables.base import Runnable
 from langchain_neo4j import Neo4jGraph
 
+from neo4j_text2cypher.components.text2cypher.correction.models import (
+    CorrectCypherOutput,
+    CypherEdit,
+)
 from neo4j_text2cypher.components.text2cypher.correction.prompts import (
     create_text2cypher_correction_prompt_template,
 )
-from neo4j_text2cypher.components.text2cypher.state import CypherState
+from neo4j_text2cypher.components.text2cypher.state import (
+    AttemptTokenUsage,
+    CypherState,
+)
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_utils import retrieve_schema_slice_for_prompts
+from neo4j_text2cypher.utils.token_usage import (
+    empty_token_usage,
+    get_token_usage_from_message,
+)
 
 correction_cypher_prompt = create_text2cypher_correction_prompt_template()
 
+_CODE_FENCE_PATTERN = re.compile(r"```(?:cypher)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+
+
+def apply_cypher_edits(cypher_statement: str, edits: List[CypherEdit]) -> Optional[str]:
+    """
+    Apply find and replace edits to a Cypher statement.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement to edit.
+    edits : List[CypherEdit]
+        The edits to apply in order.
+
+    Returns
+    -------
+    Optional[str]
+        The edited statement, or None if any edit could not be located in the statement.
+    """
+    for edit in edits:
+        if not edit.find or edit.find not in cypher_statement:
+            return None
+        cypher_statement = cypher_statement.replace(edit.find, edit.replace, 1)
+    return cypher_statement
+
+
+def get_cypher_from_raw_message(message: Optional[BaseMessage]) -> Optional[str]:
+    """
+    Get a Cypher statement from the text of a response whose structured output could not be parsed,
+    taking the first fenced code block if there is one. Returns None if the response has no text.
+    """
+    if message is None or not isinstance(message.content, str):
+        return None
+    fenced = _CODE_FENCE_PATTERN.search(message.content)
+    text = fenced.group(1) if fenced else message.content
+    return text.strip() or None
+
+
+def format_errors_for_prompt(errors: List[str]) -> str:
+    """Format a list of errors as one bullet per line."""
+    return "\n".join(f"- {error}" for error in errors)
+
 
 def create_text2cypher_correction_node(
-    llm: BaseChatModel, graph: Neo4jGraph
+    llm: BaseChatModel,
+    graph: Neo4jGraph,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> Callable[[CypherState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create a Text2Cypher query correction node for a LangGraph workflow.
+    Only the schema relevant to the statement and its errors is sent, and the LLM responds with
+    compact edits that are applied locally. The tokens used by each attempt are recorded in `token_usage`.
 
     Parameters
     ----------
@@ -28,6 +91,8 @@ def create_text2cypher_correction_node(
         The LLM to use for processing.
     graph : Neo4jGraph
         The Neo4j graph wrapper.
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema slice is rendered in the prompt, by default None
 
     Returns
     -------
@@ -35,26 +100,65 @@ def create_text2cypher_correction_node(
         The LangGraph node.
     """
 
-    correct_cypher_chain = correction_cypher_prompt | llm | StrOutputParser()
+    correct_cypher_chain: Runnable[Dict[str, Any], Any] = (
+        correction_cypher_prompt
+        | llm.with_structured_output(
+            CorrectCypherOutput, method="function_calling", include_raw=True
+        )
+    )
 
     async def correct_cypher(state: CypherState) -> Dict[str, Any]:
         """
         Correct the Cypher statement based on the provided errors.
         """
 
-        corrected_cypher = await correct_cypher_chain.ainvoke(
+        statement = state.get("statement", "")
+        errors = state.get("errors", list())
+
+        response: Dict[str, Any] = await correct_cypher_chain.ainvoke(
             {
                 "question": state.get("task"),
-                "errors": state.get("errors"),
-                "cypher": state.get("statement"),
-                "schema": graph.schema,
+                "errors": format_errors_for_prompt(errors),
+                "cypher": statement,
+                "schema": retrieve_schema_slice_for_prompts(
+                    graph, [statement, *errors], schema_prompt_config
+                ),
             }
         )
 
+        correction: Optional[CorrectCypherOutput] = response.get("parsed")
+        corrected_cypher = statement
+        if correction is None:
+            # without a parsed correction the next validation would see the same errors again
+            get_metrics().increment("correction.parsing_errors")
+            get_validation_logger().debug(
+                f"🔍 CORRECTION DEBUG - Parsing error: {response.get('parsing_error')}"
+            )
+            corrected_cypher = (
+                get_cypher_from_raw_message(response.get("raw")) or statement
+            )
+        else:
+            edited_cypher = apply_cypher_edits(statement, correction.edits)
+            if correction.edits and edited_cypher is not None:
+                corrected_cypher = edited_cypher
+            elif correction.statement:
+                corrected_cypher = correction.statement
+
+        token_usage = (
+            get_token_usage_from_message(response.get("raw")) or empty_token_usage()
+        )
+
         return {
             "next_action_cypher": "validate_cypher",
             "statement": corrected_cypher,
             "cypher_steps": ["correct_cypher"],
+            "token_usage": [
+                AttemptTokenUsage(
+                    **token_usage,
+                    node="correct_cypher",
+                    attempt=state.get("attempts", 0),
+                )
+            ],
         }
 
     return correct_cypher
@@ -8,6 +8,7 @@ from langchain.prompts import ChatPromptTemplate
 def create_text2cypher_correction_prompt_template() -> ChatPromptTemplate:
     """
     Create a Text2Cypher query correction prompt template.
+    The LLM responds with compact edits to the current statement rather than a full rewrite.
 
     Returns
     -------
@@ -20,34 +21,25 @@ def create_text2cypher_correction_prompt_template() -> ChatPromptTemplate:
                 "system",
                 (
                     "You are a Cypher expert reviewing a statement written by a junior developer. "
-                    "You need to correct the Cypher statement based on the provided errors. No pre-amble."
-                    "Do not wrap the response in any backticks or anything else. Respond with a Cypher statement only!"
+                    "You need to correct the Cypher statement based on the provided errors. "
+                    "Respond with the smallest find and replace edits that fix the errors. "
+                    "Each `find` must be an exact substring of the current statement. "
+                    "Only provide a complete statement if the errors can not be fixed with edits."
                 ),
             ),
             (
                 "human",
                 (
-                    """Check for invalid syntax or semantics and return a corrected Cypher statement.
+                    """Relevant schema:
+{schema}
 
-    Schema:
-    {schema}
+Question: {question}
 
-    Note: Do not include any explanations or apologies in your responses.
-    Do not wrap the response in any backticks or anything else.
-    Respond with a Cypher statement only!
+Cypher statement:
+{cypher}
 
-    Do not respond to any questions that might ask anything else than for you to construct a Cypher statement.
-
-    The question is:
-    {question}
-
-    The Cypher statement is:
-    {cypher}
-
-    The errors are:
-    {errors}
-
-    Corrected Cypher statement: """
+Errors:
+{errors}"""
                 ),
             ),
         ]
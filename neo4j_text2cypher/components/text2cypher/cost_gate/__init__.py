@@ -0,0 +1,3 @@
+from .node import create_text2cypher_cost_gate_node
+
+__all__ = ["create_text2cypher_cost_gate_node"]
@@ -0,0 +1,111 @@
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence
+
+from langchain_neo4j import Neo4jGraph
+from neo4j.exceptions import Neo4jError
+
+from neo4j_text2cypher.components.text2cypher.cost_gate.validators import (
+    explain_cypher_query,
+    validate_cypher_query_plan_cost,
+    validate_no_unbounded_var_length_patterns,
+)
+from neo4j_text2cypher.components.text2cypher.state import CypherState
+from neo4j_text2cypher.utils.budget import get_request_budget
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, run_db_call
+from neo4j_text2cypher.utils.config import CostGateConfig
+from neo4j_text2cypher.utils.cypher_utils import enforce_cypher_query_limit
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.scheduling import fits_before_deadline
+
+
+def create_text2cypher_cost_gate_node(
+    graph: Neo4jGraph,
+    config: CostGateConfig,
+    max_attempts: int = 3,
+    governor: Optional[ConcurrencyGovernor] = None,
+    execution_nodes: Sequence[str] = ("gate_cypher", "execute_cypher"),
+) -> Callable[[CypherState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a Text2Cypher pre-execution cost gate node for a LangGraph workflow.
+    The gate injects a LIMIT into statements that return rows without one, then reads the EXPLAIN plan.
+    Statements over the configured cost thresholds are sent back for correction, or the task ends if no attempts
+    or no budget for a correction remain, or a correction is not expected to finish before the deadline of the state.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    config : CostGateConfig
+        The cost thresholds and default LIMIT.
+    max_attempts: int, optional
+        The max number of allowed attempts to generate valid Cypher, by default 3
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    execution_nodes : Sequence[str], optional
+        The nodes a statement approved for execution runs through, including this one,
+        by default ("gate_cypher", "execute_cypher")
+
+    Returns
+    -------
+    Callable[[CypherState], CypherState]
+        The LangGraph node.
+    """
+
+    async def gate_cypher(state: CypherState) -> Dict[str, Any]:
+        """
+        Rejects expensive Cypher statements and enforces a LIMIT before execution.
+        """
+
+        logger = get_validation_logger()
+        metrics = get_metrics()
+
+        statement = state.get("statement", "")
+        if config.default_limit is not None:
+            statement = enforce_cypher_query_limit(statement, config.default_limit)
+            if statement != state.get("statement", ""):
+                metrics.increment("cost_gate.limit_injected")
+
+        errors: List[str] = []
+        if not config.allow_unbounded_var_length:
+            errors.extend(validate_no_unbounded_var_length_patterns(statement))
+
+        try:
+            plan = await run_db_call(governor, explain_cypher_query, graph, statement)
+            errors.extend(validate_cypher_query_plan_cost(plan, config))
+        except Neo4jError as e:
+            errors.append(f"Query plan could not be created: {e.message}")
+
+        logger.debug(f"🔍 COST GATE DEBUG - Statement: {statement}")
+        logger.debug(f"🔍 COST GATE DEBUG - Errors: {errors}")
+
+        budget = get_request_budget()
+        if not errors:
+            next_action = "execute_cypher"
+        elif (
+            state.get("attempts", 0) < max_attempts
+            and (budget is None or not budget.degraded)
+            and fits_before_deadline(
+                state.get("task_deadline"),
+                ["correct_cypher", "validate_cypher", *execution_nodes],
+            )
+        ):
+            metrics.increment("cost_gate.rejected")
+            next_action = "correct_cypher"
+        else:
+            if state.get("attempts", 0) < max_attempts:
+                # no budget or time is left for a correction
+                if budget is not None and budget.degraded:
+                    budget.skip("correction")
+                else:
+                    metrics.increment("deadlines.correction_skipped")
+            metrics.increment("cost_gate.rejected")
+            next_action = "__end__"
+
+        return {
+            "next_action_cypher": next_action,
+            "statement": statement,
+            "errors": errors or state.get("errors", list()),
+            "cypher_steps": ["gate_cypher"],
+        }
+
+    return gate_cypher
@@ -0,0 +1,117 @@
+"""
+This file contains plan-based Cypher cost checks that may be used in the Text2Cypher cost gate node.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_neo4j import Neo4jGraph
+from neo4j import Query
+
+from neo4j_text2cypher.utils.config import CostGateConfig
+from neo4j_text2cypher.utils.cypher_utils import find_unbounded_var_length_patterns
+
+
+def explain_cypher_query(
+    graph: Neo4jGraph, cypher_statement: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the EXPLAIN plan of a Cypher statement without executing it.
+    The plan is only available through the driver of a `Neo4jGraph`. Other graph wrappers, such as
+    the `RecordedNeo4jGraph` of the evaluation, have no plan, so the plan checks are skipped for them.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    cypher_statement : str
+        The Cypher statement to explain.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The root operator of the plan, with `operatorType`, `args` and `children` keys, if one was returned.
+    """
+    if not isinstance(graph, Neo4jGraph):
+        return None
+    # `Neo4jGraph.query` discards the result summary that holds the plan
+    _, summary, _ = graph._driver.execute_query(
+        Query(text=f"EXPLAIN {cypher_statement}", timeout=graph.timeout),
+        database_=graph._database,
+    )
+    plan: Optional[Dict[str, Any]] = summary.plan
+    return plan
+
+
+def iterate_plan_operators(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterate over every operator in a plan tree, depth first."""
+    yield plan
+    for child in plan.get("children", list()):
+        yield from iterate_plan_operators(child)
+
+
+def get_operator_name(operator: Dict[str, Any]) -> str:
+    """Get the operator name without the runtime suffix, for example `CartesianProduct@neo4j` -> `CartesianProduct`."""
+    return str(operator.get("operatorType", "")).split("@")[0]
+
+
+def validate_cypher_query_plan_cost(
+    plan: Optional[Dict[str, Any]], config: CostGateConfig
+) -> List[str]:
+    """
+    Check an EXPLAIN plan against the configured cost thresholds.
+
+    Parameters
+    ----------
+    plan : Optional[Dict[str, Any]]
+        The root operator of the plan.
+    config : CostGateConfig
+        The cost thresholds.
+
+    Returns
+    -------
+    List[str]
+        A list of found cost violations.
+    """
+    if plan is None:
+        return []
+
+    errors = []
+    disallowed = set(config.disallowed_operators)
+    max_rows = 0.0
+    for operator in iterate_plan_operators(plan):
+        name = get_operator_name(operator)
+        if name in disallowed:
+            errors.append(
+                f"The query plan contains a {name} operator. Connect the patterns or filter them before combining."
+            )
+            disallowed.discard(name)
+        max_rows = max(
+            max_rows, float(operator.get("args", dict()).get("EstimatedRows", 0.0))
+        )
+
+    if config.max_estimated_rows is not None and max_rows > config.max_estimated_rows:
+        errors.append(
+            f"The query plan estimates {int(max_rows)} rows, which exceeds the limit of {int(config.max_estimated_rows)}. "
+            "Add more selective filters or aggregate earlier."
+        )
+    return errors
+
+
+def validate_no_unbounded_var_length_patterns(cypher_statement: str) -> List[str]:
+    """
+    Check if the Cypher statement contains variable-length patterns without an upper bound.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement to check.
+
+    Returns
+    -------
+    List[str]
+        A list of found unbounded patterns.
+    """
+    return [
+        f"The relationship pattern {pattern} has no upper bound. Add a max length, for example *1..3."
+        for pattern in find_unbounded_var_length_patterns(cypher_statement)
+    ]
@@ -2,7 +2,8 @@
 This code is based on content found in the LangGraph documentation: https://python.langchain.com/docs/tutorials/graph/#advanced-implementation-with-langgraph
 """
 
-from typing import Any, Callable, Coroutine, Dict, List
+import asyncio
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 from langchain_neo4j import Neo4jGraph
 
@@ -11,10 +12,14 @@ from neo4j_text2cypher.components.text2cypher.state import (
     CypherState,
 )
 from neo4j_text2cypher.constants import NO_CYPHER_RESULTS
+from neo4j_text2cypher.retrievers import VerifiedQueryStore
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, query_graph
 
 
 def create_text2cypher_execution_node(
     graph: Neo4jGraph,
+    governor: Optional[ConcurrencyGovernor] = None,
+    verified_query_store: Optional[VerifiedQueryStore] = None,
 ) -> Callable[
     [CypherState], Coroutine[Any, Any, Dict[str, List[CypherOutputState] | List[str]]]
 ]:
@@ -25,6 +30,10 @@ def create_text2cypher_execution_node(
     ----------
     graph : Neo4jGraph
         The Neo4j graph wrapper.
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    verified_query_store : Optional[VerifiedQueryStore], optional
+        Where to save statements that executed without errors and returned records, by default None
 
     Returns
     -------
@@ -38,7 +47,24 @@ def create_text2cypher_execution_node(
         """
         Executes the given Cypher statement.
         """
-        records = graph.query(state.get("statement", ""))
+        records = await query_graph(
+            graph,
+            state.get("statement", ""),
+            params=state.get("parameters"),
+            governor=governor,
+        )
+        if (
+            verified_query_store is not None
+            and records
+            and not state.get("errors")
+            and not state.get("verified", False)
+        ):
+            await asyncio.to_thread(
+                verified_query_store.add,
+                state.get("task", ""),
+                state.get("statement", ""),
+                state.get("parameters"),
+            )
         steps = state.get("cypher_steps", list())
         steps.append("execute_cypher")
         return {
@@ -47,10 +73,11 @@ def create_text2cypher_execution_node(
                     **{
                         "task": state.get("task", ""),
                         "statement": state.get("statement", ""),
-                        "parameters": None,
+                        "parameters": state.get("parameters"),
                         "errors": state.get("errors", list()),
                         "records": records if records else NO_CYPHER_RESULTS,
                         "cypher_steps": steps,
+                        "token_usage": state.get("token_usage", list()),
                     }
                 )
             ],
@@ -2,26 +2,100 @@
 This code is based on content found in the LangGraph documentation: https://python.langchain.com/docs/tutorials/graph/#advanced-implementation-with-langgraph
 """
 
-from typing import Any, Callable, Coroutine, Dict
+import asyncio
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
 
+from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables.base import Runnable
+from langchain_core.runnables.config import (
+    RunnableConfig,
+    ensure_config,
+    merge_configs,
+)
 from langchain_neo4j import Neo4jGraph
 
 from neo4j_text2cypher.components.text2cypher.generation.prompts import (
     create_text2cypher_generation_prompt_template,
 )
-from neo4j_text2cypher.components.text2cypher.state import CypherInputState
+from neo4j_text2cypher.components.text2cypher.state import (
+    AttemptTokenUsage,
+    CypherInputState,
+)
+from neo4j_text2cypher.components.text2cypher.validation.validators import (
+    validate_cypher_query_syntax,
+    validate_no_writes_in_cypher_query,
+)
 from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, run_db_call
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_utils import (
+    retrieve_and_parse_schema_from_graph_for_prompts,
+)
+from neo4j_text2cypher.utils.token_usage import (
+    TokenUsage,
+    add_token_usage,
+    get_token_usage_from_llm_result,
+)
 
 generation_prompt = create_text2cypher_generation_prompt_template()
 
 
+class CandidateUsageCallbackHandler(AsyncCallbackHandler):
+    """
+    Collects the token usage of the LLM calls of one generation candidate.
+    The usage is kept when the candidate is cancelled after its LLM call completed.
+    """
+
+    def __init__(self) -> None:
+        self.token_usage: Optional[TokenUsage] = None
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        usage = get_token_usage_from_llm_result(response)
+        self.token_usage = (
+            usage
+            if self.token_usage is None
+            else add_token_usage(self.token_usage, usage)
+        )
+
+
 def create_text2cypher_generation_node(
     llm: BaseChatModel,
     graph: Neo4jGraph,
     cypher_example_retriever: ConfigCypherExampleRetriever,
+    num_candidates: int = 1,
+    governor: Optional[ConcurrencyGovernor] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> Callable[[CypherInputState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a Text2Cypher generation node for a LangGraph workflow.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The LLM to use for processing.
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    cypher_example_retriever: ConfigCypherExampleRetriever
+        The retriever used to collect Cypher examples for few shot prompting.
+    num_candidates : int, optional
+        The number of candidate statements to generate concurrently, by default 1
+        Each candidate is prompted with a different subset of the examples.
+        The first candidate to pass syntax and write checks is kept and the others are cancelled.
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the prompt, by default None
+
+    Returns
+    -------
+    Callable[[CypherInputState], CypherState]
+        The LangGraph node.
+    """
+
     text2cypher_chain = generation_prompt | llm | StrOutputParser()
 
     async def generate_cypher(state: CypherInputState) -> Dict[str, Any]:
@@ -29,17 +103,153 @@ def create_text2cypher_generation_node(
         Generates a cypher statement based on the provided schema and user input
         """
 
-        examples: str = cypher_example_retriever.get_examples()
+        if num_candidates > 1:
+            generated_cypher, candidate_usage = await generate_first_valid_cypher_candidate(
+                text2cypher_chain=text2cypher_chain,
+                question=state.get("task", ""),
+                graph=graph,
+                example_subsets=cypher_example_retriever.get_example_subsets(
+                    num_candidates
+                ),
+                governor=governor,
+                schema_prompt_config=schema_prompt_config,
+            )
+        else:
+            examples: str = cypher_example_retriever.get_examples()
+
+            usage_handler = CandidateUsageCallbackHandler()
+            generated_cypher = await text2cypher_chain.ainvoke(
+                {
+                    "question": state.get("task", ""),
+                    "fewshot_examples": examples,
+                    "schema": retrieve_and_parse_schema_from_graph_for_prompts(
+                        graph, schema_prompt_config
+                    ),
+                },
+                config=with_usage_handler(usage_handler),
+            )
+            candidate_usage = (
+                [usage_handler.token_usage] if usage_handler.token_usage else list()
+            )
+
+        steps = state.get("prev_steps", list()) + ["generate_cypher"]
+        return {
+            "statement": generated_cypher,
+            "cypher_steps": steps,
+            "token_usage": [
+                AttemptTokenUsage(**usage, node="generate_cypher", attempt=0)
+                for usage in candidate_usage
+            ],
+        }
+
+    return generate_cypher
+
+
+async def generate_first_valid_cypher_candidate(
+    text2cypher_chain: Runnable[Dict[str, Any], str],
+    question: str,
+    graph: Neo4jGraph,
+    example_subsets: List[str],
+    governor: Optional[ConcurrencyGovernor] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
+) -> Tuple[str, List[TokenUsage]]:
+    """
+    Generate one candidate Cypher statement per example subset concurrently and
+    return the first that passes deterministic validation.
+    Remaining candidates are cancelled once a valid statement is found.
+    If no candidate is valid, the first one to finish is returned for the validation and correction loop.
+    The token usage of every candidate whose LLM call completed is returned too, including cancelled candidates.
+
+    Parameters
+    ----------
+    text2cypher_chain : Runnable[Dict[str, Any], str]
+        The generation chain.
+    question : str
+        The task the Cypher statement must answer.
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    example_subsets : List[str]
+        The formatted few shot examples to use for each candidate.
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the prompt, by default None
+
+    Returns
+    -------
+    Tuple[str, List[TokenUsage]]
+        The selected Cypher statement, and the token usage of each candidate.
+    """
+
+    metrics = get_metrics()
+    schema = retrieve_and_parse_schema_from_graph_for_prompts(graph, schema_prompt_config)
 
-        generated_cypher = await text2cypher_chain.ainvoke(
+    async def generate_and_validate(
+        examples: str, usage_handler: CandidateUsageCallbackHandler
+    ) -> Tuple[str, List[str]]:
+        statement: str = await text2cypher_chain.ainvoke(
             {
-                "question": state.get("task", ""),
+                "question": question,
                 "fewshot_examples": examples,
-                "schema": graph.schema,
-            }
+                "schema": schema,
+            },
+            config=with_usage_handler(usage_handler),
         )
+        errors = validate_no_writes_in_cypher_query(statement)
+        if not errors:
+            errors = await run_db_call(
+                governor,
+                validate_cypher_query_syntax,
+                graph=graph,
+                cypher_statement=statement,
+            )
+        return statement, errors
 
-        steps = state.get("prev_steps", list()) + ["generate_cypher"]
-        return {"statement": generated_cypher, "cypher_steps": steps}
+    usage_handlers = [CandidateUsageCallbackHandler() for _ in example_subsets]
+    candidates = [
+        asyncio.ensure_future(generate_and_validate(examples, usage_handler))
+        for examples, usage_handler in zip(example_subsets, usage_handlers)
+    ]
+    metrics.increment("generation.candidates", len(candidates))
 
-    return generate_cypher
+    first_statement: Optional[str] = None
+    last_error: Optional[BaseException] = None
+    try:
+        for finished in asyncio.as_completed(candidates):
+            try:
+                statement, errors = await finished
+            except Exception as e:
+                last_error = e
+                continue
+            if first_statement is None:
+                first_statement = statement
+            if not errors:
+                metrics.increment("generation.valid_candidate_found")
+                return statement, get_candidate_token_usage(usage_handlers)
+    finally:
+        cancelled = [c for c in candidates if not c.done()]
+        for candidate in cancelled:
+            candidate.cancel()
+        metrics.increment("generation.candidates_cancelled", len(cancelled))
+
+    if first_statement is None:
+        raise last_error or RuntimeError("No Cypher candidates were generated.")
+
+    metrics.increment("generation.no_valid_candidate")
+    return first_statement, get_candidate_token_usage(usage_handlers)
+
+
+def with_usage_handler(usage_handler: CandidateUsageCallbackHandler) -> RunnableConfig:
+    """Add a usage handler to the callbacks of the current run, such as those of the node."""
+    return merge_configs(ensure_config(), {"callbacks": [usage_handler]})
+
+
+def get_candidate_token_usage(
+    usage_handlers: List[CandidateUsageCallbackHandler],
+) -> List[TokenUsage]:
+    """Get the token usage of each candidate whose LLM call completed, in candidate order."""
+    return [
+        handler.token_usage
+        for handler in usage_handlers
+        if handler.token_usage is not None
+    ]
@@ -8,6 +8,8 @@ from langchain_core.prompts import ChatPromptTemplate
 def create_text2cypher_generation_prompt_template() -> ChatPromptTemplate:
     """
     Create a Text2Cypher generation prompt template.
+    The instructions, schema and few shot examples come first and the question last,
+    so that prompts for the same schema and examples share a prefix that providers can cache.
 
     Returns
     -------
@@ -19,15 +21,7 @@ def create_text2cypher_generation_prompt_template() -> ChatPromptTemplate:
             (
                 "system",
                 (
-                    "Given an input question, convert it to a Cypher query. No pre-amble."
-                    "Do not wrap the response in any backticks or anything else. Respond with a Cypher statement only!"
-                    "Always include a LIMIT clause to prevent excessive results unless the question specifically asks for all results."
-                ),
-            ),
-            (
-                "human",
-                (
-                    """You are a Neo4j expert. Given an input question, create a syntactically correct Cypher query to run.
+                    """You are a Neo4j expert. Given an input question, create a syntactically correct Cypher query to run. No pre-amble.
 Do not wrap the response in any backticks or anything else. Begin with MATCH or WITH clauses only. Respond with a Cypher statement only!
 
 IMPORTANT: Always end your query with LIMIT 100 unless the question specifically asks for all results or a different number.
@@ -37,9 +31,13 @@ Here is the schema information
 
 Below are a number of examples of questions and their corresponding Cypher queries.
 
-{fewshot_examples}
-
-User input: {question}
+{fewshot_examples}"""
+                ),
+            ),
+            (
+                "human",
+                (
+                    """User input: {question}
 Cypher query:"""
                 ),
             ),
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Coroutine, Dict
+
+from neo4j_text2cypher.components.text2cypher.state import CypherState
+from neo4j_text2cypher.utils.config import ParameterizationConfig
+from neo4j_text2cypher.utils.cypher_utils import parameterize_cypher_literals
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+
+
+def create_text2cypher_parameterization_node(
+    config: ParameterizationConfig,
+) -> Callable[[CypherState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a Text2Cypher parameterization node for a LangGraph workflow.
+    Literals in the approved statement are replaced with parameters, so statements that differ only
+    in values such as a make or model share one cached Neo4j query plan.
+
+    Parameters
+    ----------
+    config : ParameterizationConfig
+        Which literals to replace.
+
+    Returns
+    -------
+    Callable[[CypherState], CypherState]
+        The LangGraph node.
+    """
+
+    async def parameterize_cypher(state: CypherState) -> Dict[str, Any]:
+        """
+        Lifts string and number literals of the Cypher statement into parameters.
+        """
+
+        logger = get_validation_logger()
+
+        statement, parameters = parameterize_cypher_literals(
+            state.get("statement", ""), lift_numbers=config.lift_numbers
+        )
+        parameters = {**(state.get("parameters") or dict()), **parameters}
+        get_metrics().increment("parameterization.parameters", len(parameters))
+
+        logger.debug(f"🔍 PARAMETERIZATION DEBUG - Statement: {statement}")
+        logger.debug(f"🔍 PARAMETERIZATION DEBUG - Parameters: {parameters}")
+
+        return {
+            "statement": statement,
+            "parameters": parameters,
+            "cypher_steps": ["parameterize_cypher"],
+        }
+
+    return parameterize_cypher
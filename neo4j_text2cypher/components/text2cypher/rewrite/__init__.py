@@ -0,0 +1,3 @@
+from .node import create_text2cypher_fulltext_rewrite_node
+
+__all__ = ["create_text2cypher_fulltext_rewrite_node"]
@@ -0,0 +1,62 @@
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.components.text2cypher.state import CypherState
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, run_db_call
+from neo4j_text2cypher.utils.config import FulltextRewriteConfig
+from neo4j_text2cypher.utils.cypher_utils import (
+    rewrite_cypher_text_predicates_to_fulltext,
+)
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_utils import get_fulltext_indexes
+
+
+def create_text2cypher_fulltext_rewrite_node(
+    graph: Neo4jGraph,
+    config: FulltextRewriteConfig,
+    governor: Optional[ConcurrencyGovernor] = None,
+) -> Callable[[CypherState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a Text2Cypher full-text rewrite node for a LangGraph workflow.
+    Equality and `STARTS WITH` filters on properties with a full-text index are narrowed with
+    `db.index.fulltext.queryNodes`, so matching nodes are found with the index instead of a label scan.
+    Only values of whole words are rewritten, so the index finds every node the filter matches,
+    and the original filters are kept, so the results are unchanged. `CONTAINS` filters are left as they are.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    config : FulltextRewriteConfig
+        How filter values are turned into full-text queries.
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+
+    Returns
+    -------
+    Callable[[CypherState], CypherState]
+        The LangGraph node.
+    """
+
+    async def rewrite_cypher(state: CypherState) -> Dict[str, Any]:
+        """
+        Rewrites string filters on full-text indexed properties to use the index.
+        """
+
+        logger = get_validation_logger()
+
+        fulltext_indexes = await run_db_call(governor, get_fulltext_indexes, graph)
+        statement = rewrite_cypher_text_predicates_to_fulltext(
+            state.get("statement", ""),
+            fulltext_indexes,
+            wildcard_terms=config.wildcard_terms,
+        )
+        if statement != state.get("statement", ""):
+            get_metrics().increment("fulltext_rewrite.rewritten")
+            logger.debug(f"🔍 FULLTEXT REWRITE DEBUG - Statement: {statement}")
+
+        return {"statement": statement, "cypher_steps": ["rewrite_cypher"]}
+
+    return rewrite_cypher
@@ -7,10 +7,20 @@ from typing import Annotated, Any, Dict, List, Optional
 
 from typing_extensions import TypedDict
 
+from neo4j_text2cypher.utils.token_usage import TokenUsage
+
+
+class AttemptTokenUsage(TokenUsage):
+    """The tokens used by a single LLM call of a Text2Cypher node."""
+
+    node: str
+    attempt: int
+
 
 class CypherInputState(TypedDict):
     task: str
     prev_steps: List[str]
+    task_deadline: Optional[float]
 
 
 class CypherState(TypedDict):
@@ -21,7 +31,10 @@ class CypherState(TypedDict):
     records: List[Dict[str, Any]]
     next_action_cypher: str
     attempts: int
+    verified: bool
     cypher_steps: Annotated[List[str], add]
+    token_usage: Annotated[List[AttemptTokenUsage], add]
+    task_deadline: Optional[float]
 
 
 class CypherOutputState(TypedDict):
@@ -31,3 +44,4 @@ class CypherOutputState(TypedDict):
     errors: List[str]
     records: List[Dict[str, Any]]
     cypher_steps: List[str]
+    token_usage: List[AttemptTokenUsage]
@@ -2,7 +2,7 @@
 This code is based on content found in the LangGraph documentation: https://python.langchain.com/docs/tutorials/graph/#advanced-implementation-with-langgraph
 """
 
-from typing import Any, Callable, Coroutine, Dict
+from typing import Any, Callable, Coroutine, Dict, Optional, Sequence
 
 from langchain_core.language_models import BaseChatModel
 from langchain_neo4j import Neo4jGraph
@@ -16,13 +16,18 @@ from neo4j_text2cypher.components.text2cypher.validation.prompts import (
 )
 from neo4j_text2cypher.components.text2cypher.validation.validators import (
     correct_cypher_query_relationship_direction,
+    map_cypher_query_filter_values,
     validate_cypher_query_syntax,
     validate_cypher_query_with_llm,
     validate_no_writes_in_cypher_query,
 )
+from neo4j_text2cypher.retrievers import PropertyValueIndex
+from neo4j_text2cypher.utils.budget import get_request_budget
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, run_db_call
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
 from neo4j_text2cypher.utils.debug import get_validation_logger
-
-validation_prompt_template = create_text2cypher_validation_prompt_template()
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.scheduling import fits_before_deadline
 
 
 def create_text2cypher_validation_node(
@@ -30,11 +35,19 @@ def create_text2cypher_validation_node(
     llm: BaseChatModel,
     max_attempts: int = 3,
     attempt_cypher_execution_on_final_attempt: bool = False,
+    governor: Optional[ConcurrencyGovernor] = None,
+    property_value_index: Optional[PropertyValueIndex] = None,
+    execution_nodes: Sequence[str] = ("execute_cypher",),
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> Callable[[CypherState], Coroutine[Any, Any, dict[str, Any]]]:
     """
     Create a Text2Cypher query validation node for a LangGraph workflow.
     This is the last node in the workflow before Cypher execution may be attempted.
     If errors are detected and max attempts have not been reached, then the Cypher Statement must be corrected by the Correction node.
+    Statements from the verified query store skip the LLM validator unless a deterministic check fails.
+    Once the request budget is degraded, the LLM validator is skipped and the current attempt is the final one.
+    If the state has a deadline, a correction round is only started if it is expected to finish before the deadline,
+    judged by the observed latency of the nodes it runs, and a statement that would not finish executing in time is not executed.
 
     Parameters
     ----------
@@ -47,6 +60,14 @@ def create_text2cypher_validation_node(
     attempt_cypher_execution_on_final_attempt, bool, optional
         THIS MAY BE DANGEROUS.
         Whether to attempt Cypher execution on the last attempt, regardless of if the Cypher contains errors, by default False
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    property_value_index : Optional[PropertyValueIndex], optional
+        The index used to rewrite filter values to the values stored in the database, by default None
+    execution_nodes : Sequence[str], optional
+        The nodes a statement approved for execution runs through, by default ("execute_cypher",)
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the LLM validation prompt, by default None
 
     Returns
     -------
@@ -54,6 +75,9 @@ def create_text2cypher_validation_node(
         The LangGraph node.
     """
 
+    validation_prompt_template = create_text2cypher_validation_prompt_template(
+        schema_prompt_config.format if schema_prompt_config is not None else "langchain"
+    )
     validate_cypher_chain = validation_prompt_template | llm.with_structured_output(
         ValidateCypherOutput, method="function_calling"
     )
@@ -79,8 +103,11 @@ def create_text2cypher_validation_node(
         logger.debug(f"🔍 VALIDATION DEBUG - Max attempts: {max_attempts}")
 
         # Check for syntax errors
-        syntax_error = validate_cypher_query_syntax(
-            graph=graph, cypher_statement=state.get("statement", "")
+        syntax_error = await run_db_call(
+            governor,
+            validate_cypher_query_syntax,
+            graph=graph,
+            cypher_statement=state.get("statement", ""),
         )
 
         errors.extend(syntax_error)
@@ -95,17 +122,59 @@ def create_text2cypher_validation_node(
         )
 
         # Use LLM to find additional potential errors and get the mapping for values
-        llm_errors = await validate_cypher_query_with_llm(
-            validate_cypher_chain=validate_cypher_chain,
-            question=state.get("task", ""),
-            graph=graph,
-            cypher_statement=state.get("statement", ""),
-        )
-        errors.extend(llm_errors.get("errors", []))
-        mapping_errors.extend(llm_errors.get("mapping_errors", []))
+        # verified statements have already passed this check for the same task shape
+        verified = state.get("verified", False) and not errors
+        budget = get_request_budget()
+        if not verified and budget is not None and budget.degraded:
+            logger.debug("🔍 VALIDATION DEBUG - Budget degraded, skipping LLM validation")
+            budget.skip("llm_validation")
+        elif not verified:
+            llm_errors = await validate_cypher_query_with_llm(
+                validate_cypher_chain=validate_cypher_chain,
+                question=state.get("task", ""),
+                graph=graph,
+                cypher_statement=state.get("statement", ""),
+                governor=governor,
+                schema_prompt_config=schema_prompt_config,
+            )
+            errors.extend(llm_errors.get("errors", []))
+            mapping_errors.extend(llm_errors.get("mapping_errors", []))
+
+            # Map filter values to stored values locally, without another correction round
+            if property_value_index is not None:
+                corrected_cypher = map_cypher_query_filter_values(
+                    cypher_statement=corrected_cypher,
+                    filters=llm_errors.get("filters", []),
+                    property_value_index=property_value_index,
+                )
 
         # determine next node in workflow
-        if (errors or mapping_errors) and GENERATION_ATTEMPT < max_attempts:
+        deadline = state.get("task_deadline")
+        if (
+            (errors or mapping_errors)
+            and GENERATION_ATTEMPT < max_attempts
+            and budget is not None
+            and budget.degraded
+        ):
+            # no budget is left for a correction, so this is the final attempt
+            budget.skip("correction")
+            next_action = (
+                "execute_cypher" if attempt_cypher_execution_on_final_attempt else "__end__"
+            )
+        elif (
+            (errors or mapping_errors)
+            and GENERATION_ATTEMPT < max_attempts
+            and not fits_before_deadline(
+                deadline, ["correct_cypher", "validate_cypher", *execution_nodes]
+            )
+        ):
+            # a correction round would not finish in time, so this is the final attempt
+            logger.debug("🔍 VALIDATION DEBUG - No time left for a correction")
+            get_metrics().increment("deadlines.correction_skipped")
+            next_action = (
+                "execute_cypher" if attempt_cypher_execution_on_final_attempt else "__end__"
+            )
+        elif (errors or mapping_errors) and GENERATION_ATTEMPT < max_attempts:
             next_action = "correct_cypher"
         elif GENERATION_ATTEMPT < max_attempts:
             next_action = "execute_cypher"
@@ -117,11 +186,20 @@ def create_text2cypher_validation_node(
         else:
             next_action = "__end__"
 
+        if next_action == "execute_cypher" and not fits_before_deadline(
+            deadline, execution_nodes
+        ):
+            # end the task so the other results can be summarized before the deadline
+            logger.debug("🔍 VALIDATION DEBUG - No time left to execute the statement")
+            get_metrics().increment("deadlines.execution_skipped")
+            next_action = "__end__"
+
         return {
             "next_action_cypher": next_action,
             "statement": corrected_cypher,
             "errors": errors,
             "attempts": GENERATION_ATTEMPT,
+            "verified": verified,
             "cypher_steps": ["validate_cypher"],
         }
 
@@ -4,10 +4,38 @@ This code is based on content found in the LangGraph documentation: https://pyth
 
 from langchain_core.prompts import ChatPromptTemplate
 
+# how to read each schema format of the `schema_prompt` config, with the braces of the template escaped
+SCHEMA_READING_INSTRUCTIONS = {
+    "langchain": """CRITICAL INSTRUCTIONS FOR READING THE SCHEMA:
+- When you see a node label like "**Problem**" followed by properties like "`id`: STRING", this means the Problem label HAS the property 'id'
+- When you see a node label like "**Verbatim**" followed by properties like "`make`: STRING" and "`model`: STRING", this means the Verbatim label HAS both 'make' and 'model' properties
+- DO NOT claim a property doesn't exist if it's clearly listed under the node label in the schema
+- Read the schema carefully and thoroughly before making any error claims
+- If a property is listed in the schema under a node label, it EXISTS
+""",
+    "compact": """CRITICAL INSTRUCTIONS FOR READING THE SCHEMA:
+- When you see a node like "(:Problem {{id: STRING}})", this means the Problem label HAS the property 'id'
+- When you see a node like "(:Verbatim {{make: STRING, model: STRING}})", this means the Verbatim label HAS both 'make' and 'model' properties
+- When you see a relationship like "(:Verbatim)-[:HAS_PROBLEM]->(:Problem)", this means HAS_PROBLEM relationships go from Verbatim to Problem nodes
+- DO NOT claim a property doesn't exist if it's clearly listed under the node label in the schema
+- Read the schema carefully and thoroughly before making any error claims
+- If a property is listed in the schema under a node label, it EXISTS
+""",
+}
 
-def create_text2cypher_validation_prompt_template() -> ChatPromptTemplate:
+
+def create_text2cypher_validation_prompt_template(
+    schema_format: str = "langchain",
+) -> ChatPromptTemplate:
     """
     Create a Text2Cypher validation prompt template.
+    The instructions and schema come first and the question and statement last,
+    so that prompts for the same schema share a prefix that providers can cache.
+
+    Parameters
+    ----------
+    schema_format : str, optional
+        The `format` of the `schema_prompt` config the schema is rendered in, by default "langchain"
 
     Returns
     -------
@@ -15,38 +43,34 @@ def create_text2cypher_validation_prompt_template() -> ChatPromptTemplate:
         The prompt template.
     """
 
-    validate_cypher_system = """
-    You are a Cypher expert reviewing a statement written by a junior developer.
-    """
-
-    validate_cypher_user = """You must check the following:
-    * Are there any syntax errors in the Cypher statement?
-    * Are there any missing or undefined variables in the Cypher statement?
-    * Does the Cypher statement include enough information to answer the question?
-    * Ensure that all nodes, relationships and properties are present in the provided schema.
+    validate_cypher_system = (
+        """You are a Cypher expert reviewing a statement written by a junior developer.
 
-    CRITICAL INSTRUCTIONS FOR READING THE SCHEMA:
-    - When you see a node label like "**Problem**" followed by properties like "`id`: STRING", this means the Problem label HAS the property 'id'
-    - When you see a node label like "**Verbatim**" followed by properties like "`make`: STRING" and "`model`: STRING", this means the Verbatim label HAS both 'make' and 'model' properties
-    - DO NOT claim a property doesn't exist if it's clearly listed under the node label in the schema
-    - Read the schema carefully and thoroughly before making any error claims
-    - If a property is listed in the schema under a node label, it EXISTS
+You must check the following:
+* Are there any syntax errors in the Cypher statement?
+* Are there any missing or undefined variables in the Cypher statement?
+* Does the Cypher statement include enough information to answer the question?
+* Ensure that all nodes, relationships and properties are present in the provided schema.
 
-    Examples of good errors:
-    * Label (:Foo) does not exist, did you mean (:Bar)?
-    * Property bar does not exist for label Foo, did you mean baz?
-    * Relationship FOO does not exist, did you mean FOO_BAR?
+"""
+        + SCHEMA_READING_INSTRUCTIONS[schema_format]
+        + """
+Examples of good errors:
+* Label (:Foo) does not exist, did you mean (:Bar)?
+* Property bar does not exist for label Foo, did you mean baz?
+* Relationship FOO does not exist, did you mean FOO_BAR?
 
-    Schema:
-    {schema}
+DOUBLE-CHECK: Before reporting any property errors, verify that the property is NOT listed in the schema under the correct node label. Only report errors for properties that are truly missing from the schema.
 
-    The question is:
-    {question}
+Schema:
+{schema}"""
+    )
 
-    The Cypher statement is:
-    {cypher}
+    validate_cypher_user = """The question is:
+{question}
 
-    DOUBLE-CHECK: Before reporting any property errors, verify that the property is NOT listed in the schema under the correct node label. Only report errors for properties that are truly missing from the schema."""
+The Cypher statement is:
+{cypher}"""
 
     return ChatPromptTemplate.from_messages(
         [
@@ -2,7 +2,7 @@
 This file contains Cypher validators that may be used in the Text2Cypher validation node.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from langchain_core.runnables.base import Runnable
 from langchain_neo4j import Neo4jGraph
@@ -10,10 +10,16 @@ from langchain_neo4j.chains.graph_qa.cypher_utils import CypherQueryCorrector, S
 from neo4j.exceptions import CypherSyntaxError
 
 from neo4j_text2cypher.components.text2cypher.validation.models import (
+    Property,
     ValidateCypherOutput,
 )
 from neo4j_text2cypher.constants import WRITE_CLAUSES
+from neo4j_text2cypher.retrievers import PropertyValueIndex
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor, query_graph
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
+from neo4j_text2cypher.utils.cypher_utils import replace_cypher_property_value
 from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
 from neo4j_text2cypher.utils.schema_utils import (
     retrieve_and_parse_schema_from_graph_for_prompts,
 )
@@ -78,7 +84,9 @@ async def validate_cypher_query_with_llm(
     question: str,
     graph: Neo4jGraph,
     cypher_statement: str,
-) -> Dict[str, List[str]]:
+    governor: Optional[ConcurrencyGovernor] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
+) -> Dict[str, Any]:
     """
     Validate the Cypher statement with an LLM.
     Use declared LLM to find Node and Property pairs to validate.
@@ -94,11 +102,16 @@ async def validate_cypher_query_with_llm(
         The Neo4j graph wrapper.
     cypher_statement : str
         The Cypher statement to validate.
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor limiting concurrent Neo4j queries, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the prompt, by default None
 
     Returns
     -------
-    Dict[str, List[str]]
-        A Python dictionary with keys `errors` and `mapping_errors`, each with a list of found errors.
+    Dict[str, Any]
+        A Python dictionary with keys `errors` and `mapping_errors`, each with a list of found errors,
+        and `filters` with the property filters the LLM found in the statement.
     """
 
     errors: List[str] = []
@@ -108,7 +121,9 @@ async def validate_cypher_query_with_llm(
     logger.debug(f"🔍 LLM VALIDATION DEBUG - Question: {question}")
     logger.debug(f"🔍 LLM VALIDATION DEBUG - Cypher: {cypher_statement}")
 
-    schema_for_validation = retrieve_and_parse_schema_from_graph_for_prompts(graph)
+    schema_for_validation = retrieve_and_parse_schema_from_graph_for_prompts(
+        graph, schema_prompt_config
+    )
     logger.debug("🔍 LLM VALIDATION DEBUG - Schema being used for validation:")
     logger.debug(
         f"🔍 LLM VALIDATION DEBUG - Schema length: {len(schema_for_validation)} characters"
@@ -132,7 +147,7 @@ async def validate_cypher_query_with_llm(
     # This catches real syntax/schema issues without false negatives for valid queries
     try:
         logger.debug("🔍 LLM VALIDATION DEBUG - Testing query validity with EXPLAIN")
-        graph.query(f"EXPLAIN {cypher_statement}")
+        await query_graph(graph, f"EXPLAIN {cypher_statement}", governor=governor)
         logger.debug("🔍 LLM VALIDATION DEBUG - Query is valid - no mapping errors")
     except Exception as e:
         mapping_error = f"Query validation failed: {str(e)}"
@@ -144,7 +159,54 @@ async def validate_cypher_query_with_llm(
     logger.debug(
         f"🔍 LLM VALIDATION DEBUG - Final result - errors: {errors}, mapping_errors: {mapping_errors}"
     )
-    return {"errors": errors, "mapping_errors": mapping_errors}
+    return {
+        "errors": errors,
+        "mapping_errors": mapping_errors,
+        "filters": llm_output.filters or list(),
+    }
+
+
+def map_cypher_query_filter_values(
+    cypher_statement: str,
+    filters: List[Property],
+    property_value_index: PropertyValueIndex,
+) -> str:
+    """
+    Rewrite filter values in the Cypher statement to the values stored in the database.
+    For example `{make: "honda"}` becomes `{make: "Honda"}` and `model = "CRV"` becomes `model = "CR-V"`.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    filters : List[Property]
+        The property filters found in the statement by the LLM validator.
+    property_value_index : PropertyValueIndex
+        The index of stored property values.
+
+    Returns
+    -------
+    str
+        The Cypher statement with mapped filter values.
+    """
+    logger = get_validation_logger()
+    for prop in filters:
+        mapped_value = property_value_index.match(
+            prop.node_label, prop.property_key, prop.property_value
+        )
+        if mapped_value is None or mapped_value == prop.property_value:
+            continue
+        mapped_cypher = replace_cypher_property_value(
+            cypher_statement, prop.property_key, prop.property_value, mapped_value
+        )
+        if mapped_cypher != cypher_statement:
+            logger.debug(
+                f"🔍 VALUE MAPPING DEBUG - {prop.node_label}.{prop.property_key}: "
+                f"{prop.property_value!r} -> {mapped_value!r}"
+            )
+            get_metrics().increment("value_index.values_mapped")
+            cypher_statement = mapped_cypher
+    return cypher_statement
 
 
 def validate_no_writes_in_cypher_query(cypher_statement: str) -> List[str]:
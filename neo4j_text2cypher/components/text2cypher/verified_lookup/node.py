@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+from neo4j_text2cypher.components.text2cypher.state import CypherInputState
+from neo4j_text2cypher.retrievers import PropertyValueIndex, VerifiedQueryStore
+from neo4j_text2cypher.utils.cypher_utils import (
+    find_cypher_parameter_properties,
+    inline_cypher_parameters,
+)
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+
+
+def create_text2cypher_verified_lookup_node(
+    verified_query_store: VerifiedQueryStore,
+    property_value_index: Optional[PropertyValueIndex] = None,
+) -> Callable[[CypherInputState], Coroutine[Any, Any, dict[str, Any]]]:
+    """
+    Create a Text2Cypher verified query lookup node for a LangGraph workflow.
+    If the task matches a verified task apart from its values, the verified statement is filled with the
+    values of the task and generation is skipped. The statement is still checked by the deterministic validators.
+    It also goes through the LLM validator unless every new text value is stored in the database for the property
+    it is compared with, in which case the values are replaced with their stored spelling. Otherwise the values are
+    inlined into the statement, so that the LLM validator sees them and the value index can map them.
+
+    Parameters
+    ----------
+    verified_query_store : VerifiedQueryStore
+        The store of verified task and Cypher statement pairs.
+    property_value_index : Optional[PropertyValueIndex], optional
+        The index that recognizes new text values, by default None
+        If None, statements with new text values always go through the LLM validator.
+
+    Returns
+    -------
+    Callable[[CypherInputState], CypherState]
+        The LangGraph node.
+    """
+
+    async def lookup_verified_cypher(state: CypherInputState) -> Dict[str, Any]:
+        """
+        Fills a verified Cypher statement for the task, if one matches.
+        """
+
+        logger = get_validation_logger()
+
+        verified = await asyncio.to_thread(
+            verified_query_store.lookup, state.get("task", "")
+        )
+        if verified is None:
+            return {"verified": False}
+
+        statement, parameters, new_values = verified
+        properties = find_cypher_parameter_properties(statement)
+        stored_values = {
+            name: property_value_index.match(*properties[name], value)
+            for name, value in new_values.items()
+            if property_value_index is not None
+            and name in properties
+            and property_value_index.contains(*properties[name], value)
+        }
+        recognized = len(stored_values) == len(new_values)
+        statement_parameters: Optional[Dict[str, Any]] = parameters
+        if recognized:
+            # a recognized value may differ from its stored spelling in case and punctuation, as "CRV" and "CR-V"
+            parameters.update(
+                {name: value for name, value in stored_values.items() if value is not None}
+            )
+        else:
+            get_metrics().increment("verified_queries.unrecognized_values")
+            statement = inline_cypher_parameters(statement, parameters)
+            statement_parameters = None
+        logger.debug(f"🔍 VERIFIED LOOKUP DEBUG - Statement: {statement}")
+        logger.debug(f"🔍 VERIFIED LOOKUP DEBUG - Parameters: {statement_parameters}")
+        logger.debug(f"🔍 VERIFIED LOOKUP DEBUG - New values recognized: {recognized}")
+
+        steps = state.get("prev_steps", list()) + ["lookup_verified_cypher"]
+        return {
+            "statement": statement,
+            "parameters": statement_parameters,
+            "verified": recognized,
+            "cypher_steps": steps,
+        }
+
+    return lookup_verified_cypher
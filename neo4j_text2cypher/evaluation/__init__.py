@@ -0,0 +1,27 @@
+"""This module contains the offline evaluation harness and record-and-replay cassettes."""
+
+from .cassette import Cassette, CassetteLLMCache, with_cassette
+from .harness import (
+    ExampleEvaluation,
+    HoldoutExampleRetriever,
+    RunStatsCallbackHandler,
+    compare_result_sets,
+    evaluate_example,
+    evaluate_examples,
+    summarize_evaluation,
+)
+from .recorded_graph import RecordedNeo4jGraph
+
+__all__ = [
+    "Cassette",
+    "CassetteLLMCache",
+    "ExampleEvaluation",
+    "HoldoutExampleRetriever",
+    "RecordedNeo4jGraph",
+    "RunStatsCallbackHandler",
+    "compare_result_sets",
+    "evaluate_example",
+    "evaluate_examples",
+    "summarize_evaluation",
+    "with_cassette",
+]
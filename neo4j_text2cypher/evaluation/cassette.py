@@ -0,0 +1,255 @@
+"""Record-and-replay cassettes of LLM calls and Neo4j queries."""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import messages_from_dict, messages_to_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from neo4j_text2cypher.exceptions import RecordingNotFoundError
+from neo4j_text2cypher.utils.metrics import get_metrics
+
+ReplayLatency = Literal["original", "none"]
+
+
+def get_interaction_key(*parts: Any) -> str:
+    """Get the key an interaction with the given inputs is recorded under."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    Interactions recorded to a JSON file with their inputs, outputs and durations, grouped in sections
+    such as `llm` and `query`.
+
+    In record mode, interactions that were not recorded are performed by the caller and added with `put`.
+    In replay mode, looking up an unrecorded interaction raises `RecordingNotFoundError`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        record: bool = False,
+        latency: ReplayLatency = "none",
+    ):
+        """
+        Load the cassette.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The cassette file. It does not need to exist when recording.
+        record : bool, optional
+            Whether to record interactions that are missing, by default False
+        latency : ReplayLatency, optional
+            Whether replayed interactions take their `original` duration or `none`, by default "none"
+
+        Raises
+        ------
+        RecordingNotFoundError
+            If the file does not exist and the cassette is not recording.
+        """
+        self.path = Path(path)
+        self.record = record
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._changed = False
+
+        data: Dict[str, Any] = dict()
+        if self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+        elif not record:
+            raise RecordingNotFoundError(
+                f"No cassette at {self.path}. Record one first."
+            )
+        self.metadata: Dict[str, Any] = data.get("metadata", dict())
+        self._sections: Dict[str, Dict[str, Dict[str, Any]]] = data.get(
+            "sections", dict()
+        )
+
+    def get(self, section: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a recorded interaction.
+
+        Raises
+        ------
+        RecordingNotFoundError
+            If the interaction was not recorded and the cassette is not recording.
+        """
+        with self._lock:
+            interaction = self._sections.get(section, dict()).get(key)
+        metrics = get_metrics()
+        if interaction is not None:
+            metrics.increment(f"cassette.{section}.hits")
+        elif not self.record:
+            metrics.increment(f"cassette.{section}.misses")
+            raise RecordingNotFoundError(
+                f"No recorded {section} interaction {key[:12]} in {self.path}"
+            )
+        return interaction
+
+    def put(self, section: str, key: str, interaction: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record an interaction.
+
+        The interaction is round tripped through JSON, so values without a JSON type become strings,
+        as they will be when replayed. Returns the recorded interaction.
+        """
+        interaction = json.loads(json.dumps(interaction, default=str))
+        with self._lock:
+            self._sections.setdefault(section, dict())[key] = interaction
+            self._changed = True
+        get_metrics().increment(f"cassette.{section}.recorded")
+        return interaction
+
+    def set_metadata(self, name: str, value: Any) -> None:
+        """Record a value that is not an interaction, such as the graph schema."""
+        with self._lock:
+            self.metadata[name] = json.loads(json.dumps(value, default=str))
+            self._changed = True
+
+    def replay_seconds(self, interaction: Dict[str, Any]) -> float:
+        """The time a replayed interaction should take."""
+        if self.latency == "original":
+            return float(interaction.get("seconds", 0.0))
+        return 0.0
+
+    def count(self, section: str) -> int:
+        """The number of interactions recorded in a section."""
+        with self._lock:
+            return len(self._sections.get(section, dict()))
+
+    def save(self) -> None:
+        """Atomically save the cassette if anything new was recorded."""
+        with self._lock:
+            if not self._changed:
+                return
+            data = {
+                "metadata": dict(self.metadata),
+                "sections": {
+                    section: dict(interactions)
+                    for section, interactions in self._sections.items()
+                },
+            }
+            self._changed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class CassetteLLMCache(BaseCache):
+    """
+    A LangChain LLM cache backed by a cassette.
+
+    Chat models check their cache before every call with the serialized messages and a string of the model settings,
+    including bound tools and structured output formats. Serving those lookups from a cassette replays every LLM call
+    of every chain, while prompt formatting and output parsing still run.
+    In record mode, a miss lets the call through, and the response and its duration are recorded when it is cached.
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self._lock = threading.Lock()
+        self._started: Dict[str, List[float]] = defaultdict(list)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        interaction = self._lookup(prompt, llm_string)
+        if interaction is None:
+            return None
+        time.sleep(self.cassette.replay_seconds(interaction))
+        return self._to_generations(interaction)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        interaction = self._lookup(prompt, llm_string)
+        if interaction is None:
+            return None
+        await asyncio.sleep(self.cassette.replay_seconds(interaction))
+        return self._to_generations(interaction)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = get_interaction_key(prompt, llm_string)
+        with self._lock:
+            started = self._started[key].pop(0) if self._started[key] else None
+        self.cassette.put(
+            "llm",
+            key,
+            {
+                "llm": llm_string,
+                "messages": json.loads(prompt),
+                "generations": [self._from_generation(g) for g in return_val],
+                "seconds": time.perf_counter() - started if started is not None else 0.0,
+            },
+        )
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        self.update(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Recorded interactions are only removed by deleting the cassette."""
+
+    def _lookup(self, prompt: str, llm_string: str) -> Optional[Dict[str, Any]]:
+        key = get_interaction_key(prompt, llm_string)
+        interaction = self.cassette.get("llm", key)
+        if interaction is None:
+            with self._lock:
+                self._started[key].append(time.perf_counter())
+        return interaction
+
+    @staticmethod
+    def _from_generation(generation: Generation) -> Dict[str, Any]:
+        if isinstance(generation, ChatGeneration):
+            return {
+                "message": messages_to_dict([generation.message])[0],
+                "generation_info": generation.generation_info,
+            }
+        return {"text": generation.text, "generation_info": generation.generation_info}
+
+    @staticmethod
+    def _to_generations(interaction: Dict[str, Any]) -> Sequence[Generation]:
+        return [
+            ChatGeneration(
+                message=messages_from_dict([g["message"]])[0],
+                generation_info=g.get("generation_info"),
+            )
+            if "message" in g
+            else Generation(text=g["text"], generation_info=g.get("generation_info"))
+            for g in interaction["generations"]
+        ]
+
+
+def with_cassette(llm: BaseChatModel, cassette: Cassette) -> BaseChatModel:
+    """
+    Get a copy of a chat model whose calls are recorded to or replayed from a cassette.
+
+    The model settings are part of the recording key, so replay with the settings that were recorded.
+    Replayed responses are not streamed token by token.
+
+    Parameters
+    ----------
+    llm : BaseChatModel
+        The chat model. It is only called for interactions that are being recorded.
+    cassette : Cassette
+        The cassette.
+
+    Returns
+    -------
+    BaseChatModel
+        The chat model.
+    """
+    return llm.model_copy(update={"cache": CassetteLLMCache(cassette)})
@@ -0,0 +1,303 @@
+"""Offline accuracy and latency evaluation of the text2cypher subgraph over known question and Cypher pairs."""
+
+import asyncio
+import json
+import statistics
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from langgraph.graph.state import CompiledStateGraph
+from pydantic import BaseModel, Field
+
+from neo4j_text2cypher.constants import NO_CYPHER_RESULTS
+from neo4j_text2cypher.exceptions import RecordingNotFoundError
+from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
+from neo4j_text2cypher.utils.config import ExampleQuery
+from neo4j_text2cypher.utils.cypher_utils import strip_cypher_statement
+from neo4j_text2cypher.utils.token_usage import (
+    TokenUsage,
+    add_token_usage,
+    empty_token_usage,
+    get_cached_token_ratio,
+    get_token_usage_from_llm_result,
+)
+
+_held_out_question: ContextVar[Optional[str]] = ContextVar(
+    "held_out_question", default=None
+)
+
+
+class HoldoutExampleRetriever(ConfigCypherExampleRetriever):
+    """
+    An example retriever that leaves out the example being evaluated.
+
+    The held out question is tracked per asyncio task, so examples may be evaluated concurrently.
+    """
+
+    @contextmanager
+    def holdout(self, question: str) -> Iterator[None]:
+        """Leave out the example with `question` within this context."""
+        token = _held_out_question.set(question)
+        try:
+            yield
+        finally:
+            _held_out_question.reset(token)
+
+    def _get_example_queries(self) -> List[ExampleQuery]:
+        held_out = _held_out_question.get()
+        return [
+            example
+            for example in super()._get_example_queries()
+            if example.question != held_out
+        ]
+
+
+class RunStatsCallbackHandler(AsyncCallbackHandler):
+    """Collects the latency of each LangGraph node and the token usage of each LLM call of a run."""
+
+    def __init__(self) -> None:
+        self.node_seconds: Dict[str, float] = defaultdict(float)
+        self.token_usage: TokenUsage = empty_token_usage()
+        self._started: Dict[UUID, Tuple[str, float]] = dict()
+
+    async def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or dict()).get("langgraph_node")
+        # runnables inside a node share its metadata, so only the node run itself is timed
+        if node is not None and kwargs.get("name") == node:
+            self._started[run_id] = (node, time.perf_counter())
+
+    async def on_chain_end(
+        self, outputs: Dict[str, Any], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._stop(run_id)
+
+    async def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._stop(run_id)
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.token_usage = add_token_usage(
+            self.token_usage, get_token_usage_from_llm_result(response)
+        )
+
+    def _stop(self, run_id: UUID) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            node, start = started
+            self.node_seconds[node] += time.perf_counter() - start
+
+
+class ExampleEvaluation(BaseModel):
+    """The outcome of running one example question through the text2cypher subgraph."""
+
+    question: str = Field(description="The example question")
+    reference_cypher: str = Field(description="The known-good Cypher statement")
+    generated_cypher: str = Field(default="", description="The final generated statement")
+    correct: bool = Field(
+        default=False,
+        description="Whether the generated statement returned the same result set as the reference",
+    )
+    scored: bool = Field(
+        default=False,
+        description="Whether the example was scored. Examples whose queries were not recorded or whose run failed are not",
+    )
+    error: Optional[str] = Field(
+        default=None, description="Why the example failed or could not be scored"
+    )
+    attempts: int = Field(default=0, description="Generation and correction attempts")
+    seconds: float = Field(default=0.0, description="Time to run the subgraph")
+    token_usage: Dict[str, int] = Field(default_factory=lambda: dict(empty_token_usage()))
+    node_seconds: Dict[str, float] = Field(
+        default_factory=dict, description="Time spent in each node"
+    )
+
+
+def _normalize_value(value: Any) -> str:
+    if isinstance(value, float):
+        value = round(value, 6)
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def compare_result_sets(
+    expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]
+) -> bool:
+    """
+    Check whether two Cypher results hold the same rows.
+
+    Rows are compared as multisets of their values, so row order, column order and column aliases are ignored.
+    Floats are compared to 6 decimal places.
+    """
+    def rows(records: List[Dict[str, Any]]) -> Counter[Tuple[str, ...]]:
+        return Counter(
+            tuple(sorted(_normalize_value(v) for v in record.values()))
+            for record in records
+        )
+
+    return rows(expected) == rows(actual)
+
+
+async def evaluate_example(
+    agent: CompiledStateGraph,
+    graph: Any,
+    example: ExampleQuery,
+    retriever: Optional[HoldoutExampleRetriever] = None,
+) -> ExampleEvaluation:
+    """
+    Run one example question through the text2cypher subgraph and score it against the reference Cypher.
+    Errors are recorded in the outcome rather than raised, and leave the example unscored.
+
+    Parameters
+    ----------
+    agent : CompiledStateGraph
+        The text2cypher subgraph, such as one created by `create_text2cypher_agent`.
+    graph : Any
+        The graph the reference statement is run against, a `Neo4jGraph` or `RecordedNeo4jGraph`.
+    example : ExampleQuery
+        The question and reference Cypher.
+    retriever : Optional[HoldoutExampleRetriever], optional
+        The example retriever of the agent, by default None
+        If provided, the example is left out of the few shot examples while it is evaluated.
+
+    Returns
+    -------
+    ExampleEvaluation
+        The outcome.
+    """
+    evaluation = ExampleEvaluation(question=example.question, reference_cypher=example.cql)
+    try:
+        expected = await asyncio.to_thread(graph.query, strip_cypher_statement(example.cql))
+    except Exception as e:
+        evaluation.error = f"reference failed: {type(e).__name__}: {e}"
+        return evaluation
+
+    stats = RunStatsCallbackHandler()
+    cypher: Dict[str, Any] = dict()
+    start = time.perf_counter()
+    try:
+        with retriever.holdout(example.question) if retriever is not None else nullcontext():
+            async for update in agent.astream(
+                {"task": example.question, "prev_steps": []},
+                config={"callbacks": [stats]},
+                stream_mode="updates",
+            ):
+                for node_update in update.values():
+                    # the final statement, errors and attempts are only in node updates
+                    for key in ("statement", "errors", "attempts"):
+                        if node_update and key in node_update:
+                            cypher[key] = node_update[key]
+                    for output in (node_update or dict()).get("cyphers", list()):
+                        cypher.update(output)
+    except RecordingNotFoundError as e:
+        evaluation.error = f"not recorded: {e}"
+    except Exception as e:
+        # one failing example, such as an LLM API error, must not discard the others
+        evaluation.error = f"failed: {type(e).__name__}: {e}"
+    finally:
+        evaluation.seconds = time.perf_counter() - start
+        evaluation.token_usage = dict(stats.token_usage)
+        evaluation.node_seconds = dict(stats.node_seconds)
+
+    evaluation.generated_cypher = cypher.get("statement", "")
+    evaluation.attempts = cypher.get("attempts", 0)
+    if evaluation.error is None:
+        evaluation.scored = True
+        if "records" not in cypher:
+            evaluation.error = "not executed: " + "; ".join(cypher.get("errors", list()))
+        else:
+            records = cypher["records"]
+            evaluation.correct = not cypher.get("errors") and compare_result_sets(
+                expected, [] if records == NO_CYPHER_RESULTS else records
+            )
+    return evaluation
+
+
+async def evaluate_examples(
+    agent: CompiledStateGraph,
+    graph: Any,
+    examples: List[ExampleQuery],
+    retriever: Optional[HoldoutExampleRetriever] = None,
+    concurrency: int = 4,
+) -> List[ExampleEvaluation]:
+    """
+    Evaluate example questions concurrently. See `evaluate_example`.
+
+    Parameters
+    ----------
+    agent : CompiledStateGraph
+        The text2cypher subgraph.
+    graph : Any
+        The graph the reference statements are run against.
+    examples : List[ExampleQuery]
+        The questions and reference Cypher.
+    retriever : Optional[HoldoutExampleRetriever], optional
+        The example retriever of the agent, by default None
+    concurrency : int, optional
+        The max number of examples evaluated at once, by default 4
+
+    Returns
+    -------
+    List[ExampleEvaluation]
+        The outcomes, in the order of the examples.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(example: ExampleQuery) -> ExampleEvaluation:
+        async with semaphore:
+            return await evaluate_example(agent, graph, example, retriever)
+
+    return await asyncio.gather(*(limited(example) for example in examples))
+
+
+def summarize_evaluation(evaluations: List[ExampleEvaluation]) -> Dict[str, Any]:
+    """
+    Summarize evaluation outcomes.
+
+    Execution accuracy is the share of scored examples whose result set matched the reference.
+    Examples that could not be scored, such as those with unrecorded queries or a failed run, are counted separately.
+    """
+    scored = [e for e in evaluations if e.scored]
+    latencies = sorted(e.seconds for e in evaluations)
+    token_usage = empty_token_usage()
+    node_seconds: Dict[str, List[float]] = defaultdict(list)
+    for evaluation in evaluations:
+        token_usage = add_token_usage(token_usage, TokenUsage(**evaluation.token_usage))  # type: ignore[typeddict-item]
+        for node, seconds in evaluation.node_seconds.items():
+            node_seconds[node].append(seconds)
+
+    return {
+        "examples": len(evaluations),
+        "scored": len(scored),
+        "unscored": len(evaluations) - len(scored),
+        "execution_accuracy": (
+            sum(e.correct for e in scored) / len(scored) if scored else 0.0
+        ),
+        "mean_attempts": (
+            statistics.mean(e.attempts for e in evaluations) if evaluations else 0.0
+        ),
+        "token_usage": dict(token_usage),
+        "cached_token_ratio": get_cached_token_ratio(token_usage),
+        "latency_seconds": {
+            "median": statistics.median(latencies) if latencies else 0.0,
+            "p95": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+            if latencies
+            else 0.0,
+        },
+        "node_seconds": {
+            node: statistics.mean(values) for node, values in sorted(node_seconds.items())
+        },
+    }
@@ -0,0 +1,115 @@
+"""A Neo4j stand-in that answers queries from a cassette."""
+
+import copy
+import time
+import warnings
+from typing import Any, Dict, List, Optional
+
+from langchain_neo4j import Neo4jGraph
+from neo4j.exceptions import Neo4jError
+
+from neo4j_text2cypher.evaluation.cassette import Cassette, get_interaction_key
+from neo4j_text2cypher.exceptions import RecordingNotFoundError
+
+
+class RecordedNeo4jGraph:
+    """
+    A stand-in for `Neo4jGraph` that serves the schema and query responses recorded in a cassette.
+
+    When the cassette is recording and a live graph is provided, the schema is taken from it, and queries
+    without a recording are run against it and recorded along with their duration, including Neo4j errors.
+    Only `query` and the schema attributes are supported, so components that use the driver directly,
+    such as the cost gate, need a live graph.
+    """
+
+    def __init__(self, cassette: Cassette, graph: Optional[Neo4jGraph] = None):
+        """
+        Load the schema.
+
+        Parameters
+        ----------
+        cassette : Cassette
+            The cassette holding the schema and query responses.
+        graph : Optional[Neo4jGraph], optional
+            The live graph to record from, by default None
+        """
+        self.cassette = cassette
+        self._graph = graph
+
+        if graph is not None and cassette.record:
+            cassette.set_metadata(
+                "graph",
+                {
+                    "schema": graph.schema,
+                    "structured_schema": graph.structured_schema,
+                    "enhanced_schema": getattr(graph, "_enhanced_schema", False),
+                    "database": getattr(graph, "_database", None),
+                },
+            )
+        recorded = cassette.metadata.get("graph", dict())
+        self.schema: str = recorded.get("schema", "")
+        self.structured_schema: Dict[str, Any] = recorded.get("structured_schema", dict())
+        self._enhanced_schema: bool = recorded.get("enhanced_schema", False)
+        self._database: Optional[str] = recorded.get("database")
+        self.timeout: Optional[float] = None
+        self.sanitize = False
+
+    @property
+    def get_schema(self) -> str:
+        return self.schema
+
+    @property
+    def get_structured_schema(self) -> Dict[str, Any]:
+        return self.structured_schema
+
+    def query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        session_params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Answer a query from the cassette, recording it first if it is missing and a live graph is available.
+
+        A replayed query blocks for its recorded duration, like the driver call it stands in for,
+        so async callers should run it off the event loop, as `run_db_call` does.
+
+        Raises
+        ------
+        RecordingNotFoundError
+            If the query was not recorded and can not be recorded.
+        Neo4jError
+            If the recorded query failed.
+        """
+        key = get_interaction_key(query, params or {})
+        interaction = self.cassette.get("query", key)
+
+        if interaction is None:
+            if self._graph is None:
+                raise RecordingNotFoundError(f"No recorded response for query: {query}")
+            interaction = {"query": query, "params": params}
+            start = time.perf_counter()
+            try:
+                interaction["records"] = self._graph.query(
+                    query, params or {}, session_params or {}
+                )
+            except Neo4jError as e:
+                interaction["error"] = {"code": e.code, "message": e.message}
+            interaction["seconds"] = time.perf_counter() - start
+            # replayed and recorded runs see the same JSON values
+            interaction = self.cassette.put("query", key, interaction)
+        else:
+            time.sleep(self.cassette.replay_seconds(interaction))
+
+        if "error" in interaction:
+            with warnings.catch_warnings():
+                # hydrate maps an error code to its exception class, such as CypherSyntaxError
+                warnings.simplefilter("ignore", DeprecationWarning)
+                raise Neo4jError.hydrate(**interaction["error"])
+        return copy.deepcopy(interaction["records"])  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        """Save the cassette and close the live graph, if any."""
+        self.cassette.save()
+        if self._graph is not None:
+            self._graph.close()
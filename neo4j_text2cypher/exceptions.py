@@ -14,3 +14,27 @@ class CypherQueryNodesReadError(Neo4jText2CypherError):
     """Exception raised when an error occurs while retrieving all existing Cypher query node ids."""
 
     ...
+
+
+class InvalidRequestError(Neo4jText2CypherError, ValueError):
+    """Exception raised when an API request can not be served as sent, such as a `thread_id` without checkpointing."""
+
+    ...
+
+
+class NodeTimeoutError(Neo4jText2CypherError):
+    """Exception raised when a workflow node exceeds its configured deadline."""
+
+    ...
+
+
+class RecordingNotFoundError(Neo4jText2CypherError):
+    """Exception raised when a recorded stand-in receives a request that was not recorded."""
+
+    ...
+
+
+class UnknownTenantError(Neo4jText2CypherError):
+    """Exception raised when a tenant registry is asked for a tenant it does not serve."""
+
+    ...
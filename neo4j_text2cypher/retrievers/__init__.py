@@ -1,7 +1,12 @@
 """This directory contains custom retrievers."""
 
 from .config_retriever import ConfigCypherExampleRetriever
+from .property_value_index import PropertyValueIndex
+from .verified_query_store import VerifiedQuery, VerifiedQueryStore
 
 __all__ = [
     "ConfigCypherExampleRetriever",
+    "PropertyValueIndex",
+    "VerifiedQuery",
+    "VerifiedQueryStore",
 ]
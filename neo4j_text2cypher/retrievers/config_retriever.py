@@ -14,9 +14,34 @@ class ConfigCypherExampleRetriever:
 
     def get_examples(self) -> str:
         """Get formatted example queries from the configuration."""
-        example_queries = self.config_loader.get_example_queries()
+        example_queries = self._get_example_queries()
         return self._format_examples_list(example_queries)
 
+    def get_example_subsets(self, num_subsets: int) -> List[str]:
+        """
+        Get `num_subsets` formatted variations of the example queries.
+        Subset `i` leaves out every `num_subsets`-th example starting at index `i`,
+        so each subset steers generation differently while keeping most examples.
+        A single subset contains all examples.
+        """
+        example_queries = self._get_example_queries()
+        if num_subsets <= 1:
+            return [self._format_examples_list(example_queries)]
+        return [
+            self._format_examples_list(
+                [
+                    example
+                    for idx, example in enumerate(example_queries)
+                    if idx % num_subsets != subset
+                ]
+            )
+            for subset in range(num_subsets)
+        ]
+
+    def _get_example_queries(self) -> List[ExampleQuery]:
+        """Get the example queries to format."""
+        return self.config_loader.get_example_queries()
+
     def _format_examples_list(self, examples: List[ExampleQuery]) -> str:
         """Format example queries for use in prompts."""
         return ("\n" * 2).join(
@@ -0,0 +1,239 @@
+"""Sampled index of the distinct values of low-cardinality string properties."""
+
+import difflib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.utils.config import PropertyValueIndexConfig
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_utils import get_schema_version
+
+DISTINCT_STRING_VALUES_QUERY = """
+MATCH (n:`{label}`)
+WITH n LIMIT $sample_size
+UNWIND $properties AS property
+WITH property, n[property] AS value
+WHERE value IS NOT NULL
+WITH property, collect(DISTINCT value) AS values
+RETURN property, values[..$max_values + 1] AS values
+"""
+
+
+def _normalize_value(value: str) -> str:
+    """Case fold a value and drop everything but letters and digits, so `CR-V` matches `crv`."""
+    return re.sub(r"[\W_]+", "", value.casefold())
+
+
+class PropertyValueIndex:
+    """
+    Look up the stored spelling of string property values without querying Neo4j.
+
+    Values are matched exactly, then ignoring case, then ignoring case and punctuation,
+    and finally by fuzzy similarity.
+    """
+
+    def __init__(
+        self,
+        values: Dict[str, Dict[str, List[str]]],
+        schema_version: str = "",
+        min_similarity: float = 0.8,
+    ) -> None:
+        """
+        Initialize the index.
+
+        Parameters
+        ----------
+        values : Dict[str, Dict[str, List[str]]]
+            The distinct values of each property, by node label and property key.
+        schema_version : str, optional
+            The version stamp of the schema the values were sampled with, by default ""
+        min_similarity : float, optional
+            The min similarity ratio of a fuzzy match, by default 0.8
+        """
+        self.values = values
+        self.schema_version = schema_version
+        self.min_similarity = min_similarity
+        self._casefolded: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._normalized: Dict[Tuple[str, str], Dict[str, str]] = {}
+        for label, properties in values.items():
+            for property_key, property_values in properties.items():
+                key = (label, property_key)
+                self._casefolded[key] = {v.casefold(): v for v in property_values}
+                self._normalized[key] = {_normalize_value(v): v for v in property_values}
+
+    @classmethod
+    def build(
+        cls,
+        graph: Neo4jGraph,
+        sample_size: int = 10000,
+        max_values: int = 200,
+        min_similarity: float = 0.8,
+    ) -> "PropertyValueIndex":
+        """
+        Sample the distinct values of the string properties in the graph schema.
+        Properties with more than `max_values` distinct values in the sample are not indexed.
+
+        Parameters
+        ----------
+        graph : Neo4jGraph
+            The Neo4j graph wrapper.
+        sample_size : int, optional
+            The max number of nodes per label to sample, by default 10000
+        max_values : int, optional
+            The max number of distinct values of an indexed property, by default 200
+        min_similarity : float, optional
+            The min similarity ratio of a fuzzy match, by default 0.8
+
+        Returns
+        -------
+        PropertyValueIndex
+            The index.
+        """
+        values: Dict[str, Dict[str, List[str]]] = {}
+        node_props = graph.structured_schema.get("node_props", dict())
+        for label, properties in node_props.items():
+            if label == "CypherQuery":
+                continue
+            string_properties = [
+                prop["property"] for prop in properties if prop.get("type") == "STRING"
+            ]
+            if not string_properties:
+                continue
+            records = graph.query(
+                DISTINCT_STRING_VALUES_QUERY.format(label=label.replace("`", "``")),
+                {
+                    "sample_size": sample_size,
+                    "properties": string_properties,
+                    "max_values": max_values,
+                },
+            )
+            for record in records:
+                property_values = [v for v in record["values"] if isinstance(v, str)]
+                if property_values and len(record["values"]) <= max_values:
+                    values.setdefault(label, dict())[record["property"]] = property_values
+
+        return cls(
+            values,
+            schema_version=get_schema_version(graph),
+            min_similarity=min_similarity,
+        )
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], min_similarity: float = 0.8
+    ) -> "PropertyValueIndex":
+        """Load an index saved with `save`."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            data["values"],
+            schema_version=data.get("schema_version", ""),
+            min_similarity=min_similarity,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Atomically save the index as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"schema_version": self.schema_version, "values": self.values}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_config(
+        cls, config: PropertyValueIndexConfig, graph: Neo4jGraph
+    ) -> Optional["PropertyValueIndex"]:
+        """
+        Create an index from configuration, or return None if the index is disabled.
+        A cached index is reused if it was built with the current schema, otherwise the index is rebuilt and cached.
+
+        Parameters
+        ----------
+        config : PropertyValueIndexConfig
+            The index configuration.
+        graph : Neo4jGraph
+            The Neo4j graph wrapper.
+
+        Returns
+        -------
+        Optional[PropertyValueIndex]
+            The index, or None if it is disabled.
+        """
+        if not config.enabled:
+            return None
+
+        logger = get_validation_logger()
+        if config.path is not None and Path(config.path).exists():
+            index = cls.load(config.path, min_similarity=config.min_similarity)
+            if index.schema_version == get_schema_version(graph):
+                logger.debug(f"🔍 VALUE INDEX DEBUG - Loaded from {config.path}")
+                return index
+
+        index = cls.build(
+            graph,
+            sample_size=config.sample_size,
+            max_values=config.max_values,
+            min_similarity=config.min_similarity,
+        )
+        logger.debug(
+            f"🔍 VALUE INDEX DEBUG - Indexed {sum(len(p) for p in index.values.values())} properties"
+        )
+        if config.path is not None:
+            index.save(config.path)
+        return index
+
+    def contains(self, label: str, property_key: str, value: str) -> bool:
+        """Whether a property has the value, ignoring case and punctuation but not by fuzzy similarity."""
+        key = (label, property_key)
+        if key not in self._casefolded:
+            return False
+        return (
+            value.casefold() in self._casefolded[key]
+            or _normalize_value(value) in self._normalized[key]
+        )
+
+    def match(self, label: str, property_key: str, value: str) -> Optional[str]:
+        """
+        Find the stored spelling of a property value.
+
+        Parameters
+        ----------
+        label : str
+            The node label.
+        property_key : str
+            The property key.
+        value : str
+            The value as written in the Cypher statement.
+
+        Returns
+        -------
+        Optional[str]
+            The stored value, or None if the property is not indexed or no value is similar enough.
+        """
+        key = (label, property_key)
+        if key not in self._casefolded:
+            return None
+
+        casefolded = self._casefolded[key].get(value.casefold())
+        if casefolded is not None:
+            return casefolded
+
+        normalized = self._normalized[key].get(_normalize_value(value))
+        if normalized is not None:
+            return normalized
+
+        close = difflib.get_close_matches(
+            value.casefold(), self._casefolded[key], n=1, cutoff=self.min_similarity
+        )
+        if close:
+            get_metrics().increment("value_index.fuzzy_matches")
+            return self._casefolded[key][close[0]]
+        return None
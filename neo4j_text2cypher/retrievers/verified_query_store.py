@@ -0,0 +1,321 @@
+"""Store of verified task and Cypher statement pairs that may be reused as templates."""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from neo4j_text2cypher.utils.config import VerifiedQueryConfig
+from neo4j_text2cypher.utils.cypher_utils import parameterize_cypher_literals
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+
+_EMBEDDING_DIMENSIONS = 512
+_NUMBER_CAPTURE = r"(-?\d+(?:\.\d+)?)"
+# a text slot holds one value, so it does not span list separators or conjunctions
+_TEXT_CAPTURE = r"([^,;]+?)"
+_CONJUNCTION_PATTERN = re.compile(r"(?<!\w)(?:and|or|nor|&)(?!\w)", re.IGNORECASE)
+# tasks with less fixed text than this are only reused for the identical task
+_MIN_TEMPLATE_WORDS = 3
+
+
+class VerifiedQuery(BaseModel):
+    """A verified Cypher statement with the parameter slots that are bound to its task."""
+
+    task: str = Field(description="The task the statement answered")
+    statement: str = Field(description="The parameterized Cypher statement")
+    parameters: Dict[str, Any] = Field(description="The parameter values for `task`")
+    task_parts: List[str] = Field(
+        description="The task text around each slot. There is one more part than slots."
+    )
+    slots: List[List[str]] = Field(
+        description="The parameter names filled by each slot, in task order"
+    )
+    slot_cases: List[str] = Field(
+        description="How each slot value is cased in the parameters: `upper`, `lower` or `as_is`"
+    )
+    hits: int = Field(default=0, description="The number of times the entry was reused")
+    last_used: float = Field(default_factory=time.time)
+
+
+def _normalize_task(task: str) -> str:
+    return re.sub(r"\s+", " ", task).strip().rstrip("?!. ")
+
+
+def _embed(text: str) -> np.ndarray:
+    """Embed text as a normalized vector of hashed character trigram counts."""
+    vector = np.zeros(_EMBEDDING_DIMENSIONS, dtype=np.float32)
+    text = f"  {text.casefold()} "
+    for idx in range(len(text) - 2):
+        vector[zlib.crc32(text[idx : idx + 3].encode()) % _EMBEDDING_DIMENSIONS] += 1
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _build_template(
+    task: str, parameters: Dict[str, Any]
+) -> Tuple[List[str], List[List[str]], List[str]]:
+    """Split a task around the occurrences of its parameter values."""
+    occurrences: Dict[Tuple[int, int], List[str]] = {}
+    for name, value in parameters.items():
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            continue
+        text = str(value)
+        if not text.strip():
+            continue
+        match = re.search(
+            rf"(?<!\w){re.escape(text)}(?!\w)", task, flags=re.IGNORECASE
+        )
+        if match is not None:
+            occurrences.setdefault(match.span(), list()).append(name)
+
+    task_parts: List[str] = []
+    slots: List[List[str]] = []
+    slot_cases: List[str] = []
+    position = 0
+    for (start, end), names in sorted(occurrences.items()):
+        if start < position:
+            # drop values that overlap an earlier slot
+            continue
+        occurrence = task[start:end]
+        value = str(parameters[names[0]])
+        if value != occurrence and value == value.upper():
+            slot_cases.append("upper")
+        elif value != occurrence and value == value.lower():
+            slot_cases.append("lower")
+        else:
+            slot_cases.append("as_is")
+        task_parts.append(task[position:start])
+        slots.append(names)
+        position = end
+    task_parts.append(task[position:])
+
+    if len(" ".join(task_parts).split()) < _MIN_TEMPLATE_WORDS:
+        return [task], [], []
+    return task_parts, slots, slot_cases
+
+
+def _fill_template(entry: VerifiedQuery, task: str) -> Optional[Dict[str, Any]]:
+    """Read the slot values of `task` using the task template of `entry`."""
+    pattern = ""
+    for part, names in zip(entry.task_parts, entry.slots):
+        value = entry.parameters[names[0]]
+        pattern += re.sub(r"\\\s+|\\ ", r"\\s+", re.escape(part))
+        pattern += _TEXT_CAPTURE if isinstance(value, str) else _NUMBER_CAPTURE
+    pattern += re.sub(r"\\\s+|\\ ", r"\\s+", re.escape(entry.task_parts[-1]))
+
+    match = re.fullmatch(pattern, task, flags=re.IGNORECASE)
+    if match is None:
+        return None
+
+    parameters = dict(entry.parameters)
+    for captured, names, case in zip(match.groups(), entry.slots, entry.slot_cases):
+        original = entry.parameters[names[0]]
+        value: Any
+        if isinstance(original, int):
+            if not re.fullmatch(r"-?\d+", captured):
+                return None
+            value = int(captured)
+        elif isinstance(original, float):
+            value = float(captured)
+        elif _CONJUNCTION_PATTERN.search(captured) and not _CONJUNCTION_PATTERN.search(
+            original
+        ):
+            # "Honda and Toyota" names two values where the template has one
+            return None
+        elif case == "upper":
+            value = captured.upper()
+        elif case == "lower":
+            value = captured.lower()
+        else:
+            value = captured
+        for name in names:
+            parameters[name] = value
+    return parameters
+
+
+class VerifiedQueryStore:
+    """
+    Keep Cypher statements that were validated and executed successfully, keyed by their task.
+
+    Parameter values that appear in the task become slots. A new task that matches a stored task
+    apart from its slot values reuses the stored statement with the new values.
+    Candidates are found with a top-k cosine similarity search over hashed character trigram vectors.
+    When the store is full, the least used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = 1000,
+        min_similarity: float = 0.5,
+        top_k: int = 5,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        """
+        Initialize the store and load any entries persisted at `path`.
+
+        Parameters
+        ----------
+        path : Optional[Union[str, Path]], optional
+            The JSON file the store is persisted to, by default None
+            If None, the store is kept in memory only.
+        max_entries : int, optional
+            The max number of entries to keep, by default 1000
+        min_similarity : float, optional
+            The min cosine similarity between a task and a stored task for it to be a candidate, by default 0.5
+        top_k : int, optional
+            The number of most similar candidates to try to fill, by default 5
+        metrics : Optional[MetricsRecorder], optional
+            Where to record store metrics, by default the process-wide recorder
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        self.top_k = top_k
+        self.metrics = metrics or get_metrics()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, VerifiedQuery] = {}
+        self._keys: List[str] = []
+        self._index: Optional[np.ndarray] = None
+
+        if self.path is not None and self.path.exists():
+            with open(self.path) as f:
+                for entry in json.load(f):
+                    verified_query = VerifiedQuery(**entry)
+                    self._entries[_normalize_task(verified_query.task)] = verified_query
+
+    @classmethod
+    def from_config(cls, config: VerifiedQueryConfig) -> Optional["VerifiedQueryStore"]:
+        """Create a store from configuration, or return None if the store is disabled."""
+        if not config.enabled:
+            return None
+        return cls(
+            path=config.path,
+            max_entries=config.max_entries,
+            min_similarity=config.min_similarity,
+            top_k=config.top_k,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        task: str,
+        statement: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Save a verified statement for a task and persist the store.
+
+        Parameters
+        ----------
+        task : str
+            The task the statement answered.
+        statement : str
+            The Cypher statement. Literals are lifted into parameters if `parameters` is empty.
+        parameters : Optional[Dict[str, Any]], optional
+            The parameters the statement was executed with, by default None
+        """
+        if not parameters:
+            statement, parameters = parameterize_cypher_literals(statement)
+        task = _normalize_task(task)
+        task_parts, slots, slot_cases = _build_template(task, parameters)
+
+        with self._lock:
+            previous = self._entries.get(task)
+            self._entries[task] = VerifiedQuery(
+                task=task,
+                statement=statement,
+                parameters=parameters,
+                task_parts=task_parts,
+                slots=slots,
+                slot_cases=slot_cases,
+                hits=previous.hits if previous is not None else 0,
+            )
+            self._evict()
+            self._index = None
+            self._persist()
+
+        self.metrics.increment("verified_queries.added")
+
+    def lookup(self, task: str) -> Optional[Tuple[str, Dict[str, Any], Dict[str, str]]]:
+        """
+        Find a verified statement for a task.
+
+        Parameters
+        ----------
+        task : str
+            The task to answer.
+
+        Returns
+        -------
+        Optional[Tuple[str, Dict[str, Any], Dict[str, str]]]
+            The statement, its parameters filled from the task and the text values of the task that differ
+            from those the statement was verified with by parameter name, or None if no stored task matches.
+            Only a statement without new text values has been verified as is.
+        """
+        task = _normalize_task(task)
+        with self._lock:
+            if not self._entries:
+                self.metrics.increment("verified_queries.misses")
+                return None
+            if self._index is None:
+                self._keys = list(self._entries)
+                self._index = np.stack([_embed(key) for key in self._keys])
+
+            similarities = self._index @ _embed(task)
+            top = np.argsort(-similarities)[: self.top_k]
+            for idx in top:
+                if similarities[idx] < self.min_similarity:
+                    break
+                entry = self._entries[self._keys[idx]]
+                parameters = _fill_template(entry, task)
+                if parameters is None:
+                    continue
+                entry.hits += 1
+                entry.last_used = time.time()
+                self.metrics.increment("verified_queries.hits")
+                new_values = {
+                    name: value
+                    for name, value in parameters.items()
+                    if isinstance(value, str)
+                    and value.casefold() != str(entry.parameters[name]).casefold()
+                }
+                return entry.statement, parameters, new_values
+
+        self.metrics.increment("verified_queries.misses")
+        return None
+
+    def _evict(self) -> None:
+        """Drop the least used entries above `max_entries`. Must hold the lock."""
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        least_used = sorted(
+            self._entries,
+            key=lambda key: (self._entries[key].hits, self._entries[key].last_used),
+        )
+        for key in least_used[:excess]:
+            del self._entries[key]
+        self.metrics.increment("verified_queries.evicted", excess)
+
+    def _persist(self) -> None:
+        """Atomically write the entries to `path`. Must hold the lock."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                [entry.model_dump() for entry in self._entries.values()], f, indent=2
+            )
+        os.replace(tmp_path, self.path)
@@ -1,6 +1,4 @@
-import io
-import zipfile
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import pandas as pd
@@ -11,8 +9,19 @@ from neo4j.exceptions import SessionExpired
 from neo4j_text2cypher.components.state import (
     CypherHistoryRecord,
     HistoryRecord,
+    InputState,
     OutputState,
 )
+from neo4j_text2cypher.ui.exports import EXPORT_FORMATS, export_cypher_results
+from neo4j_text2cypher.ui.records import (
+    count_pages,
+    get_record_columns,
+    get_records_page,
+)
+from neo4j_text2cypher.utils.budget import with_request_budget
+from neo4j_text2cypher.workflows.checkpointing import get_thread_config
+from neo4j_text2cypher.workflows.deadlines import ainvoke_with_deadline
+from neo4j_text2cypher.workflows.resources import WorkflowResources
 
 
 def convert_streamlit_messages_to_history() -> List[HistoryRecord]:
@@ -79,29 +88,49 @@ def append_user_question(question: str) -> None:
     st.chat_message("user").markdown(question)
 
 
-async def append_llm_response(question: str) -> None:
+def append_llm_response(question: str) -> None:
     with st.chat_message("assistant"):
         message_placeholder = st.empty()
         message_placeholder.status("thinking...")
         print("question: ", question)
 
-        agent = st.session_state.get("agent")
+        resources: Optional[WorkflowResources] = st.session_state.get("resources")
 
-        if agent is not None:
+        if resources is not None:
             try:
-                # Convert Streamlit messages to HistoryRecord format
-                history = convert_streamlit_messages_to_history()
-
-                response: OutputState = await agent.ainvoke(
-                    {"question": question, "data": [], "history": history},
-                    config={"recursion_limit": 30},
+                if resources.checkpointer is not None:
+                    # History is kept in the checkpoint of the conversation thread
+                    input = InputState(question=question)  # type: ignore[typeddict-item]
+                    config = get_thread_config(
+                        st.session_state.get("thread_id", ""),
+                        {"recursion_limit": 30},
+                    )
+                else:
+                    # Convert Streamlit messages to HistoryRecord format
+                    history = convert_streamlit_messages_to_history()
+                    input = InputState(question=question, data=[], history=history)
+                    config = {"recursion_limit": 30}
+                config = with_request_budget(resources.budget_config, config)
+
+                # the workflow runs on the event loop shared by all sessions
+                response: OutputState = resources.run(
+                    ainvoke_with_deadline(
+                        resources.workflow,
+                        input,
+                        config=config,
+                        timeout=resources.request_timeout,
+                    )
                 )
 
+                message_id = str(uuid4())
                 message_placeholder.markdown(response.get("answer", ""))
-                show_cypher_response_information(response=response)
+                show_budget_information(response=response)
+                show_cypher_response_information(
+                    response=response, message_id=message_id
+                )
 
                 st.session_state.get("messages", []).append(
-                    {"role": "assistant", "content": response}
+                    {"role": "assistant", "content": response, "id": message_id}
                 )
             except GraphRecursionError:
                 error_msg = "Query exceeded processing limits. Please try a simpler question or break it into smaller parts."
@@ -117,7 +146,16 @@ async def append_llm_response(question: str) -> None:
             )
 
 
-def show_cypher_response_information(response: OutputState) -> None:
+def show_budget_information(response: OutputState) -> None:
+    usage = response.get("usage")
+    if usage and usage.get("skipped"):
+        skipped = ", ".join(
+            f"{name.replace('_', ' ')} ({count})" for name, count in usage["skipped"].items()
+        )
+        st.caption(f"Cut back to stay within the request budget: {skipped}")
+
+
+def show_cypher_response_information(response: OutputState, message_id: str) -> None:
     if response.get("cyphers") and len(response.get("cyphers", list())) > 0:
         # a list of record lists
         records_lists: List[List[Dict[str, Any]]] = [
@@ -126,75 +164,122 @@ def show_cypher_response_information(response: OutputState) -> None:
             if c.get("records") is not None
         ]
 
-        download_csv_button(cypher_results=records_lists)
+        if any(records_lists):
+            download_button(cypher_results=records_lists, message_id=message_id)
 
         with st.expander("Cypher"):
-            [
-                (
-                    st.write(c.get("task", "")),
-                    st.code(c.get("statement"), language="cypher"),
-                    st.write(c.get("parameters", "No parameters")),
-                    st.json(
-                        c.get("records") if c.get("records") is not None else "",
-                        expanded=False,
-                    ),
+            for i, c in enumerate(response.get("cyphers", list())):
+                st.write(c.get("task", ""))
+                st.code(c.get("statement"), language="cypher")
+                st.write(c.get("parameters", "No parameters"))
+                records_viewer(
+                    records=c.get("records") or list(), key=f"{message_id}_{i}"
                 )
-                for c in response.get("cyphers", list())
-            ]
 
 
-async def chat(question: str) -> None:
+def chat(question: str) -> None:
     try:
         append_user_question(question=question)
-        await append_llm_response(question=question)
+        append_llm_response(question=question)
     except SessionExpired as e:
         st.error(f"Neo4j Session expired. Please restart the application. Error: {e}")
 
 
 def display_chat_history() -> None:
-    for message in st.session_state.get("messages", []):
+    for i, message in enumerate(st.session_state.get("messages", [])):
         with st.chat_message(message["role"]):
             if message.get("role") == "user":
                 st.markdown(message.get("content"))
             else:
                 st.markdown(message.get("content", dict()).get("answer"))
-                show_cypher_response_information(response=message["content"])
+                show_budget_information(response=message["content"])
+                show_cypher_response_information(
+                    response=message["content"], message_id=message.get("id", str(i))
+                )
+
+
+@st.fragment  # type: ignore[misc, unused-ignore]
+def records_viewer(records: List[Dict[str, Any]], key: str) -> None:
+    """
+    Show Cypher records as a table, one page at a time.
 
+    Only the current page, projected onto the selected columns, is sent to the browser,
+    and paging reruns only this fragment.
+    """
+    if len(records) == 0:
+        st.write("No records")
+        return
+
+    columns = get_record_columns(records)
+    page_size: int = st.session_state.get("results_page_size", 25)
+    pages = count_pages(len(records), page_size)
+
+    selected = columns
+    if len(columns) > 1:
+        selected = st.multiselect(
+            "Columns", columns, default=columns, key=f"records_columns_{key}"
+        )
+    page = 1
+    if pages > 1:
+        page = int(
+            st.number_input(
+                f"Page (of {pages})",
+                min_value=1,
+                max_value=pages,
+                value=1,
+                step=1,
+                key=f"records_page_{key}",
+            )
+        )
 
-def prepare_csv(cypher_result: List[Dict[str, Any]]) -> Any:
-    index = [i for i in range(len(cypher_result[0].values()))]
-    return pd.DataFrame(data=cypher_result).to_csv(index=index).encode("utf-8")
+    if len(selected) == 0:
+        st.info("Select at least one column.")
+        return
+    rows = get_records_page(records, page, page_size, selected)
+    st.dataframe(
+        pd.DataFrame(data=rows, columns=selected),
+        hide_index=True,
+        use_container_width=True,
+    )
+    start = (page - 1) * page_size
+    st.caption(f"Rows {start + 1}-{start + len(rows)} of {len(records)}")
 
 
 @st.fragment  # type: ignore[misc, unused-ignore]
-def download_csv_button(cypher_results: List[List[Dict[str, Any]]]) -> None:
-    try:
-        if len(cypher_results) > 1:
-            content = [prepare_csv(result) for result in cypher_results if result]
-            buf = io.BytesIO()
-            with zipfile.ZipFile(buf, "x") as zip:
-                for file_num, csv in enumerate(content):
-                    zip.writestr(f"cypher_result_part_{str(file_num + 1)}.csv", csv)
-
-            st.download_button(
-                label="Download Cypher Results Tables as CSV",
-                data=buf.getvalue(),
-                file_name="cypher_results.zip",
-                mime="application/zip",
-                help="The cypher results .csv files in a .zip.",
-                key=str(uuid4()),
-            )
-        elif len(cypher_results) == 1:
-            csv = prepare_csv(cypher_result=cypher_results[0])
-            st.download_button(
-                label="Download Cypher Results Table as CSV",
-                data=csv,
-                file_name="cypher_results.csv",
-                mime="text/csv",
-                help="The cypher results .csv file.",
-                key=str(uuid4()),
-            )
-    except Exception as e:
-        print(
-            f"Unable to generate Download Button for most recent question. Error: {e}"
+def download_button(cypher_results: List[List[Dict[str, Any]]], message_id: str) -> None:
+    """
+    Offer the Cypher results of an answer for download.
+
+    Exports are only built when requested, and are kept in the session per message and format,
+    so reruns do not rebuild the exports of the whole conversation.
+    """
+    exports: Dict[Tuple[str, str], Tuple[bytes, str, str]] = st.session_state.setdefault(
+        "exports", dict()
+    )
+    format = st.selectbox(
+        "Download format",
+        list(EXPORT_FORMATS),
+        key=f"export_format_{message_id}",
+        label_visibility="collapsed",
+    )
+    export = exports.get((message_id, format))
+    if export is None and st.button(
+        f"Prepare {format} Download", key=f"export_prepare_{message_id}_{format}"
+    ):
+        try:
+            export = export_cypher_results(cypher_results, format)
+            exports[(message_id, format)] = export
+        except Exception as e:
+            print(f"Unable to export the Cypher results as {format}. Error: {e}")
+            st.error(f"Unable to export the Cypher results as {format}.")
+
+    if export is not None:
+        data, file_name, mime = export
+        st.download_button(
+            label=f"Download Cypher Results as {format}",
+            data=data,
+            file_name=file_name,
+            mime=mime,
+            help="A single result is one file, several are one file each in a .zip.",
+            key=f"export_download_{message_id}_{format}",
         )
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import streamlit as st
 
 
@@ -23,6 +25,9 @@ def sidebar() -> None:
     if len(st.session_state.get("messages", list())) > 0:
         if st.sidebar.button("Reset Chat", type="primary"):
             st.session_state["messages"] = []
+            st.session_state["exports"] = dict()
+            # start a new checkpointed conversation
+            st.session_state["thread_id"] = str(uuid4())
             if "current_question" in st.session_state:
                 del st.session_state["current_question"]
             st.rerun()
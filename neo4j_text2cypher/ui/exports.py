@@ -0,0 +1,106 @@
+"""Downloadable exports of Cypher results."""
+
+import io
+import zipfile
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+from neo4j_text2cypher.ui.records import get_record_columns
+
+# format name -> (file extension, MIME type)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Arrow": ("arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+def _to_arrow_table(records: List[Dict[str, Any]]) -> Any:
+    import pyarrow as pa
+
+    # build columns from the records, since pandas turns integer columns with nulls into floats
+    columns = dict()
+    for column in get_record_columns(records):
+        values = [record.get(column) for record in records]
+        try:
+            columns[str(column)] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # mixed types and Neo4j temporal or spatial values have no Arrow type
+            columns[str(column)] = pa.array(
+                [None if v is None else str(v) for v in values], type=pa.string()
+            )
+    return pa.table(columns)
+
+
+def export_records(records: List[Dict[str, Any]], format: str) -> bytes:
+    """
+    Serialize the records of one Cypher result.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]]
+        The records.
+    format : str
+        One of `EXPORT_FORMATS`. Parquet and Arrow need `pyarrow`.
+
+    Returns
+    -------
+    bytes
+        The file content.
+    """
+    if format == "CSV":
+        return pd.DataFrame(data=records).to_csv().encode("utf-8")
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            f"{format} exports require `pyarrow`. Install it with `poetry install --with ui`."
+        ) from e
+
+    table = _to_arrow_table(records)
+    sink = io.BytesIO()
+    if format == "Parquet":
+        pq.write_table(table, sink)
+    elif format == "Arrow":
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown export format: {format}")
+    return sink.getvalue()
+
+
+def export_cypher_results(
+    cypher_results: List[List[Dict[str, Any]]], format: str
+) -> Tuple[bytes, str, str]:
+    """
+    Build a download of the Cypher results of one answer.
+    A single result is exported as one file, several as a ZIP archive of one file per result.
+
+    Parameters
+    ----------
+    cypher_results : List[List[Dict[str, Any]]]
+        The records of each Cypher result. Empty results are skipped.
+    format : str
+        One of `EXPORT_FORMATS`.
+
+    Returns
+    -------
+    Tuple[bytes, str, str]
+        The file content, file name and MIME type.
+    """
+    extension, mime = EXPORT_FORMATS[format]
+    results = [result for result in cypher_results if result]
+    if len(cypher_results) == 1 and results:
+        return export_records(results[0], format), f"cypher_results.{extension}", mime
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "x") as zip:
+        for file_num, result in enumerate(results):
+            zip.writestr(
+                f"cypher_result_part_{str(file_num + 1)}.{extension}",
+                export_records(result, format),
+            )
+    return buf.getvalue(), "cypher_results.zip", "application/zip"
@@ -0,0 +1,46 @@
+"""Server-side paging of Cypher records for display."""
+
+from typing import Any, Dict, List, Optional
+
+
+def get_record_columns(records: List[Dict[str, Any]]) -> List[str]:
+    """The keys of all records, in order of first appearance."""
+    return list(dict.fromkeys(key for record in records for key in record))
+
+
+def count_pages(total: int, page_size: int) -> int:
+    """The number of pages needed to show `total` records, at least one."""
+    return max(1, -(-total // page_size))
+
+
+def get_records_page(
+    records: List[Dict[str, Any]],
+    page: int,
+    page_size: int,
+    columns: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Slice one page of records and project it onto a subset of columns.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]]
+        The stored records.
+    page : int
+        The 1-based page number. Out of range pages are clamped.
+    page_size : int
+        The number of records per page.
+    columns : Optional[List[str]], optional
+        The columns to keep, by default None
+        If None, all columns are kept.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        The records of the page. Records missing a column have None for it.
+    """
+    page = min(max(page, 1), count_pages(len(records), page_size))
+    rows = records[(page - 1) * page_size : page * page_size]
+    if columns is None:
+        return rows
+    return [{column: row.get(column) for column in columns} for row in rows]
@@ -1,6 +1,7 @@
-import asyncio
+import atexit
 import sys
 from pathlib import Path
+from uuid import uuid4
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -8,16 +9,10 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 from dotenv import load_dotenv
-from langchain_neo4j import Neo4jGraph
-from langchain_openai import ChatOpenAI
 
-from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
 from neo4j_text2cypher.ui.components import chat, display_chat_history, sidebar
 from neo4j_text2cypher.utils.config import ConfigLoader
-from neo4j_text2cypher.utils.debug import setup_debug_logging
-from neo4j_text2cypher.workflows.neo4j_text2cypher_workflow import (
-    create_neo4j_text2cypher_workflow,
-)
+from neo4j_text2cypher.workflows.resources import WorkflowResources
 
 if load_dotenv():
     print("Env Loaded Successfully!")
@@ -45,44 +40,37 @@ def get_config_loader() -> ConfigLoader:
         )
 
 
-def initialize_state(config_loader: ConfigLoader) -> None:
-    """Initialize the application state."""
-
-    if "agent" not in st.session_state:
-        # Setup debug logging from config
-        debug_config = config_loader.get_debug_config()
-        setup_debug_logging(debug_config)
+@st.cache_resource(show_spinner="Connecting to Neo4j...")
+def get_shared_resources(config_path: str) -> WorkflowResources:
+    """
+    Create the resources shared by every browser session of the process.
 
-        # Initialize Neo4j connection with app-specific settings
-        neo4j_params = config_loader.get_neo4j_connection_params()
-        graph = Neo4jGraph(**neo4j_params)
+    Cached per config path, so the Neo4j driver pool, schema, LLM client, workflow and event loop
+    are created once rather than once per session.
+    """
 
-        # Initialize LLM
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
+    resources = WorkflowResources.from_config(
+        ConfigLoader(config_path), attempt_cypher_execution_on_final_attempt=False
+    )
+    atexit.register(resources.close)
+    return resources
 
-        # Use unified config retriever
-        cypher_example_retriever = ConfigCypherExampleRetriever(
-            config_path=str(config_loader.config_path)
-        )
 
-        # Get config for UI
-        streamlit_config = config_loader.get_streamlit_config()
+def initialize_state(config_loader: ConfigLoader) -> None:
+    """Initialize the session state. Only the conversation is kept per session."""
 
-        # Create the workflow
-        agent = create_neo4j_text2cypher_workflow(
-            llm=llm,
-            graph=graph,
-            scope_description=streamlit_config.scope_description,
-            cypher_example_retriever=cypher_example_retriever,
-            attempt_cypher_execution_on_final_attempt=False,
+    if "resources" not in st.session_state:
+        st.session_state.resources = get_shared_resources(
+            str(config_loader.config_path)
         )
-
-        st.session_state.agent = agent
+        st.session_state.thread_id = str(uuid4())
         st.session_state.messages = []
+        streamlit_config = config_loader.get_streamlit_config()
         st.session_state.example_questions = streamlit_config.example_questions
+        st.session_state.results_page_size = streamlit_config.results_page_size
 
 
-async def run_app(
+def run_app(
     title: str = "Simple Text2Cypher Assistant", scope_description: str = ""
 ) -> None:
     """
@@ -100,7 +88,7 @@ async def run_app(
         st.session_state["current_question"] = question
 
     if "current_question" in st.session_state:
-        await chat(str(st.session_state.get("current_question", "")))
+        chat(str(st.session_state.get("current_question", "")))
 
 
 def main() -> None:
@@ -115,11 +103,9 @@ def main() -> None:
 
     initialize_state(config_loader)
 
-    asyncio.run(
-        run_app(
-            title=streamlit_config.title,
-            scope_description=streamlit_config.scope_description,
-        )
+    run_app(
+        title=streamlit_config.title,
+        scope_description=streamlit_config.scope_description,
     )
 
 
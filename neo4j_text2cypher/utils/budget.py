@@ -0,0 +1,289 @@
+"""Per-request token and cost accounting, and the budget that Text2Cypher nodes degrade against."""
+
+import threading
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackManager
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_config
+from typing_extensions import TypedDict
+
+from neo4j_text2cypher.utils.config import BudgetConfig, ModelPrice
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+from neo4j_text2cypher.utils.token_usage import (
+    TokenUsage,
+    add_token_usage,
+    empty_token_usage,
+    get_cached_token_ratio,
+    get_token_usage_from_message,
+)
+
+
+class BudgetReport(TypedDict):
+    """The LLM usage of one request and what was cut back to stay within its budget."""
+
+    token_usage: TokenUsage
+    cost: float
+    max_tokens: Optional[int]
+    max_cost: Optional[float]
+    skipped: Dict[str, int]
+
+
+def get_model_price(
+    prices: Dict[str, ModelPrice], model_name: Optional[str]
+) -> Optional[ModelPrice]:
+    """
+    Find the price of a model. The longest configured name that the model name starts with is used,
+    so `gpt-4o` matches `gpt-4o-2024-08-06` and `gpt-4o-mini` is priced separately.
+    """
+    if not model_name:
+        return None
+    if model_name in prices:
+        return prices[model_name]
+    matches = [name for name in prices if model_name.startswith(name)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def get_cost(usage: TokenUsage, price: Optional[ModelPrice]) -> float:
+    """Get the cost of token usage. Usage of models without a price is free."""
+    if price is None:
+        return 0.0
+    cached_price = price.cached_input if price.cached_input is not None else price.input
+    uncached = usage["input_tokens"] - usage["cached_tokens"]
+    return (
+        uncached * price.input
+        + usage["cached_tokens"] * cached_price
+        + usage["output_tokens"] * price.output
+    ) / 1_000_000
+
+
+class RequestBudget(AsyncCallbackHandler):
+    """
+    Tracks the tokens and cost of every LLM call of one workflow run against optional limits.
+
+    Add it to the callbacks of the run config with `with_request_budget`, so that the LLM calls of every chain,
+    including those of concurrent text2cypher tasks, are charged to it. Nodes find it with `get_request_budget`
+    and cut back once it is `degraded`, recording what they left out with `skip`.
+    The share of input tokens served from the provider's prompt cache is observed for every call,
+    as `llm.cached_token_ratio` and `nodes.<name>.cached_token_ratio`.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        degrade_at: float = 0.8,
+        summary_max_records: int = 20,
+        prices: Optional[Dict[str, ModelPrice]] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        """
+        Initialize the budget. Limits left as None are unbounded.
+
+        Parameters
+        ----------
+        max_tokens : Optional[int], optional
+            Max LLM tokens, by default None
+        max_cost : Optional[float], optional
+            Max LLM cost, by default None
+        degrade_at : float, optional
+            The share of a limit after which the budget is degraded, by default 0.8
+        summary_max_records : int, optional
+            Records per result the summary is given once degraded, by default 20
+        prices : Optional[Dict[str, ModelPrice]], optional
+            Prices by model name, by default None
+        metrics : Optional[MetricsRecorder], optional
+            Where to record budget metrics, by default the process-wide recorder
+        """
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.degrade_at = degrade_at
+        self.summary_max_records = summary_max_records
+        self.prices = prices or dict()
+        self.metrics = metrics or get_metrics()
+        self.token_usage: TokenUsage = empty_token_usage()
+        self.cost = 0.0
+        self.skipped: Dict[str, int] = dict()
+        self._lock = threading.Lock()
+        self._was_degraded = False
+        self._nodes: Dict[UUID, str] = dict()
+
+    @classmethod
+    def from_config(
+        cls, config: BudgetConfig, metrics: Optional[MetricsRecorder] = None
+    ) -> "RequestBudget":
+        """Create a budget from the `budget` section of an app config."""
+        return cls(
+            max_tokens=config.max_tokens,
+            max_cost=config.max_cost,
+            degrade_at=config.degrade_at,
+            summary_max_records=config.summary_max_records,
+            prices=config.prices,
+            metrics=metrics,
+        )
+
+    async def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or dict()).get("langgraph_node")
+        if node is not None:
+            self._nodes[run_id] = node
+
+    async def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._nodes.pop(run_id, None)
+
+    async def on_llm_end(
+        self, response: LLMResult, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        node = self._nodes.pop(run_id, None)
+        llm_output = response.llm_output or dict()
+        for generations in response.generations:
+            for generation in generations:
+                if not isinstance(generation, ChatGeneration):
+                    continue
+                usage = get_token_usage_from_message(generation.message)
+                if usage is None:
+                    continue
+                model_name = generation.message.response_metadata.get(
+                    "model_name", llm_output.get("model_name")
+                )
+                self.charge(usage, model_name, node)
+
+    def charge(
+        self,
+        usage: TokenUsage,
+        model_name: Optional[str] = None,
+        node: Optional[str] = None,
+    ) -> None:
+        """Charge the token usage of one LLM call, made by the workflow node `node` if known."""
+        cost = get_cost(usage, get_model_price(self.prices, model_name))
+        with self._lock:
+            self.token_usage = add_token_usage(self.token_usage, usage)
+            self.cost += cost
+            newly_degraded = self.degraded and not self._was_degraded
+            self._was_degraded = self._was_degraded or newly_degraded
+        self.metrics.increment("budget.tokens", usage["total_tokens"])
+        if usage["input_tokens"]:
+            self.metrics.increment("llm.input_tokens", usage["input_tokens"])
+            self.metrics.increment("llm.cached_tokens", usage["cached_tokens"])
+            cached_token_ratio = get_cached_token_ratio(usage)
+            self.metrics.observe("llm.cached_token_ratio", cached_token_ratio)
+            if node is not None:
+                self.metrics.observe(f"nodes.{node}.cached_token_ratio", cached_token_ratio)
+        if newly_degraded:
+            self.metrics.increment("budget.degraded")
+
+    @property
+    def used(self) -> float:
+        """The largest share of a limit used so far. 0 without limits."""
+        shares = [0.0]
+        if self.max_tokens:
+            shares.append(self.token_usage["total_tokens"] / self.max_tokens)
+        if self.max_cost:
+            shares.append(self.cost / self.max_cost)
+        return max(shares)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether optional LLM calls should be cut back."""
+        return self.used >= self.degrade_at
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether a limit has been reached, so only calls needed for an answer should be made."""
+        return self.used >= 1.0
+
+    def skip(self, name: str) -> None:
+        """Record that a step, such as `llm_validation`, was skipped to stay within the budget."""
+        with self._lock:
+            self.skipped[name] = self.skipped.get(name, 0) + 1
+        self.metrics.increment(f"budget.skipped.{name}")
+
+    def report(self) -> BudgetReport:
+        """Get the usage of the request so far."""
+        with self._lock:
+            return BudgetReport(
+                token_usage=TokenUsage(**self.token_usage),
+                cost=self.cost,
+                max_tokens=self.max_tokens,
+                max_cost=self.max_cost,
+                skipped=dict(self.skipped),
+            )
+
+
+def _get_handlers(callbacks: Any) -> List[Any]:
+    if isinstance(callbacks, BaseCallbackManager):
+        return callbacks.handlers
+    if isinstance(callbacks, list):
+        return callbacks
+    return list()
+
+
+def get_request_budget(config: Optional[RunnableConfig] = None) -> Optional[RequestBudget]:
+    """
+    Find the budget of the current run.
+
+    Parameters
+    ----------
+    config : Optional[RunnableConfig], optional
+        The run config, by default the config of the node that is running
+
+    Returns
+    -------
+    Optional[RequestBudget]
+        The budget, or None if the run has none or this is called outside of a run.
+    """
+    if config is None:
+        try:
+            config = get_config()
+        except RuntimeError:
+            return None
+    for handler in _get_handlers(config.get("callbacks")):
+        if isinstance(handler, RequestBudget):
+            return handler
+    return None
+
+
+def with_request_budget(
+    budget_config: Optional[BudgetConfig] = None,
+    config: Optional[RunnableConfig] = None,
+    metrics: Optional[MetricsRecorder] = None,
+) -> RunnableConfig:
+    """
+    Add a new `RequestBudget` to the callbacks of a run config.
+    Use a new config for each request, since the budget accumulates the usage of every run it is passed to.
+
+    Parameters
+    ----------
+    budget_config : Optional[BudgetConfig], optional
+        The limits, by default None, which only tracks usage
+    config : Optional[RunnableConfig], optional
+        The run config to extend, by default None
+    metrics : Optional[MetricsRecorder], optional
+        Where to record budget metrics, by default the process-wide recorder
+
+    Returns
+    -------
+    RunnableConfig
+        A new run config.
+    """
+    config = config or RunnableConfig()
+    budget = RequestBudget.from_config(budget_config or BudgetConfig(), metrics=metrics)
+    callbacks = config.get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        callbacks = callbacks.copy()
+        callbacks.add_handler(budget)
+    else:
+        callbacks = [*(callbacks or []), budget]
+    return RunnableConfig(**{**config, "callbacks": callbacks})  # type: ignore[typeddict-item]
@@ -0,0 +1,145 @@
+"""A compact, Cypher-like rendering of the graph schema for prompts, and prompt token counts."""
+
+import json
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import tiktoken
+from neo4j_graphrag.schema import DISTINCT_VALUE_LIMIT
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def quote_compact_name(name: str) -> str:
+    """Backtick-quote a label, relationship type or property key unless it is a plain Cypher identifier."""
+    if _IDENTIFIER_PATTERN.fullmatch(name):
+        return name
+    return "`" + name.replace("`", "``") + "`"
+
+
+def format_compact_value(value: Any, max_value_length: int = 40) -> str:
+    """Format a sampled property value, cutting it after `max_value_length` characters and quoting strings."""
+    text = " ".join(str(value).split())
+    if len(text) > max_value_length:
+        text = text[:max_value_length] + "..."
+    return json.dumps(text, ensure_ascii=False) if isinstance(value, str) else text
+
+
+def format_compact_value_sample(
+    prop: Dict[str, Any], max_values: int = 5, max_value_length: int = 40
+) -> str:
+    """
+    Format the values sampled for a property of an enhanced schema.
+    Numbers and dates show their range, lists their size range, and strings with few distinct values
+    list them. Other properties show an example value.
+    """
+    if prop.get("min") is not None and prop.get("max") is not None:
+        return f"{format_compact_value(prop['min'], max_value_length)}..{format_compact_value(prop['max'], max_value_length)}"
+    if prop.get("min_size") is not None and prop.get("max_size") is not None:
+        return f"size {prop['min_size']}..{prop['max_size']}"
+    values: List[Any] = prop.get("values") or list()
+    if not values:
+        return ""
+    if (
+        prop["type"] == "STRING"
+        and prop.get("distinct_count", DISTINCT_VALUE_LIMIT + 1) <= DISTINCT_VALUE_LIMIT
+    ):
+        listed = [format_compact_value(value, max_value_length) for value in values[:max_values]]
+        if len(values) > max_values:
+            listed.append("...")
+        return f"in [{', '.join(listed)}]"
+    return f"e.g. {format_compact_value(values[0], max_value_length)}"
+
+
+def format_compact_properties(
+    props: List[Dict[str, Any]],
+    detail: str = "values",
+    max_values: int = 5,
+    max_value_length: int = 40,
+) -> str:
+    """Format the properties of a label or relationship type as a Cypher map, or an empty string if it has none."""
+    formatted: List[str] = list()
+    for prop in props:
+        if detail == "names":
+            formatted.append(quote_compact_name(prop["property"]))
+            continue
+        text = f"{quote_compact_name(prop['property'])}: {prop['type']}"
+        if detail == "values":
+            sample = format_compact_value_sample(prop, max_values, max_value_length)
+            if sample:
+                text = f"{text} {sample}"
+        formatted.append(text)
+    return f" {{{', '.join(formatted)}}}" if formatted else ""
+
+
+def format_compact_schema(
+    structured_schema: Dict[str, Any],
+    detail: str = "values",
+    max_values: int = 5,
+    max_value_length: int = 40,
+) -> str:
+    """
+    Render a structured schema in a terse notation close to Cypher patterns, such as
+
+        Nodes:
+        (:Verbatim {make: STRING in ["Honda", "Acura"], year: INTEGER 1990..2024})
+        Relationships:
+        (:Customer)-[:SUBMITTED {at: DATE}]->(:Verbatim)
+
+    Names that are not plain identifiers are backtick-quoted, as in Cypher.
+
+    Parameters
+    ----------
+    structured_schema : Dict[str, Any]
+        The `structured_schema` of a `Neo4jGraph`.
+    detail : str, optional
+        What to list for each property: `names`, `types`, or `values` for the types and the values sampled
+        by an enhanced schema, by default "values"
+    max_values : int, optional
+        Max values listed for a string property, by default 5
+    max_value_length : int, optional
+        Characters after which a value is cut, by default 40
+
+    Returns
+    -------
+    str
+        The schema formatted for prompts.
+    """
+    rel_props: Dict[str, List[Dict[str, Any]]] = structured_schema.get("rel_props", dict())
+    lines = ["Nodes:"]
+    lines.extend(
+        f"(:{quote_compact_name(label)}{format_compact_properties(props, detail, max_values, max_value_length)})"
+        for label, props in structured_schema.get("node_props", dict()).items()
+    )
+    relationships = structured_schema.get("relationships", list())
+    if relationships:
+        lines.append("Relationships:")
+        lines.extend(
+            f"(:{quote_compact_name(rel['start'])})-[:{quote_compact_name(rel['type'])}"
+            f"{format_compact_properties(rel_props.get(rel['type'], list()), detail, max_values, max_value_length)}"
+            f"]->(:{quote_compact_name(rel['end'])})"
+            for rel in relationships
+        )
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str) -> Optional[tiktoken.Encoding]:
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        # the encoding is downloaded on first use, which fails offline
+        return None
+
+
+def count_tokens(text: str, encoding_name: str = "o200k_base") -> int:
+    """
+    Count the tokens of a text with a tiktoken encoding, by default that of the gpt-4o models.
+    If the encoding can not be loaded, the count is estimated at 4 characters per token.
+    """
+    encoding = _get_encoding(encoding_name)
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text))
@@ -0,0 +1,378 @@
+"""Shared concurrency limits and LLM rate limiting for Neo4j Text2Cypher workflows."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+from langchain_core.runnables import RunnableConfig
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.utils.config import ConcurrencyConfig
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+from neo4j_text2cypher.utils.token_usage import get_token_usage_from_llm_result
+
+T = TypeVar("T")
+
+
+class AsyncLimiter:
+    """
+    An async semaphore that may be shared across event loops and threads.
+
+    `asyncio.Semaphore` binds to the first event loop that waits on it.
+    Streamlit runs each rerun in a fresh event loop, so shared limits need a loop-agnostic primitive.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._waiters: Deque[
+            Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = deque()
+
+    async def acquire(self) -> float:
+        """Acquire a slot, waiting if none are free. Returns the time spent waiting in seconds."""
+        start = time.monotonic()
+        with self._lock:
+            if self._in_use < self.limit and not self._waiters:
+                self._in_use += 1
+                return 0.0
+            loop = asyncio.get_running_loop()
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                elif not waiter.cancelled():
+                    # the slot was handed over just before cancellation
+                    self._release()
+            raise
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next waiter if there is one."""
+        with self._lock:
+            self._release()
+
+    def _release(self) -> None:
+        if self._waiters:
+            loop, waiter = self._waiters.popleft()
+            loop.call_soon_threadsafe(self._wake, waiter)
+        else:
+            self._in_use -= 1
+
+    def _wake(self, waiter: "asyncio.Future[None]") -> None:
+        if waiter.cancelled():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    @property
+    def in_use(self) -> int:
+        """The number of slots currently held."""
+        return self._in_use
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that refills continuously up to `capacity`.
+
+    Consumption may drive the bucket negative, for example when the real cost of a request
+    is only known after it completes. New acquisitions then wait until the debt is repaid.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.refill_per_second,
+        )
+        self._updated_at = now
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Try to take `amount` tokens.
+
+        Returns
+        -------
+        float
+            0 if the tokens were taken, otherwise the estimated seconds until they are available.
+        """
+        with self._lock:
+            self._refill()
+            # never require more than a full bucket, so oversized requests can still proceed
+            required = min(amount, self.capacity)
+            if self._tokens >= required:
+                self._tokens -= amount
+                return 0.0
+            return (required - self._tokens) / self.refill_per_second
+
+    async def acquire(self, amount: float) -> float:
+        """Take `amount` tokens, waiting as needed. Returns the time spent waiting in seconds."""
+        start = time.monotonic()
+        while (wait := self.try_acquire(amount)) > 0:
+            await asyncio.sleep(wait)
+        return time.monotonic() - start
+
+    def consume(self, amount: float) -> None:
+        """Take `amount` tokens without waiting. The bucket may go negative."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+
+class GovernorRateLimiter(BaseRateLimiter):
+    """
+    A LangChain rate limiter enforcing requests-per-minute and tokens-per-minute budgets.
+
+    Token usage is only known once a response arrives, so tokens are charged afterwards
+    by `GovernorUsageCallbackHandler` and later requests wait while the token budget is in debt.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        self.requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60)
+            if requests_per_minute
+            else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+            if tokens_per_minute
+            else None
+        )
+        self.metrics = metrics or get_metrics()
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        start = time.monotonic()
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                self.metrics.observe(
+                    "governor.llm.queue_seconds", time.monotonic() - start
+                )
+                return True
+            if not blocking:
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        start = time.monotonic()
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                self.metrics.observe(
+                    "governor.llm.queue_seconds", time.monotonic() - start
+                )
+                return True
+            if not blocking:
+                return False
+            await asyncio.sleep(wait)
+
+    def _try_acquire(self) -> float:
+        # wait for the token budget to recover before spending a request
+        if self.tokens is not None and (wait := self.tokens.try_acquire(0)) > 0:
+            return wait
+        if self.requests is not None:
+            return self.requests.try_acquire(1)
+        return 0.0
+
+    def charge_tokens(self, amount: int) -> None:
+        """Charge tokens used by a completed request against the tokens-per-minute budget."""
+        if self.tokens is not None:
+            self.tokens.consume(amount)
+
+
+class GovernorUsageCallbackHandler(AsyncCallbackHandler):
+    """Charges the token usage of every completed LLM call to a `GovernorRateLimiter`."""
+
+    def __init__(self, rate_limiter: GovernorRateLimiter) -> None:
+        self.rate_limiter = rate_limiter
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        usage = get_token_usage_from_llm_result(response)
+        self.rate_limiter.charge_tokens(usage["total_tokens"])
+        self.rate_limiter.metrics.increment("governor.llm.requests")
+        self.rate_limiter.metrics.increment(
+            "governor.llm.tokens", usage["total_tokens"]
+        )
+
+
+class ConcurrencyGovernor:
+    """
+    Process-wide limits on in-flight text2cypher subgraphs, Neo4j queries and LLM calls.
+
+    Time spent waiting for each resource is recorded as an observation in the metrics recorder:
+    `governor.subgraph.queue_seconds`, `governor.db.queue_seconds` and `governor.llm.queue_seconds`.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_subgraphs: Optional[int] = None,
+        max_concurrent_queries: Optional[int] = None,
+        llm_requests_per_minute: Optional[int] = None,
+        llm_tokens_per_minute: Optional[int] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        """
+        Initialize the governor. Any limit left as None is unlimited.
+
+        Parameters
+        ----------
+        max_concurrent_subgraphs : Optional[int], optional
+            Max in-flight text2cypher subgraphs, by default None
+        max_concurrent_queries : Optional[int], optional
+            Max in-flight Neo4j queries, by default None
+        llm_requests_per_minute : Optional[int], optional
+            Max LLM requests per minute, by default None
+        llm_tokens_per_minute : Optional[int], optional
+            Max LLM tokens per minute, by default None
+        metrics : Optional[MetricsRecorder], optional
+            Where to record queueing metrics, by default the process-wide recorder
+        """
+        self.metrics = metrics or get_metrics()
+        self._subgraph_limiter = (
+            AsyncLimiter(max_concurrent_subgraphs) if max_concurrent_subgraphs else None
+        )
+        self._db_limiter = (
+            AsyncLimiter(max_concurrent_queries) if max_concurrent_queries else None
+        )
+        self.rate_limiter = (
+            GovernorRateLimiter(
+                requests_per_minute=llm_requests_per_minute,
+                tokens_per_minute=llm_tokens_per_minute,
+                metrics=self.metrics,
+            )
+            if llm_requests_per_minute or llm_tokens_per_minute
+            else None
+        )
+
+    @classmethod
+    def from_config(
+        cls, config: ConcurrencyConfig, metrics: Optional[MetricsRecorder] = None
+    ) -> "ConcurrencyGovernor":
+        """Create a governor from the `concurrency` section of an app config."""
+        return cls(
+            max_concurrent_subgraphs=config.max_concurrent_subgraphs,
+            max_concurrent_queries=config.max_concurrent_queries,
+            llm_requests_per_minute=config.llm_requests_per_minute,
+            llm_tokens_per_minute=config.llm_tokens_per_minute,
+            metrics=metrics,
+        )
+
+    @asynccontextmanager
+    async def _slot(
+        self, limiter: Optional[AsyncLimiter], name: str
+    ) -> AsyncIterator[None]:
+        if limiter is None:
+            yield
+            return
+        waited = await limiter.acquire()
+        self.metrics.observe(f"governor.{name}.queue_seconds", waited)
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    def subgraph_slot(self) -> Any:
+        """Async context manager holding one text2cypher subgraph slot."""
+        return self._slot(self._subgraph_limiter, "subgraph")
+
+    def db_slot(self) -> Any:
+        """Async context manager holding one Neo4j query slot."""
+        return self._slot(self._db_limiter, "db")
+
+    async def run_db(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking database call in a worker thread while holding a query slot."""
+        async with self.db_slot():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    def govern_llm(self, llm: BaseChatModel) -> BaseChatModel:
+        """
+        Get a copy of `llm` that is subject to the requests and tokens per minute limits.
+        Structured output and tool bindings of the returned model are limited too.
+        """
+        if self.rate_limiter is None or llm.rate_limiter is self.rate_limiter:
+            return llm
+        callbacks = llm.callbacks
+        if callbacks is not None and not isinstance(callbacks, list):
+            # a callback manager can not be extended safely, so only rate limit requests
+            return llm.model_copy(update={"rate_limiter": self.rate_limiter})
+        return llm.model_copy(
+            update={
+                "rate_limiter": self.rate_limiter,
+                "callbacks": [
+                    *(callbacks or []),
+                    GovernorUsageCallbackHandler(self.rate_limiter),
+                ],
+            }
+        )
+
+    def limit_subgraph(
+        self, subgraph: Any
+    ) -> Callable[[Any, RunnableConfig], Coroutine[Any, Any, Any]]:
+        """Wrap a compiled subgraph so that each invocation holds a subgraph slot."""
+
+        async def run_subgraph(state: Any, config: RunnableConfig) -> Any:
+            async with self.subgraph_slot():
+                return await subgraph.ainvoke(state, config=config)
+
+        return run_subgraph
+
+
+async def run_db_call(
+    governor: Optional[ConcurrencyGovernor],
+    func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run a blocking database call in a worker thread, under the governor's query limit if there is one.
+    The event loop is never blocked, so concurrent calls without a governor still overlap.
+    """
+    if governor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return await governor.run_db(func, *args, **kwargs)
+
+
+async def query_graph(
+    graph: Neo4jGraph,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    governor: Optional[ConcurrencyGovernor] = None,
+) -> List[Dict[str, Any]]:
+    """Run `graph.query` under the governor's query limit."""
+    return await run_db_call(governor, graph.query, query, params or {})
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 import yaml
 from pydantic import BaseModel, Field
@@ -18,6 +18,61 @@ class Neo4jConfig(BaseModel):
     enhanced_schema: bool = Field(default=True, description="Enable enhanced schema")
 
 
+class SchemaSnapshotConfig(BaseModel):
+    """Configuration of the on-disk graph schema snapshot."""
+
+    enabled: bool = Field(
+        default=False, description="Load the schema from a snapshot at startup"
+    )
+    path: str = Field(
+        default=".cache/schema_snapshot.json", description="JSON snapshot file"
+    )
+    revalidate: bool = Field(
+        default=True,
+        description="Refresh the schema in the background after loading a snapshot",
+    )
+
+
+class SchemaIntrospectionConfig(BaseModel):
+    """Configuration of parallel, incremental schema introspection."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Read the schema with concurrent queries instead of `Neo4jGraph.refresh_schema`",
+    )
+    max_workers: int = Field(default=8, description="Max concurrent schema queries")
+    meta_sample: int = Field(
+        default=1000, description="Nodes sampled per label to find properties"
+    )
+    sample_size: int = Field(
+        default=5,
+        description="Nodes or relationships sampled for value statistics of large labels and types",
+    )
+    exhaustive_limit: int = Field(
+        default=10000,
+        description="Labels and types with fewer elements have statistics computed over all of them",
+    )
+
+
+class SchemaPromptConfig(BaseModel):
+    """Configuration of how the graph schema is rendered in prompts."""
+
+    format: Literal["langchain", "compact"] = Field(
+        default="langchain",
+        description="`langchain` for the schema text of `Neo4jGraph`, `compact` for a terse Cypher-like notation",
+    )
+    detail: Literal["names", "types", "values"] = Field(
+        default="values",
+        description="What the compact schema lists for each property: its name, its type, or its type and sampled values",
+    )
+    max_values: int = Field(
+        default=5, description="Max sampled values listed for a compact property"
+    )
+    max_value_length: int = Field(
+        default=40, description="Characters after which a compact sampled value is cut"
+    )
+
+
 class StreamlitUIConfig(BaseModel):
     """Streamlit UI configuration."""
 
@@ -26,6 +81,9 @@ class StreamlitUIConfig(BaseModel):
     example_questions: List[str] = Field(
         default=[], description="Example questions for the UI"
     )
+    results_page_size: int = Field(
+        default=25, description="Cypher result rows shown per page"
+    )
 
 
 class ExampleQuery(BaseModel):
@@ -45,17 +103,248 @@ class DebugConfig(BaseModel):
     planner: bool = Field(default=False, description="Enable planner debug logging")
 
 
+class ConcurrencyConfig(BaseModel):
+    """Shared concurrency and rate limit configuration. Unset values are unlimited."""
+
+    max_concurrent_subgraphs: Optional[int] = Field(
+        default=None, description="Max in-flight text2cypher subgraphs"
+    )
+    max_concurrent_queries: Optional[int] = Field(
+        default=None, description="Max in-flight Neo4j queries"
+    )
+    llm_requests_per_minute: Optional[int] = Field(
+        default=None, description="Max LLM requests per minute"
+    )
+    llm_tokens_per_minute: Optional[int] = Field(
+        default=None, description="Max LLM tokens per minute"
+    )
+
+
+class CostGateConfig(BaseModel):
+    """Pre-execution cost gate configuration."""
+
+    enabled: bool = Field(default=False, description="Enable the pre-execution gate")
+    max_estimated_rows: Optional[float] = Field(
+        default=10_000_000,
+        description="Max estimated rows for any operator in the EXPLAIN plan",
+    )
+    disallowed_operators: List[str] = Field(
+        default=["CartesianProduct"],
+        description="EXPLAIN plan operators that cause a statement to be rejected",
+    )
+    allow_unbounded_var_length: bool = Field(
+        default=False,
+        description="Allow variable-length patterns without an upper bound",
+    )
+    default_limit: Optional[int] = Field(
+        default=100,
+        description="LIMIT injected into statements that return rows without one",
+    )
+
+
+class FulltextRewriteConfig(BaseModel):
+    """Configuration of rewriting string filters to use full-text indexes."""
+
+    enabled: bool = Field(
+        default=False, description="Narrow string filters with full-text indexes"
+    )
+    wildcard_terms: bool = Field(
+        default=True,
+        description="Also rewrite STARTS WITH filters, matching their last word as a prefix",
+    )
+
+
+class ParameterizationConfig(BaseModel):
+    """Configuration of lifting literals into query parameters before execution."""
+
+    enabled: bool = Field(
+        default=False, description="Replace literals with parameters before execution"
+    )
+    lift_numbers: bool = Field(
+        default=True, description="Replace number literals as well as string literals"
+    )
+
+
+class VerifiedQueryConfig(BaseModel):
+    """Configuration of the store of verified task and Cypher statement pairs."""
+
+    enabled: bool = Field(default=False, description="Reuse verified statements")
+    path: Optional[str] = Field(
+        default=None, description="JSON file the store is persisted to"
+    )
+    max_entries: int = Field(default=1000, description="Max number of stored entries")
+    min_similarity: float = Field(
+        default=0.5, description="Min similarity of a stored task to be a candidate"
+    )
+    top_k: int = Field(default=5, description="Number of candidates to try to fill")
+
+
+class PropertyValueIndexConfig(BaseModel):
+    """Configuration of the sampled index of string property values."""
+
+    enabled: bool = Field(
+        default=False, description="Map filter values to stored values"
+    )
+    path: Optional[str] = Field(
+        default=None, description="JSON file the index is cached in"
+    )
+    sample_size: int = Field(
+        default=10000, description="Max number of nodes per label to sample"
+    )
+    max_values: int = Field(
+        default=200, description="Max distinct values of an indexed property"
+    )
+    min_similarity: float = Field(
+        default=0.8, description="Min similarity ratio of a fuzzy match"
+    )
+
+
+class CheckpointConfig(BaseModel):
+    """Configuration of server-side conversation checkpointing."""
+
+    enabled: bool = Field(
+        default=False, description="Keep conversation state server-side by thread id"
+    )
+    path: str = Field(
+        default=".cache/checkpoints.sqlite",
+        description="SQLite database checkpoints are written to",
+    )
+
+
+class TimeoutConfig(BaseModel):
+    """Deadline configuration in seconds. Unset values have no deadline."""
+
+    request_seconds: Optional[float] = Field(
+        default=None, description="Deadline for a whole workflow run"
+    )
+    query_seconds: Optional[float] = Field(
+        default=None, description="Neo4j transaction timeout"
+    )
+    llm_seconds: Optional[float] = Field(
+        default=None, description="Timeout for a single LLM request"
+    )
+    nodes: Dict[str, float] = Field(
+        default={}, description="Deadlines for individual workflow nodes by name"
+    )
+
+
+class LLMModelConfig(BaseModel):
+    """A chat model, created with LangChain's `init_chat_model`."""
+
+    model: str = Field(default="gpt-4o", description="Model name")
+    provider: str = Field(
+        default="openai",
+        description="LangChain model provider, such as `openai` or `anthropic`. Providers other than OpenAI need their LangChain package",
+    )
+    temperature: float = Field(default=0.0, description="Sampling temperature")
+    timeout_seconds: Optional[float] = Field(
+        default=None,
+        description="Timeout for a single request, by default `timeouts.llm_seconds`",
+    )
+
+
+class LLMConfig(BaseModel):
+    """The chat model of each workflow node."""
+
+    default: LLMModelConfig = Field(
+        default_factory=LLMModelConfig,
+        description="The model of nodes without their own",
+    )
+    nodes: Dict[str, LLMModelConfig] = Field(
+        default={},
+        description="Models for individual nodes by name, such as `guardrails` or `validate_cypher`",
+    )
+
+
+class ModelPrice(BaseModel):
+    """LLM prices in currency units per million tokens."""
+
+    input: float = Field(default=0.0, description="Price of uncached input tokens")
+    cached_input: Optional[float] = Field(
+        default=None,
+        description="Price of cached input tokens, by default the input price",
+    )
+    output: float = Field(default=0.0, description="Price of output tokens")
+
+
+class BudgetConfig(BaseModel):
+    """Per-request token and cost budget. Unset limits are unbounded, but usage is still reported."""
+
+    max_tokens: Optional[int] = Field(
+        default=None, description="Max LLM tokens for one question"
+    )
+    max_cost: Optional[float] = Field(
+        default=None, description="Max LLM cost for one question"
+    )
+    degrade_at: float = Field(
+        default=0.8,
+        description="Share of a limit after which LLM validation, corrections and the summary are cut back",
+    )
+    summary_max_records: int = Field(
+        default=20,
+        description="Records per result passed to the summary once the budget is degraded",
+    )
+    prices: Dict[str, ModelPrice] = Field(
+        default={},
+        description="Prices by model name. A name also matches dated versions of the model",
+    )
+
+
 class UnifiedAppConfig(BaseModel):
     """Unified application configuration combining all settings."""
 
     streamlit_ui: StreamlitUIConfig = Field(description="Streamlit UI settings")
     neo4j: Neo4jConfig = Field(description="Neo4j connection settings")
+    schema_snapshot: SchemaSnapshotConfig = Field(
+        default_factory=SchemaSnapshotConfig, description="Schema snapshot settings"
+    )
+    schema_introspection: SchemaIntrospectionConfig = Field(
+        default_factory=SchemaIntrospectionConfig,
+        description="Schema introspection settings",
+    )
+    schema_prompt: SchemaPromptConfig = Field(
+        default_factory=SchemaPromptConfig, description="Prompt schema settings"
+    )
     example_queries: List[ExampleQuery] = Field(
         default=[], description="Example question-cypher pairs"
     )
     debug: DebugConfig = Field(
         default_factory=DebugConfig, description="Debug logging settings"
     )
+    concurrency: ConcurrencyConfig = Field(
+        default_factory=ConcurrencyConfig,
+        description="Concurrency and rate limit settings",
+    )
+    cost_gate: CostGateConfig = Field(
+        default_factory=CostGateConfig, description="Pre-execution cost gate settings"
+    )
+    fulltext_rewrite: FulltextRewriteConfig = Field(
+        default_factory=FulltextRewriteConfig,
+        description="Full-text index rewrite settings",
+    )
+    parameterization: ParameterizationConfig = Field(
+        default_factory=ParameterizationConfig,
+        description="Literal parameterization settings",
+    )
+    verified_queries: VerifiedQueryConfig = Field(
+        default_factory=VerifiedQueryConfig,
+        description="Verified query store settings",
+    )
+    property_value_index: PropertyValueIndexConfig = Field(
+        default_factory=PropertyValueIndexConfig,
+        description="Property value index settings",
+    )
+    checkpoints: CheckpointConfig = Field(
+        default_factory=CheckpointConfig,
+        description="Conversation checkpointing settings",
+    )
+    timeouts: TimeoutConfig = Field(
+        default_factory=TimeoutConfig, description="Deadline settings"
+    )
+    budget: BudgetConfig = Field(
+        default_factory=BudgetConfig, description="Per-request budget settings"
+    )
+    llm: LLMConfig = Field(default_factory=LLMConfig, description="LLM settings")
 
 
 class ConfigLoader:
@@ -79,8 +368,21 @@ class ConfigLoader:
         # Extract sections
         streamlit_config = self._raw_config.get("streamlit_ui", {})
         neo4j_config = self._raw_config.get("neo4j", {})
+        schema_snapshot_config = self._raw_config.get("schema_snapshot", {})
+        schema_introspection_config = self._raw_config.get("schema_introspection", {})
+        schema_prompt_config = self._raw_config.get("schema_prompt", {})
         example_queries = self._raw_config.get("example_queries", [])
         debug_config = self._raw_config.get("debug", {})
+        concurrency_config = self._raw_config.get("concurrency", {})
+        cost_gate_config = self._raw_config.get("cost_gate", {})
+        fulltext_rewrite_config = self._raw_config.get("fulltext_rewrite", {})
+        parameterization_config = self._raw_config.get("parameterization", {})
+        verified_query_config = self._raw_config.get("verified_queries", {})
+        property_value_index_config = self._raw_config.get("property_value_index", {})
+        checkpoint_config = self._raw_config.get("checkpoints", {})
+        timeout_config = self._raw_config.get("timeouts", {})
+        budget_config = self._raw_config.get("budget", {})
+        llm_config = self._raw_config.get("llm", {})
 
         # Merge Neo4j config with environment variables
         merged_neo4j_config = self._merge_neo4j_config(neo4j_config)
@@ -95,8 +397,25 @@ class ConfigLoader:
         self._unified_config = UnifiedAppConfig(
             streamlit_ui=StreamlitUIConfig(**streamlit_config),
             neo4j=Neo4jConfig(**merged_neo4j_config),
+            schema_snapshot=SchemaSnapshotConfig(**schema_snapshot_config),
+            schema_introspection=SchemaIntrospectionConfig(
+                **schema_introspection_config
+            ),
+            schema_prompt=SchemaPromptConfig(**schema_prompt_config),
             example_queries=parsed_queries,
             debug=DebugConfig(**merged_debug_config),
+            concurrency=ConcurrencyConfig(**concurrency_config),
+            cost_gate=CostGateConfig(**cost_gate_config),
+            fulltext_rewrite=FulltextRewriteConfig(**fulltext_rewrite_config),
+            parameterization=ParameterizationConfig(**parameterization_config),
+            verified_queries=VerifiedQueryConfig(**verified_query_config),
+            property_value_index=PropertyValueIndexConfig(
+                **property_value_index_config
+            ),
+            checkpoints=CheckpointConfig(**checkpoint_config),
+            timeouts=TimeoutConfig(**timeout_config),
+            budget=BudgetConfig(**budget_config),
+            llm=LLMConfig(**llm_config),
         )
 
         return self._unified_config
@@ -162,8 +481,21 @@ class ConfigLoader:
             "password": os.getenv("NEO4J_PASSWORD", config.neo4j.password),
             "database": os.getenv("NEO4J_DATABASE", config.neo4j.database),
             "enhanced_schema": config.neo4j.enhanced_schema,
+            "timeout": config.timeouts.query_seconds,
         }
 
+    def get_schema_snapshot_config(self) -> SchemaSnapshotConfig:
+        """Get schema snapshot configuration."""
+        return self.load_config().schema_snapshot
+
+    def get_schema_introspection_config(self) -> SchemaIntrospectionConfig:
+        """Get schema introspection configuration."""
+        return self.load_config().schema_introspection
+
+    def get_schema_prompt_config(self) -> SchemaPromptConfig:
+        """Get the prompt schema configuration."""
+        return self.load_config().schema_prompt
+
     def get_streamlit_config(self) -> StreamlitUIConfig:
         """Get Streamlit UI configuration."""
         return self.load_config().streamlit_ui
@@ -175,3 +507,43 @@ class ConfigLoader:
     def get_debug_config(self) -> DebugConfig:
         """Get debug configuration."""
         return self.load_config().debug
+
+    def get_concurrency_config(self) -> ConcurrencyConfig:
+        """Get concurrency and rate limit configuration."""
+        return self.load_config().concurrency
+
+    def get_cost_gate_config(self) -> CostGateConfig:
+        """Get pre-execution cost gate configuration."""
+        return self.load_config().cost_gate
+
+    def get_fulltext_rewrite_config(self) -> FulltextRewriteConfig:
+        """Get full-text index rewrite configuration."""
+        return self.load_config().fulltext_rewrite
+
+    def get_parameterization_config(self) -> ParameterizationConfig:
+        """Get literal parameterization configuration."""
+        return self.load_config().parameterization
+
+    def get_verified_query_config(self) -> VerifiedQueryConfig:
+        """Get verified query store configuration."""
+        return self.load_config().verified_queries
+
+    def get_property_value_index_config(self) -> PropertyValueIndexConfig:
+        """Get property value index configuration."""
+        return self.load_config().property_value_index
+
+    def get_checkpoint_config(self) -> CheckpointConfig:
+        """Get conversation checkpointing configuration."""
+        return self.load_config().checkpoints
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        """Get deadline configuration."""
+        return self.load_config().timeouts
+
+    def get_budget_config(self) -> BudgetConfig:
+        """Get per-request budget configuration."""
+        return self.load_config().budget
+
+    def get_llm_config(self) -> LLMConfig:
+        """Get the chat model configuration of each node."""
+        return self.load_config().llm
@@ -0,0 +1,154 @@
+"""Neo4j drivers shared by the graphs of several app configs."""
+
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import neo4j
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+
+DriverKey = Tuple[str, Optional[str], Optional[str], str]
+
+
+def get_driver_key(
+    connection_params: Dict[str, Any], driver_config: Optional[Dict[str, Any]] = None
+) -> DriverKey:
+    """Get the settings that decide whether two graphs can share a driver: the URI, credentials and driver config."""
+    url = connection_params.get("url")
+    if not url:
+        raise ValueError("A Neo4j URI is required. Set `neo4j.uri` or NEO4J_URI.")
+    return (
+        url,
+        connection_params.get("username"),
+        connection_params.get("password"),
+        json.dumps(driver_config or dict(), sort_keys=True, default=str),
+    )
+
+
+class Neo4jDriverPool:
+    """
+    Thread-safe, reference counted Neo4j drivers, one per URI, credentials and driver config.
+
+    A driver holds a connection pool to a DBMS. Graphs of different databases on the same DBMS share it,
+    since the database is chosen per session. A driver is closed once its last graph is closed.
+    """
+
+    def __init__(
+        self,
+        driver_config: Optional[Dict[str, Any]] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        Parameters
+        ----------
+        driver_config : Optional[Dict[str, Any]], optional
+            Keyword arguments of `neo4j.GraphDatabase.driver`, such as `max_connection_pool_size`, by default None
+        metrics : Optional[MetricsRecorder], optional
+            Where to record pool metrics, by default the process-wide recorder
+        """
+        self.driver_config = driver_config or dict()
+        self.metrics = metrics or get_metrics()
+        self._lock = threading.Lock()
+        self._drivers: Dict[DriverKey, neo4j.Driver] = dict()
+        self._references: Dict[DriverKey, int] = dict()
+
+    def acquire(self, connection_params: Dict[str, Any]) -> neo4j.Driver:
+        """
+        Get the driver for the connection settings, opening and verifying it if there is none.
+
+        Parameters
+        ----------
+        connection_params : Dict[str, Any]
+            The `Neo4jGraph` arguments, such as those of `ConfigLoader.get_neo4j_connection_params`.
+
+        Returns
+        -------
+        neo4j.Driver
+            The driver. Release it with `release` once it is no longer used.
+        """
+        key = get_driver_key(connection_params, self.driver_config)
+        with self._lock:
+            driver = self._drivers.get(key)
+            if driver is None:
+                username, password = key[1], key[2]
+                # as in `Neo4jGraph`, empty credentials disable authentication
+                auth = None if username == "" and password == "" else (username, password)
+                driver = neo4j.GraphDatabase.driver(key[0], auth=auth, **self.driver_config)
+                try:
+                    driver.verify_connectivity()
+                except Exception:
+                    driver.close()
+                    raise
+                self._drivers[key] = driver
+                self._references[key] = 0
+                self.metrics.increment("neo4j_pool.drivers_opened")
+            else:
+                self.metrics.increment("neo4j_pool.drivers_shared")
+            self._references[key] += 1
+            return driver
+
+    def release(self, driver: neo4j.Driver) -> None:
+        """Release a driver from `acquire`, closing it if no other graph uses it."""
+        with self._lock:
+            key = next((k for k, d in self._drivers.items() if d is driver), None)
+            if key is None:
+                return
+            self._references[key] -= 1
+            if self._references[key] > 0:
+                return
+            del self._drivers[key]
+            del self._references[key]
+        driver.close()
+        self.metrics.increment("neo4j_pool.drivers_closed")
+
+    def close(self) -> None:
+        """Close every driver, whether or not it is still used."""
+        with self._lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+            self._references.clear()
+        for driver in drivers:
+            driver.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._drivers)
+
+
+class PooledNeo4jGraph(Neo4jGraph):
+    """
+    A `Neo4jGraph` over a driver from a `Neo4jDriverPool` rather than a driver of its own.
+    Closing the graph releases the driver to the pool.
+    """
+
+    def __init__(self, pool: Neo4jDriverPool, connection_params: Dict[str, Any]) -> None:
+        """
+        Take a driver from the pool. The schema is not read.
+
+        Parameters
+        ----------
+        pool : Neo4jDriverPool
+            The pool to take the driver from.
+        connection_params : Dict[str, Any]
+            The `Neo4jGraph` arguments, such as those of `ConfigLoader.get_neo4j_connection_params`.
+        """
+        # `Neo4jGraph.__init__` opens a driver, so only the attributes it sets are set here
+        self._pool = pool
+        self._driver = pool.acquire(connection_params)
+        self._database = connection_params.get("database") or "neo4j"
+        self.timeout = connection_params.get("timeout")
+        self.sanitize = connection_params.get("sanitize", False)
+        self._enhanced_schema = connection_params.get("enhanced_schema", False)
+        self.schema: str = ""
+        self.structured_schema: Dict[str, Any] = dict()
+
+    def close(self) -> None:
+        """Release the driver to the pool."""
+        if hasattr(self, "_driver"):
+            driver = self._driver
+            delattr(self, "_driver")
+            self._pool.release(driver)
@@ -0,0 +1,577 @@
+"""Lightweight text utilities for analysing and rewriting generated Cypher statements."""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_UNION_PATTERN = re.compile(r"\bUNION(\s+ALL)?\b", re.IGNORECASE)
+_LIMIT_PATTERN = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+_RETURN_PATTERN = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_UNBOUNDED_VAR_LENGTH_PATTERN = re.compile(r"\*\s*(\d+\s*)?(\.\.\s*)?\]")
+_BOUNDED_VAR_LENGTH_PATTERN = re.compile(r"\*\s*(\d+\s*)?\.\.\s*\d+\s*\]|\*\s*\d+\s*\]")
+_NUMBER_PATTERN = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?!\w)")
+_PARAMETER_PATTERN = re.compile(r"\$(\w+)")
+# number literals that Cypher requires to be literals
+_VAR_LENGTH_BOUNDS_PATTERN = re.compile(r"\*\s*\d*\s*(?:\.\.\s*\d*)?")
+_QUANTIFIER_PATTERN = re.compile(r"(?<=[)\->])\s*\{\s*\d*\s*(?:,\s*\d*\s*)?\}")
+_SHORTEST_PATTERN = re.compile(r"\bSHORTEST\s+\d+", re.IGNORECASE)
+# number literals kept so that Cypher sees an integer row count, or a slice with both bounds alike
+_ROW_COUNT_PATTERN = re.compile(
+    r"\b(?:SKIP|OFFSET|LIMIT)\s+\d+(?:\.\d+)?(?:[eE][+-]?\d+)?", re.IGNORECASE
+)
+_SLICE_PATTERN = re.compile(r"\[\s*\d*\s*\.\.\s*\d*\s*\]")
+_CLAUSE_PATTERN = re.compile(
+    r"\b(?:WITH|RETURN|OPTIONAL\s+MATCH|MATCH|UNWIND|CALL|ORDER\s+BY|SKIP|LIMIT)\b",
+    re.IGNORECASE,
+)
+_STRING_OPERATOR_PATTERN = re.compile(r"\b(?:STARTS|ENDS)\s+WITH\b", re.IGNORECASE)
+_WHERE_PATTERN = re.compile(r"\bWHERE\b", re.IGNORECASE)
+_NON_CONJUNCTIVE_PATTERN = re.compile(r"\b(?:OR|XOR|NOT)\b|[{}]", re.IGNORECASE)
+_IS_NOT_NULL_PATTERN = re.compile(r"\bIS\s+NOT\s+NULL\b", re.IGNORECASE)
+_TEXT_PREDICATE_PATTERN = re.compile(
+    r"(?<![\w`])(\w+)\.(\w+)\s*(=|STARTS\s+WITH\b)\s*(?=['\"])", re.IGNORECASE
+)
+# values that the standard full-text analyzer splits into the same words as whitespace does
+_FULLTEXT_SAFE_VALUE_PATTERN = re.compile(r"\s*\w+(?:\s+\w+)*\s*")
+_LABELED_NODE_PATTERN = re.compile(r"\(\s*(\w+)\s*:\s*(\w+)")
+# the text before a parameter that compares it with a whole property value
+_PARAMETER_MAP_CONTEXT_PATTERN = re.compile(
+    r"\(\s*\w*\s*:\s*(\w+)[^(){}]*\{[^{}]*?(?<![\w`])(\w+)\s*:\s*$"
+)
+_PARAMETER_COMPARISON_CONTEXT_PATTERN = re.compile(
+    r"(?<![\w`])(\w+)\.(\w+)\s*(?:=|<>|\s+IN\s*\[[^\]]*)\s*$", re.IGNORECASE
+)
+_STRING_ESCAPES = {
+    "\\": "\\",
+    "'": "'",
+    '"': '"',
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+}
+
+
+def mask_cypher_literals(cypher_statement: str) -> str:
+    """
+    Blank out the contents of string literals, backtick-quoted names and comments.
+
+    The masked statement has the same length as the original, so positions found in it
+    may be used to slice the original statement.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+
+    Returns
+    -------
+    str
+        The statement with masked regions replaced by spaces. Quote characters are kept.
+    """
+    masked = list(cypher_statement)
+    idx = 0
+    length = len(cypher_statement)
+    while idx < length:
+        char = cypher_statement[idx]
+        if char in ("'", '"', "`"):
+            end = idx + 1
+            while end < length and cypher_statement[end] != char:
+                # backslash escapes only apply to string literals
+                end += 2 if cypher_statement[end] == "\\" and char != "`" else 1
+            for pos in range(idx + 1, min(end, length)):
+                masked[pos] = " "
+            idx = end + 1
+        elif cypher_statement.startswith("//", idx):
+            end = cypher_statement.find("\n", idx)
+            end = length if end == -1 else end
+            for pos in range(idx, end):
+                masked[pos] = " "
+            idx = end
+        elif cypher_statement.startswith("/*", idx):
+            end = cypher_statement.find("*/", idx + 2)
+            end = length if end == -1 else end + 2
+            for pos in range(idx, end):
+                masked[pos] = " "
+            idx = end
+        else:
+            idx += 1
+    return "".join(masked)
+
+
+def split_cypher_union(cypher_statement: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a Cypher statement on top level `UNION` / `UNION ALL` keywords.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        The statement parts and the union keywords between them.
+    """
+    masked = mask_cypher_literals(cypher_statement)
+    parts: List[str] = []
+    unions: List[str] = []
+    start = 0
+    for match in _UNION_PATTERN.finditer(masked):
+        parts.append(cypher_statement[start : match.start()])
+        unions.append(cypher_statement[match.start() : match.end()])
+        start = match.end()
+    parts.append(cypher_statement[start:])
+    return parts, unions
+
+
+def strip_cypher_statement(cypher_statement: str) -> str:
+    """Remove surrounding whitespace and trailing semicolons from a Cypher statement."""
+    return cypher_statement.strip().rstrip(";").rstrip()
+
+
+def cypher_query_returns_rows(cypher_statement: str) -> bool:
+    """Whether the Cypher statement has a `RETURN` clause anywhere outside of string literals, including in subqueries."""
+    return _RETURN_PATTERN.search(mask_cypher_literals(cypher_statement)) is not None
+
+
+def cypher_query_has_final_limit(cypher_statement: str) -> bool:
+    """Whether the final `RETURN` clause of every union part has a `LIMIT`."""
+    parts, _ = split_cypher_union(cypher_statement)
+    for part in parts:
+        masked = mask_cypher_literals(part)
+        returns = list(_RETURN_PATTERN.finditer(masked))
+        if not returns or not _LIMIT_PATTERN.search(masked, returns[-1].end()):
+            return False
+    return True
+
+
+def enforce_cypher_query_limit(cypher_statement: str, limit: int) -> str:
+    """
+    Add a `LIMIT` to a Cypher statement that returns rows without one.
+
+    Union statements are wrapped in a `CALL` subquery so the limit applies to the combined result.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    limit : int
+        The max number of rows to return.
+
+    Returns
+    -------
+    str
+        The limited statement, or the original statement if no limit is required.
+    """
+    if not cypher_query_returns_rows(cypher_statement) or cypher_query_has_final_limit(
+        cypher_statement
+    ):
+        return cypher_statement
+
+    statement = strip_cypher_statement(cypher_statement)
+    _, unions = split_cypher_union(statement)
+    if unions:
+        return f"CALL {{\n{statement}\n}}\nRETURN *\nLIMIT {limit}"
+    return f"{statement}\nLIMIT {limit}"
+
+
+def find_unbounded_var_length_patterns(cypher_statement: str) -> List[str]:
+    """
+    Find variable-length relationship patterns without an upper bound, such as `[*]` or `[:R*2..]`.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+
+    Returns
+    -------
+    List[str]
+        The unbounded relationship patterns.
+    """
+    masked = mask_cypher_literals(cypher_statement)
+    found = []
+    for match in _UNBOUNDED_VAR_LENGTH_PATTERN.finditer(masked):
+        if _BOUNDED_VAR_LENGTH_PATTERN.fullmatch(match.group(0)):
+            continue
+        start = masked.rfind("[", 0, match.start())
+        found.append(cypher_statement[start if start != -1 else match.start() : match.end()])
+    return found
+
+
+def _decode_cypher_string(body: str) -> Optional[str]:
+    """Decode the body of a Cypher string literal, or return None if it has an unsupported escape."""
+    decoded = []
+    idx = 0
+    while idx < len(body):
+        char = body[idx]
+        if char != "\\":
+            decoded.append(char)
+            idx += 1
+            continue
+        escape = body[idx + 1 : idx + 2]
+        if escape in _STRING_ESCAPES:
+            decoded.append(_STRING_ESCAPES[escape])
+            idx += 2
+        elif escape == "u" and re.fullmatch(r"[0-9a-fA-F]{4}", body[idx + 2 : idx + 6]):
+            decoded.append(chr(int(body[idx + 2 : idx + 6], 16)))
+            idx += 6
+        else:
+            return None
+    return "".join(decoded)
+
+
+def _find_string_literals(cypher_statement: str) -> List[Tuple[int, int]]:
+    """Find the spans of string literals, including their quotes."""
+    spans = []
+    masked = mask_cypher_literals(cypher_statement)
+    idx = 0
+    length = len(masked)
+    while idx < length:
+        char = masked[idx]
+        if char in ("'", '"', "`"):
+            end = masked.find(char, idx + 1)
+            end = length - 1 if end == -1 else end
+            if char != "`":
+                spans.append((idx, end + 1))
+            idx = end + 1
+        else:
+            idx += 1
+    return spans
+
+
+def _find_required_number_literals(masked_statement: str) -> List[Tuple[int, int]]:
+    """
+    Find spans holding numbers that are not replaced by parameters: var-length bounds and path quantifiers,
+    which must be literals, and `SKIP`/`LIMIT` counts and slice bounds.
+    """
+    spans = []
+    for match in _VAR_LENGTH_BOUNDS_PATTERN.finditer(masked_statement):
+        # only a `*` inside a relationship pattern starts var-length bounds
+        if masked_statement.rfind("[", 0, match.start()) > masked_statement.rfind(
+            "]", 0, match.start()
+        ):
+            spans.append((match.start(), match.end()))
+    for pattern in (_QUANTIFIER_PATTERN, _SHORTEST_PATTERN, _ROW_COUNT_PATTERN, _SLICE_PATTERN):
+        spans.extend((match.start(), match.end()) for match in pattern.finditer(masked_statement))
+    return spans
+
+
+def parameterize_cypher_literals(
+    cypher_statement: str, lift_numbers: bool = True, prefix: str = "p"
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Replace string and number literals in a Cypher statement with parameters.
+
+    Statements that differ only in literal values become identical, so Neo4j can reuse a cached plan.
+    Numbers that Cypher requires to be literals, such as variable-length bounds and path quantifiers, are kept,
+    as are `SKIP` and `LIMIT` counts, which a float such as `1e3` would turn into an invalid parameter,
+    and slice bounds such as `[0..2]`.
+    Parameters are named by position, `$p0`, `$p1`, and so on, skipping names the statement already uses.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    lift_numbers : bool, optional
+        Whether to replace number literals as well as string literals, by default True
+    prefix : str, optional
+        The prefix of the parameter names, by default "p"
+
+    Returns
+    -------
+    Tuple[str, Dict[str, Any]]
+        The parameterized statement and the parameter values by name.
+    """
+    masked = mask_cypher_literals(cypher_statement)
+    existing_names = set(_PARAMETER_PATTERN.findall(masked))
+
+    literals: List[Tuple[int, int, Any]] = []
+    for start, end in _find_string_literals(cypher_statement):
+        value = _decode_cypher_string(cypher_statement[start + 1 : end - 1])
+        if value is not None:
+            literals.append((start, end, value))
+
+    if lift_numbers:
+        required = _find_required_number_literals(masked)
+        for match in _NUMBER_PATTERN.finditer(masked):
+            if any(start <= match.start() < end for start, end in required):
+                continue
+            text = match.group(0)
+            number: Any = float(text) if any(c in text for c in ".eE") else int(text)
+            if isinstance(number, int) and number >= 2**63:
+                continue
+            literals.append((match.start(), match.end(), number))
+
+    parameters: Dict[str, Any] = {}
+    parts = []
+    position = 0
+    counter = 0
+    for start, end, value in sorted(literals, key=lambda literal: literal[0]):
+        while f"{prefix}{counter}" in existing_names:
+            counter += 1
+        name = f"{prefix}{counter}"
+        counter += 1
+        parameters[name] = value
+        parts.append(cypher_statement[position:start])
+        parts.append(f"${name}")
+        position = end
+    parts.append(cypher_statement[position:])
+
+    return "".join(parts), parameters
+
+
+def render_cypher_string(value: str, quote: str = '"') -> str:
+    """Render a value as a Cypher string literal."""
+    escaped = value.replace("\\", "\\\\").replace(quote, f"\\{quote}")
+    return f"{quote}{escaped}{quote}"
+
+
+def render_cypher_literal(value: Any) -> str:
+    """Render a string, number, boolean or null parameter value as a Cypher literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return render_cypher_string(value)
+    if isinstance(value, float):
+        # Cypher exponents take no plus sign
+        return repr(value).replace("e+", "e")
+    if isinstance(value, int):
+        return str(value)
+    raise ValueError(f"Can not render {type(value).__name__} values as Cypher literals.")
+
+
+def inline_cypher_parameters(cypher_statement: str, parameters: Dict[str, Any]) -> str:
+    """
+    Replace parameters with their values rendered as literals, the reverse of `parameterize_cypher_literals`.
+    Parameters without a value are kept.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    parameters : Dict[str, Any]
+        The parameter values by name.
+
+    Returns
+    -------
+    str
+        The statement with inlined values.
+    """
+    masked = mask_cypher_literals(cypher_statement)
+    parts = []
+    position = 0
+    for match in _PARAMETER_PATTERN.finditer(masked):
+        name = match.group(1)
+        if name not in parameters:
+            continue
+        parts.append(cypher_statement[position : match.start()])
+        parts.append(render_cypher_literal(parameters[name]))
+        position = match.end()
+    parts.append(cypher_statement[position:])
+    return "".join(parts)
+
+
+def find_cypher_parameter_properties(cypher_statement: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Find the node property each parameter is compared with as a whole value,
+    in `{key: $p0}`, `n.key = $p0`, `n.key <> $p0` and `n.key IN [..., $p0]`.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+
+    Returns
+    -------
+    Dict[str, Tuple[str, str]]
+        The label and property key by parameter name.
+        Parameters used elsewhere, or with a variable whose label is not in the statement, are left out.
+    """
+    masked = mask_cypher_literals(cypher_statement)
+    labels: Dict[str, str] = {}
+    for match in _LABELED_NODE_PATTERN.finditer(masked):
+        labels.setdefault(match.group(1), match.group(2))
+
+    properties: Dict[str, Tuple[str, str]] = {}
+    for match in _PARAMETER_PATTERN.finditer(masked):
+        context = masked[: match.start()]
+        in_map = _PARAMETER_MAP_CONTEXT_PATTERN.search(context)
+        if in_map is not None:
+            properties[match.group(1)] = (in_map.group(1), in_map.group(2))
+            continue
+        compared = _PARAMETER_COMPARISON_CONTEXT_PATTERN.search(context)
+        if compared is not None and compared.group(1) in labels:
+            properties[match.group(1)] = (labels[compared.group(1)], compared.group(2))
+    return properties
+
+
+def replace_cypher_property_value(
+    cypher_statement: str, property_key: str, value: str, replacement: str
+) -> str:
+    """
+    Replace a string literal that a property is compared with.
+
+    Only literals in `.key = 'value'`, `.key <> 'value'`, `{key: 'value'}` and `.key IN [..., 'value']`
+    are replaced, so the same text used elsewhere, such as in a `CONTAINS` predicate, is kept.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    property_key : str
+        The property key.
+    value : str
+        The value to replace.
+    replacement : str
+        The new value.
+
+    Returns
+    -------
+    str
+        The statement with the literals replaced.
+    """
+    key = re.escape(property_key)
+    comparison = re.compile(rf"(?<![\w`])`?{key}`?\s*(?:=|<>|:)\s*$")
+    membership = re.compile(rf"(?<![\w`])`?{key}`?\s+IN\s*\[[^\]]*$", re.IGNORECASE)
+
+    parts = []
+    position = 0
+    for start, end in _find_string_literals(cypher_statement):
+        if _decode_cypher_string(cypher_statement[start + 1 : end - 1]) != value:
+            continue
+        context = cypher_statement[:start]
+        if not (comparison.search(context) or membership.search(context)):
+            continue
+        parts.append(cypher_statement[position:start])
+        parts.append(render_cypher_string(replacement, cypher_statement[start]))
+        position = end
+    parts.append(cypher_statement[position:])
+    return "".join(parts)
+
+
+def rewrite_cypher_text_predicates_to_fulltext(
+    cypher_statement: str,
+    fulltext_indexes: List[Dict[str, Any]],
+    wildcard_terms: bool = True,
+) -> str:
+    """
+    Narrow equality and `STARTS WITH` filters on full-text indexed properties with a full-text index lookup.
+
+    In the first `MATCH ... WHERE` of each union part, string predicates on an indexed label and property
+    are turned into a Lucene query. A `CALL db.index.fulltext.queryNodes(...) YIELD node` clause is inserted
+    before the `MATCH` to bind the variable to the matching nodes, so only those nodes are scanned.
+    The original predicates are kept to filter the nodes found.
+
+    The lookup finds every node the predicate matches only if the value is made of whole words.
+    An equal value is matched as a phrase. A `STARTS WITH` value is matched by its words, the last as a prefix,
+    such as `cup hol*`. `CONTAINS` filters are not rewritten, since a substring may start inside a word,
+    such as "cup" in "teacup", which no word or prefix query finds. Values with punctuation are not rewritten either,
+    since the analyzer may not split them into the same words. The index is assumed to use an analyzer without
+    stop words or stemming, such as the default `standard-no-stop-words`.
+    Only `WHERE` clauses that are a conjunction of predicates are rewritten.
+
+    Parameters
+    ----------
+    cypher_statement : str
+        The Cypher statement.
+    fulltext_indexes : List[Dict[str, Any]]
+        The full-text indexes, each with a `name` and the `labels` and `properties` it covers.
+    wildcard_terms : bool, optional
+        Whether to rewrite `STARTS WITH` filters, which match their last word as a prefix, by default True
+        If False, only equality filters are rewritten.
+
+    Returns
+    -------
+    str
+        The rewritten statement, or the original statement if nothing could be rewritten.
+    """
+    if not fulltext_indexes:
+        return cypher_statement
+    parts, unions = split_cypher_union(cypher_statement)
+    rewritten = [
+        _rewrite_first_match_to_fulltext(part, fulltext_indexes, wildcard_terms)
+        for part in parts
+    ]
+    return "".join(
+        part + (unions[idx] if idx < len(unions) else "")
+        for idx, part in enumerate(rewritten)
+    )
+
+
+def _rewrite_first_match_to_fulltext(
+    cypher_statement: str,
+    fulltext_indexes: List[Dict[str, Any]],
+    wildcard_terms: bool,
+) -> str:
+    masked = mask_cypher_literals(cypher_statement)
+    match = re.match(r"\s*MATCH\b", masked, re.IGNORECASE)
+    if match is None:
+        return cypher_statement
+    # the WITH of STARTS WITH and ENDS WITH does not start a clause
+    clauses = _STRING_OPERATOR_PATTERN.sub(lambda m: " " * len(m.group(0)), masked)
+    clause = _CLAUSE_PATTERN.search(clauses, match.end())
+    clause_end = clause.start() if clause is not None else len(masked)
+    where = _WHERE_PATTERN.search(masked, match.end(), clause_end)
+    if where is None or _NON_CONJUNCTIVE_PATTERN.search(
+        _IS_NOT_NULL_PATTERN.sub("", masked[where.end() : clause_end])
+    ):
+        return cypher_statement
+
+    pattern = cypher_statement[match.end() : where.start()]
+    literals = dict(_find_string_literals(cypher_statement))
+    lucene_clauses: Dict[Tuple[str, str], List[str]] = {}
+    for predicate in _TEXT_PREDICATE_PATTERN.finditer(masked, where.end(), clause_end):
+        variable, property_key = predicate.group(1), predicate.group(2)
+        is_prefix = predicate.group(3) != "="
+        literal_end = literals.get(predicate.end())
+        if literal_end is None or (is_prefix and not wildcard_terms):
+            continue
+        value = _decode_cypher_string(
+            cypher_statement[predicate.end() + 1 : literal_end - 1]
+        )
+        labels = re.search(
+            rf"\(\s*{re.escape(variable)}\s*((?::\s*`?\w+`?\s*)+)", pattern
+        )
+        if (
+            labels is None
+            or value is None
+            or not _FULLTEXT_SAFE_VALUE_PATTERN.fullmatch(value)
+        ):
+            continue
+        terms = value.lower().split()
+        variable_labels = set(re.findall(r"\w+", labels.group(1)))
+        for index in fulltext_indexes:
+            if (
+                variable_labels & set(index["labels"])
+                and property_key in index["properties"]
+            ):
+                if not is_prefix:
+                    clause_text = f'"{" ".join(terms)}"'
+                elif value[-1].isspace():
+                    # the last word of the value is complete
+                    clause_text = " AND ".join(terms)
+                else:
+                    clause_text = " AND ".join([*terms[:-1], f"{terms[-1]}*"])
+                lucene_clauses.setdefault((variable, index["name"]), list()).append(
+                    clause_text
+                )
+                break
+
+    if not lucene_clauses:
+        return cypher_statement
+    # bind only the first variable, extra index lookups would be joined as a cartesian product
+    (variable, index_name), clauses = next(iter(lucene_clauses.items()))
+    lucene_query = " AND ".join(
+        f"({clause})" if len(clauses) > 1 else clause for clause in clauses
+    )
+    index_lookup = (
+        f"CALL db.index.fulltext.queryNodes("
+        f"{render_cypher_string(index_name)}, {render_cypher_string(lucene_query)}"
+        f") YIELD node AS {variable}\n"
+    )
+    start = len(cypher_statement) - len(cypher_statement.lstrip())
+    return cypher_statement[:start] + index_lookup + cypher_statement[start:]
@@ -0,0 +1,94 @@
+"""Chat models for the nodes of Text2Cypher workflows."""
+
+from typing import Dict, Optional, Tuple
+
+from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+
+from neo4j_text2cypher.utils.config import LLMConfig, LLMModelConfig
+
+# the workflow nodes that call an LLM
+LLM_NODES = (
+    "guardrails",
+    "planner",
+    "generate_cypher",
+    "validate_cypher",
+    "correct_cypher",
+    "summarize",
+)
+
+
+def create_chat_model(
+    config: LLMModelConfig, timeout: Optional[float] = None
+) -> BaseChatModel:
+    """
+    Create a chat model.
+
+    Parameters
+    ----------
+    config : LLMModelConfig
+        The model, provider and settings.
+    timeout : Optional[float], optional
+        The request timeout in seconds if the model has none, by default None
+
+    Returns
+    -------
+    BaseChatModel
+        The chat model.
+    """
+    return init_chat_model(
+        config.model,
+        model_provider=config.provider,
+        temperature=config.temperature,
+        timeout=config.timeout_seconds if config.timeout_seconds is not None else timeout,
+    )
+
+
+def create_node_llms(
+    config: LLMConfig,
+    timeout: Optional[float] = None,
+    clients: Optional[Dict[str, BaseChatModel]] = None,
+) -> Tuple[BaseChatModel, Dict[str, BaseChatModel]]:
+    """
+    Create the chat models of the `llm` section of an app config.
+    Nodes with the same model settings share one client.
+
+    Parameters
+    ----------
+    config : LLMConfig
+        The default model and the models of individual nodes.
+    timeout : Optional[float], optional
+        The request timeout in seconds of models without their own, by default None
+    clients : Optional[Dict[str, BaseChatModel]], optional
+        Clients by their settings to reuse and add to, by default None
+        Pass the same dictionary for several app configs to share clients between them.
+
+    Returns
+    -------
+    Tuple[BaseChatModel, Dict[str, BaseChatModel]]
+        The default model, and the models of nodes with their own by node name.
+        Pass them to `create_neo4j_text2cypher_workflow` as `llm` and `node_llms`.
+
+    Raises
+    ------
+    ValueError
+        If a node does not call an LLM.
+    """
+    unknown = set(config.nodes) - set(LLM_NODES)
+    if unknown:
+        raise ValueError(
+            f"Unknown nodes in the llm config: {sorted(unknown)}. Expected any of {list(LLM_NODES)}."
+        )
+
+    shared_clients = clients if clients is not None else dict()
+
+    def get_client(model_config: LLMModelConfig) -> BaseChatModel:
+        key = f"{model_config.model_dump_json()} timeout={timeout}"
+        if key not in shared_clients:
+            shared_clients[key] = create_chat_model(model_config, timeout)
+        return shared_clients[key]
+
+    default = get_client(config.default)
+    return default, {
+        node: get_client(model_config) for node, model_config in config.nodes.items()
+    }
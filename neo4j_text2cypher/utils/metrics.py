@@ -0,0 +1,92 @@
+"""Lightweight in-process metrics for Neo4j Text2Cypher components."""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class MetricsRecorder:
+    """
+    Thread-safe collection of counters and timing observations.
+
+    Counters are monotonically increasing integers.
+    Observations keep a count, total, min and max so that averages may be derived,
+    and a window of the most recent values so that quantiles may be estimated.
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._observations: Dict[str, Dict[str, float]] = {}
+        self._window = window
+        self._recent: Dict[str, Deque[float]] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment the counter `name` by `value`."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a single observation, such as a latency in seconds, for `name`."""
+        with self._lock:
+            self._recent.setdefault(name, deque(maxlen=self._window)).append(value)
+            observation = self._observations.get(name)
+            if observation is None:
+                self._observations[name] = {
+                    "count": 1,
+                    "total": value,
+                    "min": value,
+                    "max": value,
+                }
+            else:
+                observation["count"] += 1
+                observation["total"] += value
+                observation["min"] = min(observation["min"], value)
+                observation["max"] = max(observation["max"], value)
+
+    def get_counter(self, name: str) -> int:
+        """Get the current value of the counter `name`."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_observation(self, name: str) -> Optional[Dict[str, float]]:
+        """Get a copy of the observation summary for `name`, if any were recorded."""
+        with self._lock:
+            observation = self._observations.get(name)
+            if observation is None:
+                return None
+            return {**observation, "mean": observation["total"] / observation["count"]}
+
+    def get_quantile(self, name: str, quantile: float) -> Optional[float]:
+        """Estimate a quantile, such as 0.9, of the recent observations of `name`, if any were recorded."""
+        with self._lock:
+            recent = sorted(self._recent.get(name, ()))
+        if not recent:
+            return None
+        return recent[min(len(recent) - 1, int(quantile * len(recent)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of all counters and observation summaries."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "observations": {
+                    name: {**obs, "mean": obs["total"] / obs["count"]}
+                    for name, obs in self._observations.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._observations.clear()
+            self._recent.clear()
+
+
+_default_metrics = MetricsRecorder()
+
+
+def get_metrics() -> MetricsRecorder:
+    """Get the process-wide default metrics recorder."""
+    return _default_metrics
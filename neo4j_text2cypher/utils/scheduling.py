@@ -0,0 +1,60 @@
+"""Deadline-aware scheduling of Text2Cypher nodes from their observed latency."""
+
+import time
+from typing import Optional, Sequence
+
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+
+# the observation holding the duration of each node run
+NODE_LATENCY_METRIC = "nodes.{node}.seconds"
+
+
+def get_deadline(seconds: Optional[float]) -> Optional[float]:
+    """Get the wall clock time `seconds` from now, or None if there is no deadline."""
+    return time.time() + seconds if seconds is not None else None
+
+
+def estimate_seconds(
+    nodes: Sequence[str],
+    quantile: float = 0.9,
+    metrics: Optional[MetricsRecorder] = None,
+) -> float:
+    """
+    Estimate how long running the nodes in sequence takes, from a quantile of their recent durations.
+    Nodes that have not been observed yet are estimated to take no time.
+    """
+    metrics = metrics or get_metrics()
+    return sum(
+        metrics.get_quantile(NODE_LATENCY_METRIC.format(node=node), quantile) or 0.0
+        for node in nodes
+    )
+
+
+def fits_before_deadline(
+    deadline: Optional[float],
+    nodes: Sequence[str],
+    quantile: float = 0.9,
+    metrics: Optional[MetricsRecorder] = None,
+) -> bool:
+    """
+    Check whether the nodes are expected to finish before a deadline.
+
+    Parameters
+    ----------
+    deadline : Optional[float]
+        The wall clock deadline, as from `get_deadline`. None always fits.
+    nodes : Sequence[str]
+        The names of the nodes that would run, such as `["correct_cypher", "validate_cypher", "execute_cypher"]`.
+    quantile : float, optional
+        The quantile of the observed durations of each node to plan for, by default 0.9
+    metrics : Optional[MetricsRecorder], optional
+        Where node durations are observed, by default the process-wide recorder
+
+    Returns
+    -------
+    bool
+        Whether the nodes are expected to finish in time.
+    """
+    if deadline is None:
+        return True
+    return time.time() + estimate_seconds(nodes, quantile, metrics) <= deadline
@@ -0,0 +1,254 @@
+"""Parallel, incremental graph schema introspection."""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_neo4j import Neo4jGraph
+from neo4j.exceptions import ClientError, CypherTypeError
+from neo4j_graphrag.schema import (
+    BASE_ENTITY_LABEL,
+    BASE_KG_BUILDER_LABEL,
+    EXCLUDED_LABELS,
+    EXCLUDED_RELS,
+    INDEX_QUERY,
+    NODE_PROPERTIES_QUERY,
+    REL_PROPERTIES_QUERY,
+    REL_QUERY,
+    SCHEMA_COUNTS_QUERY,
+    format_schema,
+    get_enhanced_schema_cypher,
+    query_database,
+)
+
+from neo4j_text2cypher.utils.config import SchemaIntrospectionConfig
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+
+
+def _property_signature(properties: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    return sorted((prop["property"], prop["type"]) for prop in properties)
+
+
+def _enhance_properties(
+    graph: Neo4jGraph,
+    structured_schema: Dict[str, Any],
+    name: str,
+    count: int,
+    is_relationship: bool,
+    config: SchemaIntrospectionConfig,
+) -> None:
+    """
+    Add value statistics to the properties of one node label or relationship type.
+    This follows `neo4j_graphrag.schema.enhance_properties` with configurable sampling.
+    """
+    props = structured_schema["rel_props" if is_relationship else "node_props"].get(
+        name
+    )
+    if not props:
+        return
+    enhanced_cypher = get_enhanced_schema_cypher(
+        driver=graph._driver,
+        structured_schema=structured_schema,
+        label_or_type=name,
+        properties=props,
+        exhaustive=count < config.exhaustive_limit,
+        sample_size=config.sample_size,
+        is_relationship=is_relationship,
+        database=graph._database,
+        timeout=graph.timeout,
+        sanitize=graph.sanitize,
+    )
+    try:
+        enhanced_info = query_database(
+            driver=graph._driver,
+            query=enhanced_cypher,
+            session_params=(
+                {"notifications_disabled_categories": ["UNRECOGNIZED"]}
+                if not is_relationship
+                else {}
+            ),
+            database=graph._database,
+            timeout=graph.timeout,
+            sanitize=graph.sanitize,
+        )[0]["output"]
+    except CypherTypeError:
+        return
+    for prop in props:
+        if prop["property"] in enhanced_info:
+            prop.update(enhanced_info[prop["property"]])
+
+
+def introspect_schema(
+    graph: Neo4jGraph,
+    config: Optional[SchemaIntrospectionConfig] = None,
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Read the structured schema of a graph, running the introspection queries concurrently.
+
+    The result has the shape of `Neo4jGraph.structured_schema`. With an enhanced schema,
+    `metadata.counts` also holds the node and relationship counts the statistics were sampled at.
+    Labels and relationship types whose count and properties are unchanged since `previous` keep their previous statistics
+    instead of being sampled again. Value changes that leave counts unchanged are therefore not picked up.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper. Its schema is not modified.
+    config : Optional[SchemaIntrospectionConfig], optional
+        The sampling and concurrency settings, by default None
+    previous : Optional[Dict[str, Any]], optional
+        A structured schema from an earlier introspection, by default None
+
+    Returns
+    -------
+    Dict[str, Any]
+        The structured schema.
+    """
+    config = config or SchemaIntrospectionConfig()
+    excluded_labels = EXCLUDED_LABELS + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
+
+    def run(query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return query_database(
+            driver=graph._driver,
+            query=query,
+            params=params or {},
+            database=graph._database,
+            timeout=graph.timeout,
+            sanitize=graph.sanitize,
+        )
+
+    def run_metadata(query: str) -> List[Dict[str, Any]]:
+        # constraints and indexes may not be visible to the user
+        try:
+            return run(query)
+        except ClientError:
+            return []
+
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        node_properties = executor.submit(
+            run,
+            NODE_PROPERTIES_QUERY,
+            {"EXCLUDED_LABELS": excluded_labels, "SAMPLE": config.meta_sample},
+        )
+        rel_properties = executor.submit(
+            run,
+            REL_PROPERTIES_QUERY,
+            {"EXCLUDED_LABELS": EXCLUDED_RELS, "SAMPLE": config.meta_sample},
+        )
+        relationships = executor.submit(
+            run,
+            REL_QUERY,
+            {"EXCLUDED_LABELS": excluded_labels, "SAMPLE": config.meta_sample},
+        )
+        constraint = executor.submit(run_metadata, "SHOW CONSTRAINTS")
+        index = executor.submit(run_metadata, INDEX_QUERY)
+        schema_counts = (
+            executor.submit(run, SCHEMA_COUNTS_QUERY)
+            if getattr(graph, "_enhanced_schema", False)
+            else None
+        )
+
+        structured_schema: Dict[str, Any] = {
+            "node_props": {
+                el["output"]["label"]: el["output"]["properties"]
+                for el in node_properties.result()
+            },
+            "rel_props": {
+                el["output"]["type"]: el["output"]["properties"]
+                for el in rel_properties.result()
+            },
+            "relationships": [el["output"] for el in relationships.result()],
+            "metadata": {"constraint": constraint.result(), "index": index.result()},
+        }
+        if schema_counts is None:
+            return structured_schema
+
+        counts = schema_counts.result()[0]
+        structured_schema["metadata"]["counts"] = {
+            "nodes": {el["name"]: el["count"] for el in counts["nodes"]},
+            "relationships": {
+                el["name"]: el["count"] for el in counts["relationships"]
+            },
+        }
+
+        previous_counts = (previous or dict()).get("metadata", dict()).get("counts", dict())
+        sampled = []
+        reused = 0
+        for is_relationship, kind, props_key, excluded in (
+            (False, "nodes", "node_props", EXCLUDED_LABELS),
+            (True, "relationships", "rel_props", EXCLUDED_RELS),
+        ):
+            previous_props = (previous or dict()).get(props_key, dict())
+            for name, count in structured_schema["metadata"]["counts"][kind].items():
+                props = structured_schema[props_key].get(name)
+                if name in excluded or not props:
+                    continue
+                if (
+                    previous_counts.get(kind, dict()).get(name) == count
+                    and name in previous_props
+                    and _property_signature(previous_props[name])
+                    == _property_signature(props)
+                ):
+                    structured_schema[props_key][name] = copy.deepcopy(
+                        previous_props[name]
+                    )
+                    reused += 1
+                    continue
+                sampled.append(
+                    executor.submit(
+                        _enhance_properties,
+                        graph,
+                        structured_schema,
+                        name,
+                        count,
+                        is_relationship,
+                        config,
+                    )
+                )
+        for future in sampled:
+            future.result()
+
+    metrics = get_metrics()
+    metrics.increment("schema_introspection.sampled", len(sampled))
+    metrics.increment("schema_introspection.reused", reused)
+    get_validation_logger().debug(
+        f"🔍 SCHEMA INTROSPECTION DEBUG - Sampled {len(sampled)} labels and types, reused {reused}"
+    )
+    return structured_schema
+
+
+def refresh_graph_schema(
+    graph: Neo4jGraph,
+    config: Optional[SchemaIntrospectionConfig] = None,
+    previous: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Refresh the schema of a graph, like `Neo4jGraph.refresh_schema`.
+
+    If the introspection engine is disabled, `Neo4jGraph.refresh_schema` is used.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    config : Optional[SchemaIntrospectionConfig], optional
+        The introspection configuration, by default None
+    previous : Optional[Dict[str, Any]], optional
+        A structured schema whose statistics may be reused, by default the current schema of the graph
+    """
+    if config is None or not config.enabled:
+        graph.refresh_schema()
+        return
+
+    structured_schema = introspect_schema(
+        graph,
+        config=config,
+        previous=previous if previous is not None else graph.structured_schema,
+    )
+    schema = format_schema(
+        schema=structured_schema, is_enhanced=getattr(graph, "_enhanced_schema", False)
+    )
+    graph.structured_schema = structured_schema
+    graph.schema = schema
@@ -0,0 +1,211 @@
+"""On-disk snapshots of the graph schema for fast startup."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from langchain_neo4j import Neo4jGraph
+from neo4j_graphrag.schema import format_schema
+
+from neo4j_text2cypher.utils.config import (
+    SchemaIntrospectionConfig,
+    SchemaSnapshotConfig,
+)
+from neo4j_text2cypher.utils.debug import get_validation_logger
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_introspection import refresh_graph_schema
+from neo4j_text2cypher.utils.schema_utils import get_schema_version
+
+
+def get_schema_source(graph: Neo4jGraph, url: str = "") -> str:
+    """Identify the database and schema mode a snapshot was taken from."""
+    enhanced = "enhanced" if getattr(graph, "_enhanced_schema", False) else "basic"
+    return f"{url}/{getattr(graph, '_database', '')}/{enhanced}"
+
+
+def save_schema_snapshot(
+    graph: Neo4jGraph, path: Union[str, Path], source: str = ""
+) -> None:
+    """
+    Atomically save the schema of a graph as JSON along with its version stamp.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper with a loaded schema.
+    path : Union[str, Path]
+        The snapshot file.
+    source : str, optional
+        Identifies the database the schema belongs to, by default ""
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(
+            {
+                "version": get_schema_version(graph),
+                "source": source,
+                "created_at": time.time(),
+                "structured_schema": graph.structured_schema,
+            },
+            f,
+            default=str,
+        )
+    os.replace(tmp_path, path)
+
+
+def load_schema_snapshot(
+    graph: Neo4jGraph, path: Union[str, Path], source: str = ""
+) -> bool:
+    """
+    Set the schema of a graph from a snapshot without querying Neo4j.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    path : Union[str, Path]
+        The snapshot file.
+    source : str, optional
+        The database the schema must belong to, by default ""
+
+    Returns
+    -------
+    bool
+        Whether the snapshot was loaded. Missing, unreadable and mismatched snapshots are not loaded.
+    """
+    try:
+        with open(path) as f:
+            snapshot: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if snapshot.get("source") != source or "structured_schema" not in snapshot:
+        return False
+
+    graph.structured_schema = snapshot["structured_schema"]
+    graph.schema = format_schema(
+        schema=graph.structured_schema,
+        is_enhanced=getattr(graph, "_enhanced_schema", False),
+    )
+    # the version stamp guards against snapshots written by an incompatible schema formatter
+    if get_schema_version(graph) != snapshot.get("version"):
+        graph.structured_schema = dict()
+        graph.schema = ""
+        return False
+    return True
+
+
+def revalidate_schema_snapshot(
+    graph: Neo4jGraph,
+    path: Union[str, Path],
+    source: str = "",
+    introspection_config: Optional[SchemaIntrospectionConfig] = None,
+) -> bool:
+    """
+    Refresh the schema of a graph from Neo4j and save a new snapshot if it changed.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    path : Union[str, Path]
+        The snapshot file.
+    source : str, optional
+        Identifies the database the schema belongs to, by default ""
+    introspection_config : Optional[SchemaIntrospectionConfig], optional
+        How the schema is read, by default None
+        With the introspection engine enabled, only labels and types whose counts changed are sampled again.
+
+    Returns
+    -------
+    bool
+        Whether the schema changed.
+    """
+    logger = get_validation_logger()
+    version = get_schema_version(graph)
+    counts = graph.structured_schema.get("metadata", dict()).get("counts")
+    refresh_graph_schema(graph, introspection_config)
+    if get_schema_version(graph) == version:
+        logger.debug(f"🔍 SCHEMA SNAPSHOT DEBUG - Snapshot {version} is current")
+        if graph.structured_schema.get("metadata", dict()).get("counts") != counts:
+            # keep the counts current so the same labels are not sampled again next time
+            save_schema_snapshot(graph, path, source)
+        return False
+
+    get_metrics().increment("schema_snapshot.changed")
+    logger.debug(
+        f"🔍 SCHEMA SNAPSHOT DEBUG - Schema changed from {version} to {get_schema_version(graph)}"
+    )
+    save_schema_snapshot(graph, path, source)
+    return True
+
+
+def load_neo4j_graph(
+    connection_params: Dict[str, Any],
+    config: Optional[SchemaSnapshotConfig] = None,
+    introspection_config: Optional[SchemaIntrospectionConfig] = None,
+    graph: Optional[Neo4jGraph] = None,
+) -> Neo4jGraph:
+    """
+    Connect to Neo4j, taking the schema from a snapshot if one is available.
+
+    Without a usable snapshot the schema is read from Neo4j and a snapshot is saved.
+    With one, startup does not wait for schema introspection, and the schema is revalidated in a background thread if configured.
+    Prompts built before a revalidation keep the snapshot schema until the next restart.
+
+    Parameters
+    ----------
+    connection_params : Dict[str, Any]
+        The `Neo4jGraph` arguments, such as those of `ConfigLoader.get_neo4j_connection_params`.
+    config : Optional[SchemaSnapshotConfig], optional
+        The snapshot configuration, by default None
+        If None or disabled, the schema is read from Neo4j on every start.
+    introspection_config : Optional[SchemaIntrospectionConfig], optional
+        How the schema is read from Neo4j, by default None
+    graph : Optional[Neo4jGraph], optional
+        A connected graph wrapper without a schema to load the schema into, such as a `PooledNeo4jGraph`, by default None
+        If None, a new `Neo4jGraph` is connected.
+
+    Returns
+    -------
+    Neo4jGraph
+        The Neo4j graph wrapper with a loaded schema.
+    """
+    if graph is None:
+        graph = Neo4jGraph(**{**connection_params, "refresh_schema": False})
+    if config is None or not config.enabled:
+        refresh_graph_schema(graph, introspection_config)
+        return graph
+
+    source = get_schema_source(graph, url=connection_params.get("url") or "")
+    metrics = get_metrics()
+
+    if not load_schema_snapshot(graph, config.path, source):
+        metrics.increment("schema_snapshot.misses")
+        refresh_graph_schema(graph, introspection_config)
+        save_schema_snapshot(graph, config.path, source)
+        return graph
+
+    metrics.increment("schema_snapshot.hits")
+    if config.revalidate:
+
+        def revalidate() -> None:
+            try:
+                revalidate_schema_snapshot(
+                    graph, config.path, source, introspection_config
+                )
+            except Exception as e:
+                # keep serving the snapshot schema
+                get_validation_logger().warning(
+                    f"🔍 SCHEMA SNAPSHOT DEBUG - Revalidation failed: {e}"
+                )
+
+        threading.Thread(
+            target=revalidate, name="schema-revalidation", daemon=True
+        ).start()
+    return graph
@@ -1,6 +1,12 @@
+import hashlib
 import re
+from typing import Any, Dict, Iterable, List, Optional
 
 from langchain_neo4j import Neo4jGraph
+from neo4j_graphrag.schema import format_schema
+
+from neo4j_text2cypher.utils.compact_schema import count_tokens, format_compact_schema
+from neo4j_text2cypher.utils.config import SchemaPromptConfig
 
 
 def get_cypher_query_node_graph_schema() -> str:
@@ -8,7 +14,64 @@ def get_cypher_query_node_graph_schema() -> str:
     return r"^(- \*\*CypherQuery\*\*[\s\S]+?)(^Relationship properties|- \*)"
 
 
-def retrieve_and_parse_schema_from_graph_for_prompts(graph: Neo4jGraph) -> str:
+def remove_cypher_query_nodes(structured_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a copy of a structured schema without CypherQuery nodes and their relationships."""
+    return {
+        **structured_schema,
+        "node_props": {
+            label: props
+            for label, props in structured_schema.get("node_props", dict()).items()
+            if label != "CypherQuery"
+        },
+        "relationships": [
+            rel
+            for rel in structured_schema.get("relationships", list())
+            if "CypherQuery" not in (rel["start"], rel["end"])
+        ],
+    }
+
+
+def format_schema_for_prompts(
+    structured_schema: Dict[str, Any],
+    is_enhanced: bool,
+    config: Optional[SchemaPromptConfig] = None,
+) -> str:
+    """Format a structured schema in the format of the `schema_prompt` config, by default as `Neo4jGraph` does."""
+    if config is not None and config.format == "compact":
+        return format_compact_schema(
+            structured_schema,
+            detail=config.detail,
+            max_values=config.max_values,
+            max_value_length=config.max_value_length,
+        )
+    return format_schema(schema=structured_schema, is_enhanced=is_enhanced)
+
+
+def retrieve_and_parse_schema_from_graph_for_prompts(
+    graph: Neo4jGraph, config: Optional[SchemaPromptConfig] = None
+) -> str:
+    """
+    Get the graph schema for prompts, without CypherQuery nodes.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    config : Optional[SchemaPromptConfig], optional
+        How to render the schema, by default None, which uses the schema text of the graph
+
+    Returns
+    -------
+    str
+        The schema formatted for prompts.
+    """
+    if config is not None and config.format == "compact":
+        return format_schema_for_prompts(
+            remove_cypher_query_nodes(graph.get_structured_schema),
+            is_enhanced=getattr(graph, "_enhanced_schema", False),
+            config=config,
+        )
+
     schema: str = graph.get_schema
 
     # remove any mention of CypherQuery nodes and their contents
@@ -18,3 +81,148 @@ def retrieve_and_parse_schema_from_graph_for_prompts(graph: Neo4jGraph) -> str:
         )
 
     return schema
+
+
+FULLTEXT_INDEXES_QUERY = """
+SHOW FULLTEXT INDEXES
+YIELD name, entityType, labelsOrTypes, properties, state
+WHERE entityType = "NODE" AND state = "ONLINE"
+RETURN name, labelsOrTypes AS labels, properties
+"""
+
+
+def get_fulltext_indexes(graph: Neo4jGraph) -> List[Dict[str, Any]]:
+    """
+    Get the online full-text indexes on nodes.
+    The indexes are read once and kept in the schema snapshot under `metadata.fulltext_index`.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        The indexes, each with a `name` and the `labels` and `properties` it covers.
+    """
+    metadata = graph.structured_schema.setdefault("metadata", dict())
+    if "fulltext_index" not in metadata:
+        metadata["fulltext_index"] = graph.query(FULLTEXT_INDEXES_QUERY)
+    indexes: List[Dict[str, Any]] = metadata["fulltext_index"]
+    return indexes
+
+
+def get_schema_version(graph: Neo4jGraph) -> str:
+    """Get a short, stable version stamp for the graph schema."""
+    return hashlib.sha256(graph.get_schema.encode("utf-8")).hexdigest()[:16]
+
+
+def retrieve_schema_slice_for_prompts(
+    graph: Neo4jGraph,
+    texts: Iterable[str],
+    config: Optional[SchemaPromptConfig] = None,
+) -> str:
+    """
+    Get the part of the graph schema that is relevant to the provided texts.
+
+    Node labels and relationship types named in any of the texts are kept along with their properties
+    and the relationship patterns they take part in. The names of all labels and relationship types are always listed
+    so that misspelled or missing elements may still be corrected.
+    If nothing in the texts matches the schema, the full schema is returned.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    texts : Iterable[str]
+        Texts naming schema elements, such as a Cypher statement and its errors.
+    config : Optional[SchemaPromptConfig], optional
+        How to render the schema, by default None, which formats it as `Neo4jGraph` does
+
+    Returns
+    -------
+    str
+        The schema slice formatted for prompts.
+    """
+    structured_schema = remove_cypher_query_nodes(graph.get_structured_schema)
+    tokens = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", " ".join(texts)))
+
+    node_props = structured_schema["node_props"]
+    rel_props = structured_schema.get("rel_props", dict())
+    relationships = structured_schema["relationships"]
+
+    labels = {label for label in node_props if label in tokens}
+    rel_types = {rel["type"] for rel in relationships if rel["type"] in tokens}
+    if not labels and not rel_types:
+        return retrieve_and_parse_schema_from_graph_for_prompts(graph, config)
+
+    # keep one hop patterns around named labels, but only the properties of named elements
+    relevant_relationships = [
+        rel
+        for rel in relationships
+        if rel["type"] in rel_types or rel["start"] in labels or rel["end"] in labels
+    ]
+
+    schema_slice = format_schema_for_prompts(
+        structured_schema={
+            "node_props": {
+                label: props for label, props in node_props.items() if label in labels
+            },
+            "rel_props": {
+                rel_type: props
+                for rel_type, props in rel_props.items()
+                if rel_type in rel_types
+            },
+            "relationships": relevant_relationships,
+        },
+        is_enhanced=getattr(graph, "_enhanced_schema", False),
+        config=config,
+    )
+    all_rel_types = sorted({rel["type"] for rel in relationships})
+    return (
+        f"{schema_slice}\n"
+        f"All node labels: {', '.join(sorted(node_props))}\n"
+        f"All relationship types: {', '.join(all_rel_types)}"
+    )
+
+
+def get_schema_token_report(
+    graph: Neo4jGraph,
+    config: Optional[SchemaPromptConfig] = None,
+    encoding_name: str = "o200k_base",
+) -> List[Dict[str, Any]]:
+    """
+    Count the characters and tokens of the prompt schema in the `Neo4jGraph` format and at every compact detail level.
+
+    Parameters
+    ----------
+    graph : Neo4jGraph
+        The Neo4j graph wrapper.
+    config : Optional[SchemaPromptConfig], optional
+        The value sampling settings of the compact formats, by default None
+    encoding_name : str, optional
+        The tiktoken encoding to count tokens with, by default "o200k_base"
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One row per format and detail level, with its `characters` and `tokens`.
+    """
+    config = config or SchemaPromptConfig()
+    configs = [SchemaPromptConfig(format="langchain")] + [
+        config.model_copy(update={"format": "compact", "detail": detail})
+        for detail in ("names", "types", "values")
+    ]
+    report: List[Dict[str, Any]] = list()
+    for prompt_config in configs:
+        schema = retrieve_and_parse_schema_from_graph_for_prompts(graph, prompt_config)
+        report.append(
+            {
+                "format": prompt_config.format,
+                "detail": prompt_config.detail if prompt_config.format == "compact" else "",
+                "characters": len(schema),
+                "tokens": count_tokens(schema, encoding_name),
+            }
+        )
+    return report
@@ -0,0 +1,90 @@
+"""Helpers for reading token usage reported by LLM providers."""
+
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from typing_extensions import TypedDict
+
+
+class TokenUsage(TypedDict):
+    """Token counts for one or more LLM calls."""
+
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    cached_tokens: int
+
+
+def empty_token_usage() -> TokenUsage:
+    """Get a zeroed token usage record."""
+    return TokenUsage(input_tokens=0, output_tokens=0, total_tokens=0, cached_tokens=0)
+
+
+def add_token_usage(left: TokenUsage, right: TokenUsage) -> TokenUsage:
+    """Sum two token usage records."""
+    return TokenUsage(
+        input_tokens=left["input_tokens"] + right["input_tokens"],
+        output_tokens=left["output_tokens"] + right["output_tokens"],
+        total_tokens=left["total_tokens"] + right["total_tokens"],
+        cached_tokens=left["cached_tokens"] + right["cached_tokens"],
+    )
+
+
+def get_cached_token_ratio(usage: TokenUsage) -> float:
+    """Get the share of input tokens read from the provider's prompt cache. 0 without input tokens."""
+    if not usage["input_tokens"]:
+        return 0.0
+    return usage["cached_tokens"] / usage["input_tokens"]
+
+
+def get_token_usage_from_message(message: Any) -> Optional[TokenUsage]:
+    """
+    Read token usage from an LLM response message.
+
+    Parameters
+    ----------
+    message : Any
+        The message returned by a chat model, typically an `AIMessage`.
+
+    Returns
+    -------
+    Optional[TokenUsage]
+        The token usage, or None if the provider did not report any.
+    """
+    if not isinstance(message, BaseMessage):
+        return None
+    usage_metadata = getattr(message, "usage_metadata", None)
+    if not usage_metadata:
+        return None
+    input_token_details = usage_metadata.get("input_token_details") or {}
+    return TokenUsage(
+        input_tokens=usage_metadata.get("input_tokens", 0),
+        output_tokens=usage_metadata.get("output_tokens", 0),
+        total_tokens=usage_metadata.get("total_tokens", 0),
+        cached_tokens=input_token_details.get("cache_read", 0) or 0,
+    )
+
+
+def get_token_usage_from_llm_result(result: LLMResult) -> TokenUsage:
+    """
+    Sum the token usage of every generation in an `LLMResult`, as received by callbacks.
+
+    Parameters
+    ----------
+    result : LLMResult
+        The result passed to `on_llm_end`.
+
+    Returns
+    -------
+    TokenUsage
+        The summed token usage. Zero if the provider did not report any.
+    """
+    usage = empty_token_usage()
+    for generations in result.generations:
+        for generation in generations:
+            if isinstance(generation, ChatGeneration):
+                message_usage = get_token_usage_from_message(generation.message)
+                if message_usage is not None:
+                    usage = add_token_usage(usage, message_usage)
+    return usage
@@ -0,0 +1,95 @@
+"""Server-side conversation checkpointing for Text2Cypher workflows."""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.utils.config import CheckpointConfig
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    config: CheckpointConfig,
+) -> AsyncIterator[Optional[BaseCheckpointSaver]]:  # type: ignore[type-arg]
+    """
+    Open the SQLite checkpointer described by the configuration.
+
+    The connection is bound to the running event loop, so it is opened for each event loop that uses it.
+
+    Parameters
+    ----------
+    config : CheckpointConfig
+        The checkpointing configuration.
+
+    Yields
+    ------
+    Optional[BaseCheckpointSaver]
+        The checkpointer, or None if checkpointing is disabled.
+    """
+    if not config.enabled:
+        yield None
+        return
+
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "Checkpointing requires the `checkpoint` dependency group. "
+            "Install it with `poetry install --with checkpoint`."
+        ) from e
+
+    Path(config.path).parent.mkdir(parents=True, exist_ok=True)
+    async with AsyncSqliteSaver.from_conn_string(config.path) as checkpointer:
+        yield checkpointer
+
+
+def with_checkpointer(
+    workflow: CompiledStateGraph,
+    checkpointer: Optional[BaseCheckpointSaver],  # type: ignore[type-arg]
+) -> CompiledStateGraph:
+    """
+    Bind a checkpointer to a compiled workflow without recompiling it.
+
+    Parameters
+    ----------
+    workflow : CompiledStateGraph
+        The compiled Text2Cypher workflow.
+    checkpointer : Optional[BaseCheckpointSaver]
+        The checkpointer. If None, the workflow is returned unchanged.
+
+    Returns
+    -------
+    CompiledStateGraph
+        The workflow that saves its state after each step.
+    """
+    if checkpointer is None:
+        return workflow
+    return workflow.copy(update={"checkpointer": checkpointer})
+
+
+def get_thread_config(
+    thread_id: str, config: Optional[RunnableConfig] = None
+) -> RunnableConfig:
+    """
+    Add a conversation thread id to a run config.
+    Runs with the same thread id continue the same checkpointed conversation.
+
+    Parameters
+    ----------
+    thread_id : str
+        The conversation thread id.
+    config : Optional[RunnableConfig], optional
+        The run config to extend, by default None
+
+    Returns
+    -------
+    RunnableConfig
+        A new run config.
+    """
+    config = config or RunnableConfig()
+    configurable = {**config.get("configurable", dict()), "thread_id": thread_id}
+    return RunnableConfig(**{**config, "configurable": configurable})  # type: ignore[typeddict-item]
@@ -0,0 +1,146 @@
+"""Single-flight request coalescing in front of a compiled Text2Cypher workflow."""
+
+import asyncio
+import copy
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.components.state import InputState, OutputState
+from neo4j_text2cypher.utils.metrics import MetricsRecorder, get_metrics
+from neo4j_text2cypher.workflows.deadlines import ainvoke_with_deadline
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question so that trivially different phrasings share a key.
+
+    Parameters
+    ----------
+    question : str
+        The raw user question.
+
+    Returns
+    -------
+    str
+        The question lower-cased, with collapsed whitespace and no trailing punctuation.
+    """
+    normalized = re.sub(r"\s+", " ", question).strip().casefold()
+    return normalized.rstrip("?!. ")
+
+
+class RequestCoalescer:
+    """
+    Share one in-flight workflow execution between concurrent identical questions.
+
+    Only requests that do not depend on conversation history or input data are coalesced.
+    Requests are keyed on the normalized question text and the schema version.
+    All other requests are passed straight through to the workflow.
+    """
+
+    def __init__(
+        self,
+        workflow: CompiledStateGraph,
+        schema_version: str = "",
+        metrics: Optional[MetricsRecorder] = None,
+        request_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the coalescer.
+
+        Parameters
+        ----------
+        workflow : CompiledStateGraph
+            The compiled Text2Cypher workflow.
+        schema_version : str, optional
+            The version stamp of the graph schema the workflow was built with, by default ""
+        metrics : Optional[MetricsRecorder], optional
+            Where to record coalescing metrics, by default the process-wide recorder
+        request_timeout : Optional[float], optional
+            The deadline of an execution in seconds, by default None
+            When it passes, the partial output is returned, see `ainvoke_with_deadline`.
+        """
+        self.workflow = workflow
+        self.request_timeout = request_timeout
+        self.schema_version = schema_version
+        self.metrics = metrics or get_metrics()
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task[Any]] = {}
+        self._waiters: Dict[Tuple[str, str], int] = {}
+
+    def _get_key(
+        self, input: InputState, config: Optional[RunnableConfig]
+    ) -> Optional[Tuple[str, str]]:
+        """Get the coalescing key for a request, or None if it may not be shared."""
+        if input.get("history") or input.get("data"):
+            return None
+        # a thread id means the checkpointer supplies history for this request
+        if config is not None and config.get("configurable"):
+            return None
+        return (normalize_question(input.get("question", "")), self.schema_version)
+
+    async def ainvoke(
+        self, input: InputState, config: Optional[RunnableConfig] = None
+    ) -> OutputState:
+        """
+        Invoke the workflow, joining an identical in-flight execution if one exists.
+
+        Parameters
+        ----------
+        input : InputState
+            The workflow input.
+        config : Optional[RunnableConfig], optional
+            The run config passed to the workflow, by default None
+
+        Returns
+        -------
+        OutputState
+            The workflow output. Coalesced callers each receive their own copy.
+        """
+        self.metrics.increment("coalescer.requests")
+
+        key = self._get_key(input, config)
+        if key is None:
+            self.metrics.increment("coalescer.bypassed")
+            return await ainvoke_with_deadline(
+                self.workflow, input, config=config, timeout=self.request_timeout
+            )
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.metrics.increment("coalescer.executions")
+            task = asyncio.ensure_future(
+                ainvoke_with_deadline(
+                    self.workflow, input, config=config, timeout=self.request_timeout
+                )
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._release(key, task))
+        else:
+            self.metrics.increment("coalescer.coalesced")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            result: OutputState = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # only cancel the shared execution once nobody is waiting on it
+            if self._waiters.get(key, 0) <= 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            self._waiters[key] = self._waiters.get(key, 1) - 1
+            if self._waiters[key] <= 0:
+                self._waiters.pop(key, None)
+
+        return copy.deepcopy(result)
+
+    def _release(self, key: Tuple[str, str], task: "asyncio.Task[Any]") -> None:
+        """Forget a finished execution so later requests start a fresh run."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    @property
+    def in_flight(self) -> int:
+        """The number of distinct executions currently running."""
+        return len(self._in_flight)
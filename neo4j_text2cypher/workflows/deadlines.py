@@ -0,0 +1,196 @@
+"""Per-node and per-request deadlines for Text2Cypher workflows."""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.components.state import InputState, OutputState
+from neo4j_text2cypher.components.text2cypher.state import CypherOutputState
+from neo4j_text2cypher.exceptions import NodeTimeoutError
+from neo4j_text2cypher.utils.budget import get_request_budget
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.scheduling import NODE_LATENCY_METRIC
+
+DEADLINE_EXCEEDED_ANSWER = "The request timed out before an answer was ready."
+
+
+def with_node_timeout(
+    node: Any,
+    name: str,
+    seconds: Optional[float],
+    on_timeout: Optional[Callable[[Any], Dict[str, Any]]] = None,
+) -> Any:
+    """
+    Wrap a LangGraph node so that it is cancelled once its deadline passes.
+
+    Parameters
+    ----------
+    node : Any
+        The node. Either an async function of the state, and optionally the config, or a Runnable such as a compiled subgraph.
+    name : str
+        The node name. This is also used as the name of the returned node.
+    seconds : Optional[float]
+        The deadline in seconds. If None, the node is returned unchanged.
+    on_timeout : Optional[Callable[[Any], Dict[str, Any]]], optional
+        Builds a partial state update from the node input when the deadline passes, by default None
+        If None, a `NodeTimeoutError` is raised instead.
+
+    Returns
+    -------
+    Any
+        The wrapped node.
+    """
+    if seconds is None:
+        return node
+
+    accepts_config = (
+        not isinstance(node, Runnable) and "config" in inspect.signature(node).parameters
+    )
+
+    async def run_with_timeout(state: Any, config: RunnableConfig) -> Any:
+        try:
+            if isinstance(node, Runnable):
+                return await asyncio.wait_for(node.ainvoke(state, config), seconds)
+            if accepts_config:
+                return await asyncio.wait_for(node(state, config), seconds)
+            return await asyncio.wait_for(node(state), seconds)
+        except asyncio.TimeoutError:
+            get_metrics().increment(f"deadlines.{name}.exceeded")
+            if on_timeout is None:
+                raise NodeTimeoutError(
+                    f"The {name} node exceeded its deadline of {seconds} seconds."
+                )
+            return on_timeout(state)
+
+    run_with_timeout.__name__ = name
+    return run_with_timeout
+
+
+def with_latency_observation(node: Any, name: str) -> Any:
+    """
+    Wrap a LangGraph node so that the duration of each completed run is observed as `nodes.<name>.seconds`.
+    Deadline-aware nodes estimate how long the remaining nodes of a task take from these observations.
+
+    Parameters
+    ----------
+    node : Any
+        The node. Either an async function of the state, and optionally the config, or a Runnable such as a compiled subgraph.
+    name : str
+        The node name. This is also used as the name of the returned node.
+
+    Returns
+    -------
+    Any
+        The wrapped node.
+    """
+    accepts_config = (
+        not isinstance(node, Runnable) and "config" in inspect.signature(node).parameters
+    )
+    metric = NODE_LATENCY_METRIC.format(node=name)
+
+    async def run_with_latency_observation(state: Any, config: RunnableConfig) -> Any:
+        start = time.monotonic()
+        if isinstance(node, Runnable):
+            result = await node.ainvoke(state, config)
+        elif accepts_config:
+            result = await node(state, config)
+        else:
+            result = await node(state)
+        get_metrics().observe(metric, time.monotonic() - start)
+        return result
+
+    run_with_latency_observation.__name__ = name
+    return run_with_latency_observation
+
+
+def text2cypher_timeout_update(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the partial result of a text2cypher task that ran out of time."""
+    steps = list(state.get("prev_steps", list())) + ["deadline_exceeded"]
+    return {
+        "cyphers": [
+            CypherOutputState(
+                task=state.get("task", ""),
+                statement="",
+                parameters=None,
+                errors=["The task exceeded its deadline."],
+                records=[],
+                cypher_steps=steps,
+                token_usage=[],
+            )
+        ],
+        "steps": [steps],
+    }
+
+
+async def ainvoke_with_deadline(
+    workflow: CompiledStateGraph,
+    input: InputState,
+    config: Optional[RunnableConfig] = None,
+    timeout: Optional[float] = None,
+) -> OutputState:
+    """
+    Invoke a workflow with a deadline for the whole run.
+
+    When the deadline passes the run is cancelled, including every in-flight text2cypher subgraph and LLM call,
+    and the state gathered so far is returned, with the usage of the request budget if the config has one.
+
+    Parameters
+    ----------
+    workflow : CompiledStateGraph
+        The compiled Text2Cypher workflow.
+    input : InputState
+        The workflow input.
+    config : Optional[RunnableConfig], optional
+        The run config, by default None
+    timeout : Optional[float], optional
+        The deadline in seconds, by default None
+
+    Returns
+    -------
+    OutputState
+        The workflow output, or the partial output if the deadline passed.
+        A partial output has `deadline_exceeded` as its last step.
+    """
+    if timeout is None:
+        result: OutputState = await workflow.ainvoke(input, config=config)
+        return result
+
+    final_values: Optional[Dict[str, Any]] = None
+    summary: Optional[str] = None
+    cyphers: List[CypherOutputState] = []
+    steps: List[Any] = []
+
+    async def consume() -> None:
+        nonlocal final_values, summary
+        async for mode, chunk in workflow.astream(
+            input, config=config, stream_mode=["updates", "values"]
+        ):
+            if mode == "values":
+                final_values = chunk
+                continue
+            for update in chunk.values():
+                if not isinstance(update, dict):
+                    continue
+                cyphers.extend(update.get("cyphers") or list())
+                steps.extend(update.get("steps") or list())
+                summary = update.get("summary") or summary
+
+    try:
+        await asyncio.wait_for(consume(), timeout)
+    except asyncio.TimeoutError:
+        get_metrics().increment("deadlines.request.exceeded")
+        budget = get_request_budget(config) if config is not None else None
+        return OutputState(
+            answer=summary or DEADLINE_EXCEEDED_ANSWER,
+            question=input.get("question", ""),
+            steps=steps + ["deadline_exceeded"],
+            cyphers=cyphers,
+            history=input.get("history", list()),
+            usage=budget.report() if budget is not None else None,
+        )
+
+    return cast(OutputState, final_values or dict())
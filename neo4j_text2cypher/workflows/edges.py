@@ -6,6 +6,7 @@ from langgraph.types import Send
 
 from neo4j_text2cypher.components.state import OverallState
 from neo4j_text2cypher.utils.debug import get_routing_logger
+from neo4j_text2cypher.utils.scheduling import estimate_seconds
 
 
 def guardrails_conditional_edge(
@@ -47,7 +48,14 @@ def query_mapper_edge(state: OverallState) -> List[Send]:
     for i, task in enumerate(tasks):
         logger.debug(f"🔍 ROUTING DEBUG - Task {i+1}: {task.question}")
 
-    sends = [Send("text2cypher", {"task": task.question}) for task in tasks]
+    deadline = state.get("deadline")
+    if deadline is not None:
+        # tasks must finish in time for their results to be summarized
+        deadline -= estimate_seconds(["summarize"])
+    sends = [
+        Send("text2cypher", {"task": task.question, "task_deadline": deadline})
+        for task in tasks
+    ]
 
     logger.debug(f"🔍 ROUTING DEBUG - Sending {len(sends)} messages to text2cypher")
     for i, send in enumerate(sends):
@@ -1,20 +1,39 @@
-from typing import Optional
+from typing import Mapping, Optional
 
 from langchain_core.language_models import BaseChatModel
 from langchain_neo4j import Neo4jGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
 from neo4j_text2cypher.components.final_answer import create_final_answer_node
 from neo4j_text2cypher.components.guardrails import create_guardrails_node
 from neo4j_text2cypher.components.planner import create_planner_node
+from neo4j_text2cypher.components.reset_turn import create_reset_turn_node
 from neo4j_text2cypher.components.state import (
     InputState,
     OutputState,
     OverallState,
 )
 from neo4j_text2cypher.components.summarize import create_summarization_node
-from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
+from neo4j_text2cypher.retrievers import (
+    ConfigCypherExampleRetriever,
+    PropertyValueIndex,
+    VerifiedQueryStore,
+)
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor
+from neo4j_text2cypher.utils.config import (
+    CostGateConfig,
+    FulltextRewriteConfig,
+    ParameterizationConfig,
+    SchemaPromptConfig,
+    TimeoutConfig,
+)
+from neo4j_text2cypher.workflows.deadlines import (
+    text2cypher_timeout_update,
+    with_latency_observation,
+    with_node_timeout,
+)
 from neo4j_text2cypher.workflows.edges import (
     guardrails_conditional_edge,
     query_mapper_edge,
@@ -29,6 +48,17 @@ def create_neo4j_text2cypher_workflow(
     scope_description: Optional[str] = None,
     max_attempts: int = 3,
     attempt_cypher_execution_on_final_attempt: bool = False,
+    governor: Optional[ConcurrencyGovernor] = None,
+    num_candidates: int = 1,
+    cost_gate_config: Optional[CostGateConfig] = None,
+    fulltext_rewrite_config: Optional[FulltextRewriteConfig] = None,
+    parameterization_config: Optional[ParameterizationConfig] = None,
+    verified_query_store: Optional[VerifiedQueryStore] = None,
+    property_value_index: Optional[PropertyValueIndex] = None,
+    timeout_config: Optional[TimeoutConfig] = None,
+    checkpointer: Optional[BaseCheckpointSaver] = None,  # type: ignore[type-arg]
+    node_llms: Optional[Mapping[str, BaseChatModel]] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> CompiledStateGraph:
     """
     Create a simplified Text2Cypher workflow using LangGraph.
@@ -37,7 +67,7 @@ def create_neo4j_text2cypher_workflow(
     Parameters
     ----------
     llm : BaseChatModel
-        The LLM to use for processing
+        The LLM to use for processing, unless a node has its own in `node_llms`
     graph : Neo4jGraph
         The Neo4j graph wrapper.
     scope_description: Optional[str], optional
@@ -49,6 +79,35 @@ def create_neo4j_text2cypher_workflow(
     attempt_cypher_execution_on_final_attempt, bool, optional
         THIS MAY BE DANGEROUS.
         Whether to attempt Cypher execution on the last attempt, regardless of if the Cypher contains errors, by default False
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor bounding in-flight text2cypher subgraphs, LLM request and token rates and Neo4j queries, by default None
+    num_candidates : int, optional
+        The number of candidate Cypher statements each text2cypher task generates concurrently, by default 1
+    cost_gate_config : Optional[CostGateConfig], optional
+        The thresholds of the pre-execution cost gate, by default None
+    fulltext_rewrite_config : Optional[FulltextRewriteConfig], optional
+        How string filters are rewritten to use full-text indexes, by default None
+    parameterization_config : Optional[ParameterizationConfig], optional
+        Which literals to lift into query parameters before execution, by default None
+    verified_query_store : Optional[VerifiedQueryStore], optional
+        The store of verified statements that tasks of a known shape reuse instead of generating Cypher, by default None
+    property_value_index : Optional[PropertyValueIndex], optional
+        The index used to rewrite filter values to their stored spelling during validation, by default None
+    timeout_config : Optional[TimeoutConfig], optional
+        Per-node deadlines, by default None
+        A text2cypher task that exceeds its deadline contributes an errored result instead of failing the run.
+        The per-request deadline is applied by `ainvoke_with_deadline`.
+        Each turn also carries the request deadline into its text2cypher tasks, which skip corrections,
+        and then execution, that are not expected to finish before it while leaving time to summarize.
+    checkpointer : Optional[BaseCheckpointSaver], optional
+        Saves the conversation state by thread id, by default None
+        With a checkpointer each turn only needs the new question. See also `with_checkpointer`.
+    node_llms : Optional[Mapping[str, BaseChatModel]], optional
+        LLMs for individual nodes by name, by default None
+        Nodes are `guardrails`, `planner`, `generate_cypher`, `validate_cypher`, `correct_cypher` and `summarize`.
+        See `create_node_llms` to create them from the `llm` section of an app config.
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in prompts, by default None, which uses the schema text of the graph
 
     Returns
     -------
@@ -56,31 +115,89 @@ def create_neo4j_text2cypher_workflow(
         The workflow.
     """
 
+    node_llms = node_llms or dict()
+
+    def get_node_llm(name: str) -> BaseChatModel:
+        node_llm = node_llms.get(name, llm)
+        return governor.govern_llm(node_llm) if governor is not None else node_llm
+
+    node_timeouts = timeout_config.nodes if timeout_config is not None else dict()
+
     guardrails = create_guardrails_node(
-        llm=llm, graph=graph, scope_description=scope_description
+        llm=get_node_llm("guardrails"),
+        graph=graph,
+        scope_description=scope_description,
+        schema_prompt_config=schema_prompt_config,
     )
-    planner = create_planner_node(llm=llm)
+    planner = create_planner_node(llm=get_node_llm("planner"))
     text2cypher = create_text2cypher_agent(
         llm=llm,
         graph=graph,
         cypher_example_retriever=cypher_example_retriever,
         max_attempts=max_attempts,
         attempt_cypher_execution_on_final_attempt=attempt_cypher_execution_on_final_attempt,
+        governor=governor,
+        num_candidates=num_candidates,
+        cost_gate_config=cost_gate_config,
+        fulltext_rewrite_config=fulltext_rewrite_config,
+        parameterization_config=parameterization_config,
+        verified_query_store=verified_query_store,
+        property_value_index=property_value_index,
+        node_timeouts=node_timeouts,
+        node_llms=node_llms,
+        schema_prompt_config=schema_prompt_config,
     )
-    summarize = create_summarization_node(llm=llm)
+    summarize = create_summarization_node(llm=get_node_llm("summarize"))
     final_answer = create_final_answer_node()
+    reset_turn = create_reset_turn_node(
+        request_seconds=(
+            timeout_config.request_seconds if timeout_config is not None else None
+        )
+    )
 
 
     main_graph_builder = StateGraph(OverallState, input=InputState, output=OutputState)
 
-    main_graph_builder.add_node(guardrails)
-    main_graph_builder.add_node(planner)
-    main_graph_builder.add_node("text2cypher", text2cypher)
-    main_graph_builder.add_node(summarize)
+    main_graph_builder.add_node(reset_turn)
+    main_graph_builder.add_node(
+        with_latency_observation(
+            with_node_timeout(guardrails, "guardrails", node_timeouts.get("guardrails")),
+            "guardrails",
+        )
+    )
+    main_graph_builder.add_node(
+        with_latency_observation(
+            with_node_timeout(planner, "planner", node_timeouts.get("planner")),
+            "planner",
+        )
+    )
+    main_graph_builder.add_node(
+        "text2cypher",
+        with_latency_observation(
+            with_node_timeout(
+                (
+                    governor.limit_subgraph(text2cypher)
+                    if governor is not None
+                    else text2cypher
+                ),
+                "text2cypher",
+                node_timeouts.get("text2cypher"),
+                on_timeout=text2cypher_timeout_update,
+            ),
+            "text2cypher",
+        ),
+    )
+    main_graph_builder.add_node(
+        with_latency_observation(
+            with_node_timeout(summarize, "summarize", node_timeouts.get("summarize")),
+            "summarize",
+        )
+    )
     main_graph_builder.add_node(final_answer)
 
 
-    main_graph_builder.add_edge(START, "guardrails")
+    main_graph_builder.add_edge(START, "reset_turn")
+    main_graph_builder.add_edge("reset_turn", "guardrails")
     main_graph_builder.add_conditional_edges(
         "guardrails",
         guardrails_conditional_edge,
@@ -96,4 +213,4 @@ def create_neo4j_text2cypher_workflow(
 
     main_graph_builder.add_edge("final_answer", END)
 
-    return main_graph_builder.compile()
+    return main_graph_builder.compile(checkpointer=checkpointer)
@@ -0,0 +1,224 @@
+"""Process-wide resources shared by every session of a Text2Cypher app."""
+
+import asyncio
+import threading
+from contextlib import AsyncExitStack
+from typing import Any, Coroutine, Dict, Optional, Tuple, TypeVar
+
+from langchain_core.language_models import BaseChatModel
+from langchain_neo4j import Neo4jGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.retrievers import (
+    ConfigCypherExampleRetriever,
+    PropertyValueIndex,
+    VerifiedQueryStore,
+)
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor
+from neo4j_text2cypher.utils.config import BudgetConfig, CheckpointConfig, ConfigLoader
+from neo4j_text2cypher.utils.connections import Neo4jDriverPool, PooledNeo4jGraph
+from neo4j_text2cypher.utils.debug import get_validation_logger, setup_debug_logging
+from neo4j_text2cypher.utils.llm import create_node_llms
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_snapshot import load_neo4j_graph
+from neo4j_text2cypher.workflows.checkpointing import (
+    open_checkpointer,
+    with_checkpointer,
+)
+from neo4j_text2cypher.workflows.neo4j_text2cypher_workflow import (
+    create_neo4j_text2cypher_workflow,
+)
+
+T = TypeVar("T")
+
+
+def create_workflow_from_config(
+    config_loader: ConfigLoader,
+    attempt_cypher_execution_on_final_attempt: bool = True,
+    driver_pool: Optional[Neo4jDriverPool] = None,
+    llm_clients: Optional[Dict[str, BaseChatModel]] = None,
+) -> Tuple[Neo4jGraph, CompiledStateGraph]:
+    """
+    Connect to Neo4j and compile the workflow described by an app config.
+
+    Parameters
+    ----------
+    config_loader : ConfigLoader
+        The app config.
+    attempt_cypher_execution_on_final_attempt : bool, optional
+        Whether to execute a Cypher statement that still fails validation after the final correction, by default True
+    driver_pool : Optional[Neo4jDriverPool], optional
+        The pool to take the Neo4j driver from, by default None, which opens a driver for the graph
+    llm_clients : Optional[Dict[str, BaseChatModel]], optional
+        LLM clients by settings to reuse, as in `create_node_llms`, by default None
+
+    Returns
+    -------
+    Tuple[Neo4jGraph, CompiledStateGraph]
+        The Neo4j graph wrapper, which owns the driver pool, and the workflow.
+    """
+    setup_debug_logging(config_loader.get_debug_config())
+
+    connection_params = config_loader.get_neo4j_connection_params()
+    pooled_graph = (
+        PooledNeo4jGraph(driver_pool, connection_params)
+        if driver_pool is not None
+        else None
+    )
+    try:
+        graph = load_neo4j_graph(
+            connection_params,
+            config_loader.get_schema_snapshot_config(),
+            config_loader.get_schema_introspection_config(),
+            graph=pooled_graph,
+        )
+    except Exception:
+        if pooled_graph is not None:
+            pooled_graph.close()
+        raise
+    timeout_config = config_loader.get_timeout_config()
+    llm, node_llms = create_node_llms(
+        config_loader.get_llm_config(),
+        timeout=timeout_config.llm_seconds,
+        clients=llm_clients,
+    )
+
+    workflow = create_neo4j_text2cypher_workflow(
+        llm=llm,
+        graph=graph,
+        cypher_example_retriever=ConfigCypherExampleRetriever(
+            config_path=str(config_loader.config_path)
+        ),
+        scope_description=config_loader.get_streamlit_config().scope_description,
+        attempt_cypher_execution_on_final_attempt=attempt_cypher_execution_on_final_attempt,
+        governor=ConcurrencyGovernor.from_config(
+            config_loader.get_concurrency_config()
+        ),
+        cost_gate_config=config_loader.get_cost_gate_config(),
+        fulltext_rewrite_config=config_loader.get_fulltext_rewrite_config(),
+        parameterization_config=config_loader.get_parameterization_config(),
+        verified_query_store=VerifiedQueryStore.from_config(
+            config_loader.get_verified_query_config()
+        ),
+        property_value_index=PropertyValueIndex.from_config(
+            config_loader.get_property_value_index_config(), graph
+        ),
+        timeout_config=timeout_config,
+        node_llms=node_llms,
+        schema_prompt_config=config_loader.get_schema_prompt_config(),
+    )
+    return graph, workflow
+
+
+class WorkflowResources:
+    """
+    The compiled workflow, Neo4j driver pool, LLM client and checkpointer of an app, shared by all of its sessions.
+
+    The workflow runs on a persistent event loop in a background thread. Sessions submit runs with `run`
+    from their own threads, so loop-bound resources such as the checkpointer connection are opened once
+    and the concurrency limits of the workflow apply across sessions.
+    """
+
+    def __init__(
+        self,
+        workflow: CompiledStateGraph,
+        graph: Optional[Neo4jGraph] = None,
+        checkpoint_config: Optional[CheckpointConfig] = None,
+        request_timeout: Optional[float] = None,
+        budget_config: Optional[BudgetConfig] = None,
+    ) -> None:
+        """
+        Start the event loop and open the checkpointer.
+
+        Parameters
+        ----------
+        workflow : CompiledStateGraph
+            The compiled Text2Cypher workflow.
+        graph : Optional[Neo4jGraph], optional
+            The Neo4j graph wrapper, closed along with the other resources, by default None
+        checkpoint_config : Optional[CheckpointConfig], optional
+            The conversation checkpointing configuration, by default None
+        request_timeout : Optional[float], optional
+            The deadline of a request in seconds, by default None
+        budget_config : Optional[BudgetConfig], optional
+            The token and cost budget of a request, by default None, which only tracks usage
+        """
+        self.graph = graph
+        self.request_timeout = request_timeout
+        self.budget_config = budget_config or BudgetConfig()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="text2cypher-event-loop", daemon=True
+        )
+        self._thread.start()
+        self._exit_stack = AsyncExitStack()
+        self.checkpointer: Optional[BaseCheckpointSaver] = self.run(  # type: ignore[type-arg]
+            self._exit_stack.enter_async_context(
+                open_checkpointer(checkpoint_config or CheckpointConfig())
+            )
+        )
+        self.workflow = with_checkpointer(workflow, self.checkpointer)
+
+    @classmethod
+    def from_config(
+        cls,
+        config_loader: ConfigLoader,
+        attempt_cypher_execution_on_final_attempt: bool = True,
+    ) -> "WorkflowResources":
+        """
+        Connect to Neo4j and compile the workflow described by an app config.
+
+        Parameters
+        ----------
+        config_loader : ConfigLoader
+            The app config.
+        attempt_cypher_execution_on_final_attempt : bool, optional
+            Whether to execute a Cypher statement that still fails validation after the final correction, by default True
+
+        Returns
+        -------
+        WorkflowResources
+            The shared resources.
+        """
+        graph, workflow = create_workflow_from_config(
+            config_loader, attempt_cypher_execution_on_final_attempt
+        )
+        get_metrics().increment("resources.created")
+        get_validation_logger().debug(
+            f"🔍 RESOURCES DEBUG - Created shared resources for {config_loader.config_path}"
+        )
+        return cls(
+            workflow,
+            graph=graph,
+            checkpoint_config=config_loader.get_checkpoint_config(),
+            request_timeout=config_loader.get_timeout_config().request_seconds,
+            budget_config=config_loader.get_budget_config(),
+        )
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the shared event loop and wait for its result.
+
+        Parameters
+        ----------
+        coro : Coroutine[Any, Any, T]
+            The coroutine, such as a workflow invocation.
+
+        Returns
+        -------
+        T
+            The result of the coroutine. Its exceptions are raised in the calling thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Close the checkpointer, stop the event loop and close the Neo4j driver pool."""
+        if self._loop.is_closed():
+            return
+        self.run(self._exit_stack.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        if self.graph is not None:
+            self.graph.close()
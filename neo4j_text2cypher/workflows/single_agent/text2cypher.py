@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Dict, Literal, Mapping, Optional
 
 from langchain_core.language_models import BaseChatModel
 from langchain_neo4j import Neo4jGraph
@@ -10,12 +10,31 @@ from neo4j_text2cypher.components.state import (
 )
 from neo4j_text2cypher.components.text2cypher import (
     create_text2cypher_correction_node,
+    create_text2cypher_cost_gate_node,
     create_text2cypher_execution_node,
+    create_text2cypher_fulltext_rewrite_node,
     create_text2cypher_generation_node,
+    create_text2cypher_parameterization_node,
     create_text2cypher_validation_node,
+    create_text2cypher_verified_lookup_node,
 )
 from neo4j_text2cypher.components.text2cypher.state import CypherInputState, CypherState
-from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever
+from neo4j_text2cypher.retrievers import (
+    ConfigCypherExampleRetriever,
+    PropertyValueIndex,
+    VerifiedQueryStore,
+)
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor
+from neo4j_text2cypher.utils.config import (
+    CostGateConfig,
+    FulltextRewriteConfig,
+    ParameterizationConfig,
+    SchemaPromptConfig,
+)
+from neo4j_text2cypher.workflows.deadlines import (
+    with_latency_observation,
+    with_node_timeout,
+)
 
 
 def create_text2cypher_agent(
@@ -24,6 +43,16 @@ def create_text2cypher_agent(
     cypher_example_retriever: ConfigCypherExampleRetriever,
     max_attempts: int = 3,
     attempt_cypher_execution_on_final_attempt: bool = False,
+    governor: Optional[ConcurrencyGovernor] = None,
+    num_candidates: int = 1,
+    cost_gate_config: Optional[CostGateConfig] = None,
+    fulltext_rewrite_config: Optional[FulltextRewriteConfig] = None,
+    parameterization_config: Optional[ParameterizationConfig] = None,
+    verified_query_store: Optional[VerifiedQueryStore] = None,
+    property_value_index: Optional[PropertyValueIndex] = None,
+    node_timeouts: Optional[Dict[str, float]] = None,
+    node_llms: Optional[Mapping[str, BaseChatModel]] = None,
+    schema_prompt_config: Optional[SchemaPromptConfig] = None,
 ) -> CompiledStateGraph:
     """
     Create a Text2Cypher agent using LangGraph.
@@ -35,7 +64,7 @@ def create_text2cypher_agent(
     graph : Neo4jGraph
         The Neo4j graph wrapper.
     llm : BaseChatModel
-        The LLM to use for processing.
+        The LLM to use for processing, unless a node has its own in `node_llms`.
     cypher_example_retriever: ConfigCypherExampleRetriever
         The retriever used to collect Cypher examples for few shot prompting.
     max_attempts: int, optional
@@ -43,6 +72,38 @@ def create_text2cypher_agent(
     attempt_cypher_execution_on_final_attempt, bool, optional
         THIS MAY BE DANGEROUS.
         Whether to attempt Cypher execution on the last attempt, regardless of if the Cypher contains errors, by default False
+    governor : Optional[ConcurrencyGovernor], optional
+        The governor applying shared LLM rate limits and Neo4j query limits, by default None
+    num_candidates : int, optional
+        The number of candidate Cypher statements to generate concurrently, by default 1
+        The first candidate to pass deterministic validation is kept and the rest are cancelled.
+        This trades additional tokens for fewer correction round trips.
+    cost_gate_config : Optional[CostGateConfig], optional
+        The thresholds of the pre-execution cost gate, by default None
+        When provided and enabled, statements are checked against their EXPLAIN plan and given a LIMIT before execution.
+    fulltext_rewrite_config : Optional[FulltextRewriteConfig], optional
+        How string filters are rewritten to use full-text indexes, by default None
+        When provided and enabled, equality and `STARTS WITH` filters on full-text indexed properties
+        are narrowed with an index lookup before the cost gate.
+    parameterization_config : Optional[ParameterizationConfig], optional
+        Which literals to lift into query parameters, by default None
+        When provided and enabled, approved statements are executed with parameters so Neo4j may reuse cached plans.
+    verified_query_store : Optional[VerifiedQueryStore], optional
+        The store of verified task and Cypher statement pairs, by default None
+        When provided, tasks matching a verified task skip generation, and skip the LLM validator unless they
+        have text values the `property_value_index` does not recognize. Statements that execute successfully are saved to the store.
+    property_value_index : Optional[PropertyValueIndex], optional
+        The index of stored string property values, by default None
+        When provided, filter values found by the LLM validator are rewritten to their stored spelling before execution.
+    node_timeouts : Optional[Dict[str, float]], optional
+        Deadlines in seconds for individual nodes by name, such as `generate_cypher`, by default None
+        A node that exceeds its deadline is cancelled, along with any in-flight LLM call or query.
+        Tasks with a request `deadline` in their input only start a correction round that is expected to finish in time,
+        judged by the observed latency of each node.
+    node_llms : Optional[Mapping[str, BaseChatModel]], optional
+        LLMs for individual nodes by name, such as `validate_cypher`, by default None
+    schema_prompt_config : Optional[SchemaPromptConfig], optional
+        How the schema is rendered in the generation, validation and correction prompts, by default None
 
     Returns
     -------
@@ -50,17 +111,73 @@ def create_text2cypher_agent(
         The workflow.
     """
 
+    node_llms = node_llms or dict()
+
+    def get_node_llm(name: str) -> BaseChatModel:
+        node_llm = node_llms.get(name, llm)
+        return governor.govern_llm(node_llm) if governor is not None else node_llm
+
+    use_cost_gate = cost_gate_config is not None and cost_gate_config.enabled
+    use_parameterization = (
+        parameterization_config is not None and parameterization_config.enabled
+    )
+    use_fulltext_rewrite = (
+        fulltext_rewrite_config is not None and fulltext_rewrite_config.enabled
+    )
+
+    # statements approved for execution pass through the enabled pre-execution stages in order
+    pre_execution_stages = [
+        name
+        for name, enabled in [
+            ("rewrite_cypher", use_fulltext_rewrite),
+            ("gate_cypher", use_cost_gate),
+            ("parameterize_cypher", use_parameterization),
+        ]
+        if enabled
+    ] + ["execute_cypher"]
+
+    node_timeouts = node_timeouts or dict()
+
+    def wrap(node: Any, name: str) -> Any:
+        return with_latency_observation(
+            with_node_timeout(node, name, node_timeouts.get(name)), name
+        )
+
     generate_cypher = create_text2cypher_generation_node(
-        llm=llm, graph=graph, cypher_example_retriever=cypher_example_retriever
+        llm=get_node_llm("generate_cypher"),
+        graph=graph,
+        cypher_example_retriever=cypher_example_retriever,
+        num_candidates=num_candidates,
+        governor=governor,
+        schema_prompt_config=schema_prompt_config,
     )
     validate_cypher = create_text2cypher_validation_node(
-        llm=llm,
+        llm=get_node_llm("validate_cypher"),
         graph=graph,
         max_attempts=max_attempts,
         attempt_cypher_execution_on_final_attempt=attempt_cypher_execution_on_final_attempt,
+        governor=governor,
+        property_value_index=property_value_index,
+        execution_nodes=pre_execution_stages,
+        schema_prompt_config=schema_prompt_config,
+    )
+    correct_cypher = create_text2cypher_correction_node(
+        llm=get_node_llm("correct_cypher"),
+        graph=graph,
+        schema_prompt_config=schema_prompt_config,
+    )
+    execute_cypher = create_text2cypher_execution_node(
+        graph=graph, governor=governor, verified_query_store=verified_query_store
+    )
+    generate_cypher, validate_cypher, correct_cypher, execute_cypher = (
+        wrap(node, name)
+        for node, name in [
+            (generate_cypher, "generate_cypher"),
+            (validate_cypher, "validate_cypher"),
+            (correct_cypher, "correct_cypher"),
+            (execute_cypher, "execute_cypher"),
+        ]
     )
-    correct_cypher = create_text2cypher_correction_node(llm=llm, graph=graph)
-    execute_cypher = create_text2cypher_execution_node(graph=graph)
 
     text2cypher_graph_builder = StateGraph(
         CypherState, input=CypherInputState, output=OverallState
@@ -69,13 +186,67 @@ def create_text2cypher_agent(
     text2cypher_graph_builder.add_node(validate_cypher)
     text2cypher_graph_builder.add_node(correct_cypher)
     text2cypher_graph_builder.add_node(execute_cypher)
+    if fulltext_rewrite_config is not None and use_fulltext_rewrite:
+        rewrite_cypher = create_text2cypher_fulltext_rewrite_node(
+            graph=graph, config=fulltext_rewrite_config, governor=governor
+        )
+        text2cypher_graph_builder.add_node(wrap(rewrite_cypher, "rewrite_cypher"))
+    if cost_gate_config is not None and use_cost_gate:
+        gate_cypher = create_text2cypher_cost_gate_node(
+            graph=graph,
+            config=cost_gate_config,
+            max_attempts=max_attempts,
+            governor=governor,
+            execution_nodes=pre_execution_stages,
+        )
+        text2cypher_graph_builder.add_node(wrap(gate_cypher, "gate_cypher"))
+    if parameterization_config is not None and use_parameterization:
+        parameterize_cypher = create_text2cypher_parameterization_node(
+            config=parameterization_config
+        )
+        text2cypher_graph_builder.add_node(
+            wrap(parameterize_cypher, "parameterize_cypher")
+        )
 
-    text2cypher_graph_builder.add_edge(START, "generate_cypher")
+    if verified_query_store is not None:
+        lookup_verified_cypher = create_text2cypher_verified_lookup_node(
+            verified_query_store=verified_query_store,
+            property_value_index=property_value_index,
+        )
+        text2cypher_graph_builder.add_node(
+            wrap(lookup_verified_cypher, "lookup_verified_cypher")
+        )
+        text2cypher_graph_builder.add_edge(START, "lookup_verified_cypher")
+        text2cypher_graph_builder.add_conditional_edges(
+            "lookup_verified_cypher",
+            verified_lookup_conditional_edge,
+        )
+    else:
+        text2cypher_graph_builder.add_edge(START, "generate_cypher")
     text2cypher_graph_builder.add_edge("generate_cypher", "validate_cypher")
     text2cypher_graph_builder.add_conditional_edges(
         "validate_cypher",
         validate_cypher_conditional_edge,
+        {
+            "correct_cypher": "correct_cypher",
+            "execute_cypher": pre_execution_stages[0],
+            "__end__": END,
+        },
     )
+    for stage, next_stage in zip(pre_execution_stages, pre_execution_stages[1:]):
+        if stage == "gate_cypher":
+            # rejected statements are sent back for correction
+            text2cypher_graph_builder.add_conditional_edges(
+                stage,
+                validate_cypher_conditional_edge,
+                {
+                    "correct_cypher": "correct_cypher",
+                    "execute_cypher": next_stage,
+                    "__end__": END,
+                },
+            )
+        else:
+            text2cypher_graph_builder.add_edge(stage, next_stage)
     text2cypher_graph_builder.add_edge("correct_cypher", "validate_cypher")
     text2cypher_graph_builder.add_edge("execute_cypher", END)
 
@@ -94,3 +265,12 @@ def validate_cypher_conditional_edge(
             return "__end__"
         case _:
             return "__end__"
+
+
+def verified_lookup_conditional_edge(
+    state: CypherState,
+) -> Literal["validate_cypher", "generate_cypher"]:
+    # a filled statement skips generation, even when its new values still need the LLM validator
+    if state.get("statement"):
+        return "validate_cypher"
+    return "generate_cypher"
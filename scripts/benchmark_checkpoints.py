@@ -0,0 +1,131 @@
+"""
+Benchmark checkpoint read and write latency of the SQLite checkpointer.
+
+Conversations are simulated by writing one checkpoint per workflow step, holding the conversation history
+the workflow keeps in its state, and reading the latest checkpoint at the start of each turn.
+The history payload a client would otherwise resend each turn is reported for comparison.
+
+Usage:
+    python -m scripts.benchmark_checkpoints --threads 20 --turns 10 --records 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from neo4j_text2cypher.components.state import HistoryRecord, update_history
+from neo4j_text2cypher.utils.config import CheckpointConfig
+from neo4j_text2cypher.workflows.checkpointing import open_checkpointer
+
+# guardrails, planner, text2cypher, summarize, final_answer and the reset at the start of a turn
+STEPS_PER_TURN = 6
+
+
+def make_history_record(turn: int, records: int, rng: random.Random) -> HistoryRecord:
+    return HistoryRecord(
+        question=f"Question {turn} about the most common problems of model {rng.randint(0, 99)}?",
+        answer=" ".join(["Summarized answer"] * 40),
+        cyphers=[
+            {
+                "task": f"Task {turn}",
+                "statement": "MATCH (v:Verbatim)-[:HAS_PROBLEM]->(p:Problem) "
+                "WHERE v.model = $p0 RETURN p.problem AS problem, count(*) AS total",
+                "records": [
+                    {"problem": f"problem {rng.randint(0, 999)}", "total": rng.randint(0, 500)}
+                    for _ in range(records)
+                ],
+            }
+        ],
+    )
+
+
+def percentile(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+def report(name: str, durations: List[float]) -> None:
+    print(
+        f"{name:>8}: median {statistics.median(durations) * 1000:7.3f} ms, "
+        f"p95 {percentile(durations, 0.95) * 1000:7.3f} ms over {len(durations)} calls"
+    )
+
+
+async def run(args: argparse.Namespace, path: Path) -> None:
+    rng = random.Random(args.seed)
+    reads: List[float] = []
+    writes: List[float] = []
+    resent_bytes: List[int] = []
+    question_bytes: List[int] = []
+
+    async with open_checkpointer(CheckpointConfig(enabled=True, path=str(path))) as checkpointer:
+        assert checkpointer is not None
+        histories: Dict[str, List[HistoryRecord]] = {}
+        for turn in range(args.turns):
+            for thread in range(args.threads):
+                thread_id = f"thread-{thread}"
+                config: Dict[str, Any] = {
+                    "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+                }
+                history = histories.get(thread_id, list())
+                question = f"Question {turn}?"
+                resent_bytes.append(len(json.dumps({"question": question, "history": history})))
+                question_bytes.append(len(json.dumps({"question": question})))
+
+                start = time.perf_counter()
+                await checkpointer.aget_tuple(config)
+                reads.append(time.perf_counter() - start)
+
+                history = update_history(history, [make_history_record(turn, args.records, rng)])
+                histories[thread_id] = history
+                for step in range(STEPS_PER_TURN):
+                    checkpoint = empty_checkpoint()
+                    checkpoint["channel_values"] = {
+                        "question": question,
+                        "history": history,
+                        "steps": [f"step {i}" for i in range(step)],
+                    }
+                    start = time.perf_counter()
+                    config = await checkpointer.aput(
+                        config, checkpoint, {"source": "loop", "step": step, "writes": {}}, {}
+                    )
+                    writes.append(time.perf_counter() - start)
+
+    report("read", reads)
+    report("write", writes)
+    per_turn = statistics.median(reads) + STEPS_PER_TURN * statistics.median(writes)
+    print(f"checkpoint overhead per turn: {per_turn * 1000:.2f} ms ({STEPS_PER_TURN} writes)")
+    print(
+        f"request payload per turn: {statistics.mean(resent_bytes) / 1024:.1f} KiB with history, "
+        f"{statistics.mean(question_bytes) / 1024:.2f} KiB with checkpoints"
+    )
+    print(f"database size: {path.stat().st_size / 1024 / 1024:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=10, help="Concurrent conversations")
+    parser.add_argument("--turns", type=int, default=10, help="Questions per conversation")
+    parser.add_argument("--records", type=int, default=20, help="Result records per answer")
+    parser.add_argument(
+        "--path", default=None, help="SQLite database, by default a temporary file"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.path is not None:
+        asyncio.run(run(args, Path(args.path)))
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, Path(directory) / "checkpoints.sqlite"))
+
+
+if __name__ == "__main__":
+    main()
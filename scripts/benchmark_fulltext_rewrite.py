@@ -0,0 +1,125 @@
+"""
+Benchmark the full-text index rewrite of STARTS WITH filters against a live Neo4j database.
+
+A synthetic dataset of `FulltextBenchmark` nodes with a full-text indexed `text` property is created,
+then each benchmark statement is timed as generated and as rewritten by the rewrite stage.
+The dataset and index are removed afterwards unless `--keep` is passed.
+
+Usage:
+    python -m scripts.benchmark_fulltext_rewrite example_apps/iqs_data_explorer/app-config.yml --nodes 200000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from neo4j import Driver, GraphDatabase
+
+from neo4j_text2cypher.utils.config import ConfigLoader
+from neo4j_text2cypher.utils.cypher_utils import (
+    rewrite_cypher_text_predicates_to_fulltext,
+)
+
+LABEL = "FulltextBenchmark"
+INDEX_NAME = "fulltext_benchmark_text"
+VOCABULARY = (
+    "seat door engine noise cup holder parking camera carplay trunk sensor brake "
+    "pedal mirror window wiper heater steering wheel infotainment screen speaker "
+    "battery charger light cabin road wind rattle vibration comfortable loud "
+    "slow quick broken great poor easy hard cold warm bright dark"
+).split()
+PHRASES = ["cup holder", "parking camera", "carplay", "steering wheel", "wind noise"]
+
+
+def create_dataset(driver: Driver, database: str, nodes: int, seed: int) -> None:
+    rng = random.Random(seed)
+    batch_size = 10000
+    for offset in range(0, nodes, batch_size):
+        texts = [
+            " ".join(rng.choices(VOCABULARY, k=rng.randint(8, 30)))
+            for _ in range(min(batch_size, nodes - offset))
+        ]
+        driver.execute_query(
+            f"UNWIND $texts AS text CREATE (:{LABEL} {{text: text}})",
+            {"texts": texts},
+            database_=database,
+        )
+    driver.execute_query(
+        f"CREATE FULLTEXT INDEX {INDEX_NAME} IF NOT EXISTS "
+        f"FOR (n:{LABEL}) ON EACH [n.text]",
+        database_=database,
+    )
+    driver.execute_query("CALL db.awaitIndexes(600)", database_=database)
+
+
+def drop_dataset(driver: Driver, database: str) -> None:
+    driver.execute_query(f"DROP INDEX {INDEX_NAME} IF EXISTS", database_=database)
+    # CALL IN TRANSACTIONS must run in an auto-commit transaction
+    with driver.session(database=database) as session:
+        session.run(
+            f"MATCH (n:{LABEL}) "
+            "CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS"
+        ).consume()
+
+
+def time_statement(
+    driver: Driver, database: str, statement: str, repetitions: int
+) -> Dict[str, Any]:
+    durations = []
+    records: List[Any] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        records, _, _ = driver.execute_query(statement, database_=database)
+        durations.append(time.perf_counter() - start)
+    return {"seconds": statistics.median(durations), "count": records[0]["total"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config with Neo4j settings")
+    parser.add_argument("--nodes", type=int, default=100000, help="Dataset size")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the dataset and index afterwards"
+    )
+    args = parser.parse_args()
+
+    params = ConfigLoader(args.config).get_neo4j_connection_params()
+    database = params["database"]
+    indexes = [{"name": INDEX_NAME, "labels": [LABEL], "properties": ["text"]}]
+
+    with GraphDatabase.driver(
+        params["url"], auth=(params["username"], params["password"])
+    ) as driver:
+        create_dataset(driver, database, args.nodes, args.seed)
+        try:
+            speedups = []
+            for phrase in PHRASES:
+                statement = (
+                    f"MATCH (n:{LABEL}) WHERE n.text STARTS WITH '{phrase}' "
+                    "RETURN count(n) AS total"
+                )
+                rewritten = rewrite_cypher_text_predicates_to_fulltext(
+                    statement, indexes
+                )
+                original = time_statement(driver, database, statement, args.repetitions)
+                indexed = time_statement(driver, database, rewritten, args.repetitions)
+                speedup = original["seconds"] / indexed["seconds"]
+                speedups.append(speedup)
+                print(
+                    f"{phrase!r:>18}: scan {original['seconds'] * 1000:8.1f} ms, "
+                    f"full-text {indexed['seconds'] * 1000:8.1f} ms, "
+                    f"speedup {speedup:5.1f}x, "
+                    f"rows {indexed['count']}/{original['count']}"
+                )
+            print(f"median speedup over {args.nodes} nodes: {statistics.median(speedups):.1f}x")
+        finally:
+            if not args.keep:
+                drop_dataset(driver, database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark Neo4j plan cache reuse with and without literal parameterization.
+
+The workload repeats the query shapes of an app config's `example_queries` with varied literal values.
+By default the Neo4j query cache is simulated as an LRU cache keyed on the statement text.
+With `--live` each statement is also planned with EXPLAIN against the configured database
+and the time until the plan is available is reported.
+
+Usage:
+    python -m scripts.benchmark_plan_cache example_apps/iqs_data_explorer/app-config.yml
+    python -m scripts.benchmark_plan_cache example_apps/iqs_data_explorer/app-config.yml --live
+"""
+
+import argparse
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from neo4j_text2cypher.utils.config import ConfigLoader
+from neo4j_text2cypher.utils.cypher_utils import (
+    inline_cypher_parameters,
+    parameterize_cypher_literals,
+    strip_cypher_statement,
+)
+
+
+class LRUPlanCache:
+    """A plan cache keyed on statement text, evicting the least recently used plan."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.plans: "OrderedDict[str, None]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, statement: str) -> bool:
+        if statement in self.plans:
+            self.plans.move_to_end(statement)
+            self.hits += 1
+            return True
+        self.misses += 1
+        self.plans[statement] = None
+        if len(self.plans) > self.size:
+            self.plans.popitem(last=False)
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def build_workload(
+    statements: List[str], size: int, seed: int
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build (parameterized statement, parameters) pairs with varied literal values."""
+    rng = random.Random(seed)
+    shapes = [parameterize_cypher_literals(strip_cypher_statement(s)) for s in statements]
+    string_pool = sorted(
+        {v for _, params in shapes for v in params.values() if isinstance(v, str)}
+    )
+
+    workload = []
+    for _ in range(size):
+        statement, parameters = rng.choice(shapes)
+        varied: Dict[str, Any] = {}
+        for name, value in parameters.items():
+            if isinstance(value, str) and string_pool:
+                varied[name] = rng.choice(string_pool)
+            elif isinstance(value, int):
+                varied[name] = max(0, value + rng.randint(-5, 5))
+            else:
+                varied[name] = value
+        workload.append((statement, varied))
+    return workload
+
+
+def simulate(
+    workload: List[Tuple[str, Dict[str, Any]]], cache_size: int
+) -> Dict[str, float]:
+    inlined = LRUPlanCache(cache_size)
+    parameterized = LRUPlanCache(cache_size)
+    for statement, parameters in workload:
+        inlined.lookup(inline_cypher_parameters(statement, parameters))
+        parameterized.lookup(statement)
+    return {"inlined": inlined.hit_rate, "parameterized": parameterized.hit_rate}
+
+
+def run_live(
+    workload: List[Tuple[str, Dict[str, Any]]], config_path: str
+) -> Dict[str, float]:
+    from neo4j import GraphDatabase, Query
+
+    params = ConfigLoader(config_path).get_neo4j_connection_params()
+    results = {}
+    with GraphDatabase.driver(
+        params["url"], auth=(params["username"], params["password"])
+    ) as driver:
+        for mode in ("inlined", "parameterized"):
+            driver.execute_query("CALL db.clearQueryCaches()", database_=params["database"])
+            planning_ms = 0
+            for statement, parameters in workload:
+                if mode == "inlined":
+                    query, query_params = inline_cypher_parameters(statement, parameters), {}
+                else:
+                    query, query_params = statement, parameters
+                _, summary, _ = driver.execute_query(
+                    Query(text=f"EXPLAIN {query}"),
+                    query_params,
+                    database_=params["database"],
+                )
+                planning_ms += summary.result_available_after or 0
+            results[mode] = planning_ms / len(workload)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config with example_queries")
+    parser.add_argument("--queries", type=int, default=5000, help="Workload size")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="Simulated plan cache sizes. Neo4j defaults to 1000.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--live", action="store_true", help="Also plan the workload against Neo4j"
+    )
+    args = parser.parse_args()
+
+    statements = [q.cql for q in ConfigLoader(args.config).get_example_queries()]
+    workload = build_workload(statements, args.queries, args.seed)
+    print(f"{len(statements)} query shapes, {len(workload)} queries")
+
+    for cache_size in args.cache_size:
+        start = time.perf_counter()
+        rates = simulate(workload, cache_size)
+        print(
+            f"cache size {cache_size:>6}: "
+            f"inlined hit rate {rates['inlined']:.1%}, "
+            f"parameterized hit rate {rates['parameterized']:.1%} "
+            f"({time.perf_counter() - start:.2f}s)"
+        )
+
+    if args.live:
+        timings = run_live(workload, args.config)
+        print(
+            f"mean time to plan: inlined {timings['inlined']:.1f} ms, "
+            f"parameterized {timings['parameterized']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Benchmark the full workflow offline by replaying a cassette of its LLM calls and Neo4j queries.
+
+Record a cassette once with `--record`, which needs the LLM providers and Neo4j. Replays need neither and return the
+recorded responses, either instantly, to measure orchestration, caching and parsing overhead,
+or with their `original` durations, to reproduce end-to-end latency.
+The questions are the `example_questions` of the app config unless given with `--question`.
+Each run has the request budget of the app config, and its mean token usage and cost are reported,
+along with the share of input tokens that were served from the provider's prompt cache when recorded.
+The cost gate and the verified query store are not used.
+
+The nodes use the models of the `llm` section of the app config. With `--compare`, the questions are also run
+with every node on the default model, and the latency, tokens, cost and time per LLM node of both are compared.
+Record with `--compare` too, since each model's responses are recorded separately.
+
+Usage:
+    python -m scripts.benchmark_replay example_apps/iqs_data_explorer/app-config.yml --record [--compare]
+    python -m scripts.benchmark_replay example_apps/iqs_data_explorer/app-config.yml --repetitions 20 [--latency original] [--compare]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.evaluation import (
+    Cassette,
+    RecordedNeo4jGraph,
+    RunStatsCallbackHandler,
+    with_cassette,
+)
+from neo4j_text2cypher.retrievers import ConfigCypherExampleRetriever, PropertyValueIndex
+from neo4j_text2cypher.utils.budget import with_request_budget
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor
+from neo4j_text2cypher.utils.config import ConfigLoader, LLMConfig
+from neo4j_text2cypher.utils.llm import LLM_NODES, create_node_llms
+from neo4j_text2cypher.utils.metrics import get_metrics
+from neo4j_text2cypher.utils.schema_snapshot import load_neo4j_graph
+from neo4j_text2cypher.utils.token_usage import (
+    TokenUsage,
+    add_token_usage,
+    empty_token_usage,
+    get_cached_token_ratio,
+)
+from neo4j_text2cypher.workflows.deadlines import ainvoke_with_deadline
+from neo4j_text2cypher.workflows.neo4j_text2cypher_workflow import (
+    create_neo4j_text2cypher_workflow,
+)
+
+
+def create_workflow(
+    config_loader: ConfigLoader,
+    llm_config: LLMConfig,
+    cassette: Cassette,
+    graph: RecordedNeo4jGraph,
+) -> CompiledStateGraph:
+    timeout_config = config_loader.get_timeout_config()
+    llm, node_llms = create_node_llms(llm_config, timeout=timeout_config.llm_seconds)
+    return create_neo4j_text2cypher_workflow(
+        llm=with_cassette(llm, cassette),
+        graph=graph,  # type: ignore[arg-type]
+        cypher_example_retriever=ConfigCypherExampleRetriever(
+            config_path=str(config_loader.config_path)
+        ),
+        scope_description=config_loader.get_streamlit_config().scope_description,
+        governor=ConcurrencyGovernor.from_config(config_loader.get_concurrency_config()),
+        fulltext_rewrite_config=config_loader.get_fulltext_rewrite_config(),
+        parameterization_config=config_loader.get_parameterization_config(),
+        property_value_index=PropertyValueIndex.from_config(
+            config_loader.get_property_value_index_config(), graph  # type: ignore[arg-type]
+        ),
+        timeout_config=timeout_config,
+        node_llms={node: with_cassette(m, cassette) for node, m in node_llms.items()},
+        schema_prompt_config=config_loader.get_schema_prompt_config(),
+    )
+
+
+async def benchmark(
+    workflow: CompiledStateGraph,
+    config_loader: ConfigLoader,
+    questions: List[str],
+    repetitions: int,
+) -> Dict[str, Any]:
+    """Run every question `repetitions` times and summarize latency, usage and time per LLM node."""
+    latencies: List[float] = []
+    tokens: List[int] = []
+    costs: List[float] = []
+    token_usage: TokenUsage = empty_token_usage()
+    node_seconds: Dict[str, List[float]] = {node: [] for node in LLM_NODES}
+    for _ in range(repetitions):
+        for question in questions:
+            stats = RunStatsCallbackHandler()
+            start = time.perf_counter()
+            output = await ainvoke_with_deadline(
+                workflow,
+                {"question": question, "data": [], "history": []},
+                config=with_request_budget(
+                    config_loader.get_budget_config(), {"callbacks": [stats]}
+                ),
+                timeout=config_loader.get_timeout_config().request_seconds,
+            )
+            latencies.append(time.perf_counter() - start)
+            usage = output.get("usage") or dict()
+            tokens.append(usage.get("token_usage", dict()).get("total_tokens", 0))
+            if usage.get("token_usage"):
+                token_usage = add_token_usage(token_usage, usage["token_usage"])
+            costs.append(usage.get("cost", 0.0))
+            for node in LLM_NODES:
+                node_seconds[node].append(stats.node_seconds.get(node, 0.0))
+
+    latencies.sort()
+    return {
+        "runs": len(latencies),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1000,
+        "tokens": statistics.mean(tokens),
+        "cost": statistics.mean(costs),
+        # the share of input tokens served from the provider's prompt cache
+        "cached": get_cached_token_ratio(token_usage),
+        # summed over the concurrent tasks of a run
+        "node_ms": {
+            node: statistics.mean(seconds) * 1000 for node, seconds in node_seconds.items()
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    config_loader = ConfigLoader(args.config)
+    cassette = Cassette(
+        args.cassette or Path(".cache/cassettes") / f"{Path(args.config).parent.name}-workflow.json",
+        record=args.record,
+        latency=args.latency,
+    )
+    live_graph = (
+        load_neo4j_graph(
+            config_loader.get_neo4j_connection_params(),
+            config_loader.get_schema_snapshot_config(),
+            config_loader.get_schema_introspection_config(),
+        )
+        if args.record
+        else None
+    )
+    graph = RecordedNeo4jGraph(cassette, graph=live_graph)
+    if not args.record:
+        # replayed runs never call the provider, and the key is not part of the recording key
+        os.environ.setdefault("OPENAI_API_KEY", "replay")
+
+    llm_config = config_loader.get_llm_config()
+    llm_configs = {"routed": llm_config}
+    if args.compare:
+        llm_configs["default"] = LLMConfig(default=llm_config.default)
+
+    questions: List[str] = args.question or config_loader.get_streamlit_config().example_questions
+    repetitions = 1 if args.record else args.repetitions
+    results: Dict[str, Dict[str, Any]] = dict()
+    try:
+        for name, config in llm_configs.items():
+            workflow = create_workflow(config_loader, config, cassette, graph)
+            results[name] = await benchmark(workflow, config_loader, questions, repetitions)
+    finally:
+        graph.close()
+
+    print(f"latency={args.latency}, record={args.record}")
+    print(
+        f"{'models':<10}{'runs':>6}{'median ms':>12}{'p95 ms':>10}{'tokens':>10}{'cached':>8}{'cost':>10}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<10}{result['runs']:>6}{result['median_ms']:>12.1f}{result['p95_ms']:>10.1f}"
+            f"{result['tokens']:>10.0f}{result['cached']:>8.0%}{result['cost']:>10.4f}"
+        )
+    print(f"\n{'node ms':<18}" + "".join(f"{name:>10}" for name in results))
+    for node in LLM_NODES:
+        print(f"{node:<18}" + "".join(f"{r['node_ms'][node]:>10.1f}" for r in results.values()))
+
+    print(f"\ncassette: {cassette.count('llm')} LLM calls, {cassette.count('query')} queries")
+    counters = get_metrics().snapshot()["counters"]
+    print(
+        {
+            key: value
+            for key, value in counters.items()
+            if key.startswith(("cassette.", "budget."))
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config")
+    parser.add_argument(
+        "--cassette",
+        default=None,
+        help="The cassette file, by default .cache/cassettes/<app name>-workflow.json",
+    )
+    parser.add_argument("--record", action="store_true", help="Record a cassette")
+    parser.add_argument("--latency", choices=["original", "none"], default="none")
+    parser.add_argument("--repetitions", type=int, default=10)
+    parser.add_argument("--question", action="append", help="A question to ask, repeatable")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also run every node on the default model and compare",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark many Streamlit-style sessions sharing one set of workflow resources.
+
+Each session is a thread that asks its questions one after another, like a browser session rerunning the script.
+Runs go through the shared background event loop of `WorkflowResources`, with a fake workflow that sleeps instead of
+calling an LLM or Neo4j. For comparison, the same sessions run each turn in a fresh event loop, as the app did before.
+Pass an app config to also time the setup that each session paid before the resources were shared.
+
+Usage:
+    python -m scripts.benchmark_sessions --sessions 200 --turns 3 [--config example_apps/iqs_data_explorer/app-config.yml]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import Callable, List
+
+from langgraph.graph.state import CompiledStateGraph
+
+from neo4j_text2cypher.utils.config import ConfigLoader
+from neo4j_text2cypher.workflows.deadlines import ainvoke_with_deadline
+from neo4j_text2cypher.workflows.resources import WorkflowResources
+from scripts.load_test_api import create_fake_workflow
+
+
+def run_sessions(
+    sessions: int, turns: int, ask: Callable[[str], None]
+) -> List[float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def session(index: int) -> None:
+        for turn in range(turns):
+            start = time.perf_counter()
+            ask(f"Question {turn} of session {index}")
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def report(name: str, latencies: List[float], elapsed: float) -> None:
+    print(
+        f"{name:<22} {len(latencies) / elapsed:7.1f} turns/s, "
+        f"median {statistics.median(latencies) * 1000:6.0f} ms, "
+        f"max {max(latencies) * 1000:6.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument(
+        "--node-seconds", type=float, default=0.05, help="Mean latency of each fake workflow node"
+    )
+    parser.add_argument("--config", default=None, help="Time the real resource setup of an app config")
+    args = parser.parse_args()
+
+    if args.config is not None:
+        start = time.perf_counter()
+        WorkflowResources.from_config(ConfigLoader(args.config)).close()
+        setup = time.perf_counter() - start
+        print(
+            f"resource setup: {setup * 1000:.0f} ms, paid once instead of "
+            f"{args.sessions} times ({setup * args.sessions:.1f} s)"
+        )
+
+    workflow: CompiledStateGraph = create_fake_workflow(args.node_seconds, seed=0)
+
+    resources = WorkflowResources(workflow)
+    start = time.perf_counter()
+    shared = run_sessions(
+        args.sessions,
+        args.turns,
+        lambda question: resources.run(
+            ainvoke_with_deadline(resources.workflow, {"question": question})
+        ),
+    )
+    report("shared event loop", shared, time.perf_counter() - start)
+    resources.close()
+
+    start = time.perf_counter()
+    per_turn = run_sessions(
+        args.sessions,
+        args.turns,
+        lambda question: asyncio.run(
+            ainvoke_with_deadline(workflow, {"question": question})
+        ),
+    )
+    report("event loop per turn", per_turn, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
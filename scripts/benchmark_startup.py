@@ -0,0 +1,93 @@
+"""
+Benchmark the time until the graph schema is ready, with and without a schema snapshot.
+
+Each repetition connects to Neo4j from scratch. The snapshot is written to a temporary file by the first
+snapshot run and loaded by the following ones. Background revalidation is disabled so that it is not timed.
+The parallel introspection engine is timed for a full read and for an incremental refresh of an unchanged graph.
+
+Usage:
+    python -m scripts.benchmark_startup example_apps/iqs_data_explorer/app-config.yml --repetitions 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from langchain_neo4j import Neo4jGraph
+
+from neo4j_text2cypher.utils.config import ConfigLoader, SchemaSnapshotConfig
+from neo4j_text2cypher.utils.schema_introspection import introspect_schema
+from neo4j_text2cypher.utils.schema_snapshot import load_neo4j_graph
+
+
+def time_startup(
+    create_graph: Callable[[], Neo4jGraph], repetitions: int
+) -> List[float]:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        graph = create_graph()
+        durations.append(time.perf_counter() - start)
+        graph.close()
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config with Neo4j settings")
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    config_loader = ConfigLoader(args.config)
+    params = config_loader.get_neo4j_connection_params()
+    introspection_config = config_loader.get_schema_introspection_config().model_copy(
+        update={"enabled": True}
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_config = SchemaSnapshotConfig(
+            enabled=True,
+            path=str(Path(directory) / "schema_snapshot.json"),
+            revalidate=False,
+        )
+        introspection = time_startup(lambda: Neo4jGraph(**params), args.repetitions)
+        cold = time_startup(lambda: load_neo4j_graph(params, snapshot_config), 1)
+        warm = time_startup(
+            lambda: load_neo4j_graph(params, snapshot_config), args.repetitions
+        )
+        snapshot_size = Path(snapshot_config.path).stat().st_size
+
+    graph = Neo4jGraph(**{**params, "refresh_schema": False})
+    parallel = []
+    incremental = []
+    for _ in range(args.repetitions):
+        start = time.perf_counter()
+        structured_schema = introspect_schema(graph, introspection_config)
+        parallel.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        introspect_schema(graph, introspection_config, previous=structured_schema)
+        incremental.append(time.perf_counter() - start)
+    graph.close()
+
+    print(
+        f"schema introspection: median {statistics.median(introspection) * 1000:8.1f} ms "
+        f"(enhanced_schema={params['enhanced_schema']})"
+    )
+    print(
+        f"parallel introspection: median {statistics.median(parallel) * 1000:8.1f} ms "
+        f"({introspection_config.max_workers} workers), "
+        f"incremental {statistics.median(incremental) * 1000:8.1f} ms"
+    )
+    print(f"first snapshot run:   {cold[0] * 1000:8.1f} ms (introspection and save)")
+    print(f"snapshot load:        median {statistics.median(warm) * 1000:8.1f} ms")
+    print(
+        f"speedup {statistics.median(introspection) / statistics.median(warm):.1f}x, "
+        f"snapshot {snapshot_size / 1024:.1f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
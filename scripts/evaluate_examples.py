@@ -0,0 +1,177 @@
+"""
+Evaluate the text2cypher subgraph on the `example_queries` of an app config.
+
+Every example question is run through the subgraph with that example left out of the few shot examples.
+The result set of the final statement is compared with the result set of the reference Cypher.
+Execution accuracy, attempts, tokens, latency and time per node are reported.
+
+Neo4j is replaced by a stand-in serving the query responses recorded in a cassette.
+Record them once against the live database with `--record`, which also records the queries of any new statements
+generated later. With `--replay-llm` the LLM responses are replayed from the cassette too, so a run needs neither
+OpenAI nor Neo4j, and is only meaningful for orchestration, caching and parsing changes that keep the prompts unchanged.
+The cost gate and the verified query store are not used.
+
+The schema is rendered as the `schema_prompt` section of the app config sets, unless overridden with `--schema-format`
+and `--schema-detail`, so that the accuracy of a compact schema can be compared with the default.
+The number of schema tokens in the prompts is reported with the results.
+
+Usage:
+    python -m scripts.evaluate_examples example_apps/iqs_data_explorer/app-config.yml --record
+    python -m scripts.evaluate_examples example_apps/iqs_data_explorer/app-config.yml --output results.json
+    python -m scripts.evaluate_examples example_apps/iqs_data_explorer/app-config.yml --replay-llm --latency original
+    python -m scripts.evaluate_examples example_apps/iqs_data_explorer/app-config.yml --schema-format compact --schema-detail types
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+
+from neo4j_text2cypher.evaluation import (
+    Cassette,
+    HoldoutExampleRetriever,
+    RecordedNeo4jGraph,
+    evaluate_examples,
+    summarize_evaluation,
+    with_cassette,
+)
+from neo4j_text2cypher.retrievers import PropertyValueIndex
+from neo4j_text2cypher.utils.config import ConfigLoader, LLMConfig
+from neo4j_text2cypher.utils.compact_schema import count_tokens
+from neo4j_text2cypher.utils.concurrency import ConcurrencyGovernor
+from neo4j_text2cypher.utils.llm import create_node_llms
+from neo4j_text2cypher.utils.schema_snapshot import load_neo4j_graph
+from neo4j_text2cypher.utils.schema_utils import (
+    retrieve_and_parse_schema_from_graph_for_prompts,
+)
+from neo4j_text2cypher.workflows.single_agent import create_text2cypher_agent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config with example queries")
+    parser.add_argument(
+        "--cassette",
+        default=None,
+        help="The cassette file, by default .cache/cassettes/<app name>.json",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record unrecorded queries against the live database and LLM calls",
+    )
+    parser.add_argument(
+        "--replay-llm", action="store_true", help="Replay LLM responses from the cassette"
+    )
+    parser.add_argument(
+        "--latency",
+        choices=["original", "none"],
+        default="none",
+        help="Replay interactions with their recorded duration or instantly",
+    )
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="Use this model for every node instead of the `llm` section of the app config",
+    )
+    parser.add_argument(
+        "--schema-format",
+        choices=["langchain", "compact"],
+        default=None,
+        help="Render the schema in this format instead of that of the app config",
+    )
+    parser.add_argument(
+        "--schema-detail",
+        choices=["names", "types", "values"],
+        default=None,
+        help="List this much of each property in a compact schema instead of the app config detail",
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=None, help="Evaluate only the first examples")
+    parser.add_argument("--output", default=None, help="Write every example outcome as JSON")
+    args = parser.parse_args()
+
+    config_loader = ConfigLoader(args.config)
+    cassette = Cassette(
+        args.cassette or Path(".cache/cassettes") / f"{Path(args.config).parent.name}.json",
+        record=args.record,
+        latency=args.latency,
+    )
+    live_graph = (
+        load_neo4j_graph(
+            config_loader.get_neo4j_connection_params(),
+            config_loader.get_schema_snapshot_config(),
+            config_loader.get_schema_introspection_config(),
+        )
+        if args.record
+        else None
+    )
+    graph = RecordedNeo4jGraph(cassette, graph=live_graph)
+
+    timeout_config = config_loader.get_timeout_config()
+    llm_config = config_loader.get_llm_config()
+    if args.model is not None:
+        llm_config = LLMConfig(
+            default=llm_config.default.model_copy(update={"model": args.model})
+        )
+    if args.replay_llm:
+        # replayed runs never call the provider, and the key is not part of the recording key
+        os.environ.setdefault("OPENAI_API_KEY", "replay")
+    llm, node_llms = create_node_llms(llm_config, timeout=timeout_config.llm_seconds)
+    if args.record or args.replay_llm:
+        llm = with_cassette(llm, cassette)
+        node_llms = {node: with_cassette(m, cassette) for node, m in node_llms.items()}
+    schema_prompt_config = config_loader.get_schema_prompt_config()
+    if args.schema_format is not None:
+        schema_prompt_config = schema_prompt_config.model_copy(update={"format": args.schema_format})
+    if args.schema_detail is not None:
+        schema_prompt_config = schema_prompt_config.model_copy(update={"detail": args.schema_detail})
+    retriever = HoldoutExampleRetriever(config_path=args.config)
+    agent = create_text2cypher_agent(
+        llm=llm,
+        graph=graph,  # type: ignore[arg-type]
+        cypher_example_retriever=retriever,
+        fulltext_rewrite_config=config_loader.get_fulltext_rewrite_config(),
+        parameterization_config=config_loader.get_parameterization_config(),
+        property_value_index=PropertyValueIndex.from_config(
+            config_loader.get_property_value_index_config(), graph  # type: ignore[arg-type]
+        ),
+        node_timeouts=timeout_config.nodes,
+        node_llms=node_llms,
+        schema_prompt_config=schema_prompt_config,
+        # replayed queries sleep for their recorded duration in worker threads, as live queries block
+        governor=ConcurrencyGovernor.from_config(config_loader.get_concurrency_config()),
+    )
+
+    examples = config_loader.get_example_queries()[: args.limit]
+    try:
+        evaluations = asyncio.run(
+            evaluate_examples(agent, graph, examples, retriever, args.concurrency)
+        )
+    finally:
+        graph.close()
+
+    for evaluation in evaluations:
+        outcome = "✓" if evaluation.correct else ("✗" if evaluation.scored else "?")
+        print(
+            f"{outcome} {evaluation.seconds:6.2f} s {evaluation.attempts} attempts "
+            f"{evaluation.token_usage['total_tokens']:6d} tokens  {evaluation.question[:70]}"
+        )
+        if evaluation.error:
+            print(f"    {evaluation.error[:200]}")
+    schema_tokens = count_tokens(
+        retrieve_and_parse_schema_from_graph_for_prompts(graph, schema_prompt_config)  # type: ignore[arg-type]
+    )
+    print(
+        f"schema: {schema_prompt_config.format} {schema_prompt_config.detail}, {schema_tokens} tokens"
+    )
+    print(json.dumps(summarize_evaluation(evaluations), indent=2))
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump([e.model_dump() for e in evaluations], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
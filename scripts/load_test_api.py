@@ -0,0 +1,183 @@
+"""
+Load test the ASGI service.
+
+By default the service runs in process with a fake workflow that sleeps instead of calling an LLM or Neo4j,
+so the numbers measure the serving overhead, coalescing and streaming rather than the backends.
+Pass `--url` to load test a running service instead.
+The in-process transport buffers whole responses, so time to first token is only meaningful with `--url`.
+
+Usage:
+    python -m scripts.load_test_api --requests 500 --concurrency 50 --unique 20 [--stream]
+    python -m scripts.load_test_api --url http://localhost:8000 --requests 100 --concurrency 10 --stream
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional
+
+import httpx
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.constants import END, START
+from langgraph.graph.state import CompiledStateGraph, StateGraph
+
+from neo4j_text2cypher.api import create_app
+from neo4j_text2cypher.components.final_answer import create_final_answer_node
+from neo4j_text2cypher.components.state import InputState, OutputState, OverallState
+from neo4j_text2cypher.utils.metrics import get_metrics
+
+FAKE_SUMMARY = "There are 42 responses that mention the cup holder, most of them for the Civic."
+
+
+def create_fake_workflow(node_seconds: float, seed: int) -> CompiledStateGraph:
+    """A workflow with the node names of the real one that sleeps instead of calling backends."""
+    rng = random.Random(seed)
+    llm = GenericFakeChatModel(messages=itertools.cycle([AIMessage(content=FAKE_SUMMARY)]))
+
+    async def sleep() -> None:
+        await asyncio.sleep(rng.uniform(0.5, 1.5) * node_seconds)
+
+    async def guardrails(state: OverallState) -> Dict[str, Any]:
+        await sleep()
+        return {"next_action": "planner", "steps": ["guardrails"]}
+
+    async def planner(state: OverallState) -> Dict[str, Any]:
+        await sleep()
+        return {"steps": ["planner"]}
+
+    async def text2cypher(state: OverallState) -> Dict[str, Any]:
+        await sleep()
+        return {
+            "cyphers": [
+                {
+                    "task": state.get("question", ""),
+                    "statement": "MATCH (v:Verbatim) RETURN count(v) AS total",
+                    "parameters": None,
+                    "errors": [],
+                    "records": [{"total": 42}],
+                    "cypher_steps": ["generate_cypher", "validate_cypher", "execute_cypher"],
+                    "token_usage": [],
+                }
+            ],
+            "steps": ["text2cypher"],
+        }
+
+    async def summarize(state: OverallState) -> Dict[str, Any]:
+        # the fake model streams one token per word
+        summary = await llm.ainvoke(state.get("question", ""))
+        return {"summary": summary.content, "steps": ["summarize"]}
+
+    builder = StateGraph(OverallState, input=InputState, output=OutputState)
+    builder.add_node(guardrails)
+    builder.add_node(planner)
+    builder.add_node(text2cypher)
+    builder.add_node(summarize)
+    builder.add_node(create_final_answer_node())
+    builder.add_edge(START, "guardrails")
+    builder.add_edge("guardrails", "planner")
+    builder.add_edge("planner", "text2cypher")
+    builder.add_edge("text2cypher", "summarize")
+    builder.add_edge("summarize", "final_answer")
+    builder.add_edge("final_answer", END)
+    return builder.compile()
+
+
+async def send_request(
+    client: httpx.AsyncClient, question: str, stream: bool
+) -> Dict[str, Optional[float]]:
+    start = time.perf_counter()
+    first_token: Optional[float] = None
+    if stream:
+        async with client.stream("POST", "/ask/stream", json={"question": question}) as response:
+            response.raise_for_status()
+            event = ""
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: ") :]
+                    if event == "token" and first_token is None:
+                        first_token = time.perf_counter() - start
+                elif line.startswith("data: ") and event == "error":
+                    raise RuntimeError(json.loads(line[len("data: ") :])["detail"])
+    else:
+        response = await client.post("/ask", json={"question": question})
+        response.raise_for_status()
+    return {"seconds": time.perf_counter() - start, "first_token": first_token}
+
+
+def percentile(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with AsyncExitStack() as stack:
+        if args.url is not None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(base_url=args.url, timeout=None)
+            )
+        else:
+            app = create_app(workflow=create_fake_workflow(args.node_seconds, args.seed))
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=app),
+                    base_url="http://service",
+                    timeout=None,
+                )
+            )
+
+        rng = random.Random(args.seed)
+        questions = [f"How many responses mention topic {rng.randrange(args.unique)}?" for _ in range(args.requests)]
+        semaphore = asyncio.Semaphore(args.concurrency)
+        failures = 0
+
+        async def limited(question: str) -> Optional[Dict[str, Optional[float]]]:
+            nonlocal failures
+            async with semaphore:
+                try:
+                    return await send_request(client, question, args.stream)
+                except (httpx.HTTPError, RuntimeError) as e:
+                    failures += 1
+                    print(f"request failed: {e!r}")
+                    return None
+
+        start = time.perf_counter()
+        results = [r for r in await asyncio.gather(*(limited(q) for q in questions)) if r is not None]
+        elapsed = time.perf_counter() - start
+
+    latencies = [r["seconds"] for r in results if r["seconds"] is not None]
+    print(f"{len(results)} ok, {failures} failed in {elapsed:.2f} s ({len(results) / elapsed:.1f} req/s)")
+    if latencies:
+        print(
+            f"latency: median {statistics.median(latencies) * 1000:.0f} ms, "
+            f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms, max {max(latencies) * 1000:.0f} ms"
+        )
+    first_tokens = [r["first_token"] for r in results if r["first_token"] is not None]
+    if first_tokens:
+        print(f"time to first token: median {statistics.median(first_tokens) * 1000:.0f} ms")
+    if args.url is None:
+        counters = get_metrics().snapshot()["counters"]
+        print({key: value for key, value in counters.items() if key.startswith(("api.", "coalescer."))})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=None, help="Base URL of a running service")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--unique", type=int, default=50, help="Number of distinct questions")
+    parser.add_argument("--stream", action="store_true", help="Use /ask/stream")
+    parser.add_argument(
+        "--node-seconds", type=float, default=0.2, help="Mean latency of each fake workflow node"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
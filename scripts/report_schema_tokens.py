@@ -0,0 +1,78 @@
+"""
+Report the size of the prompt schema in the `Neo4jGraph` format and at every compact detail level.
+
+The schema is read from the live database, or from the cassette of `scripts.evaluate_examples` with `--cassette`,
+so no database is needed once a cassette has been recorded. Tokens are counted with a tiktoken encoding,
+or estimated at 4 characters per token if the encoding can not be loaded.
+Value sampling of the compact formats follows the `schema_prompt` section of the app config.
+
+Usage:
+    python -m scripts.report_schema_tokens example_apps/iqs_data_explorer/app-config.yml
+    python -m scripts.report_schema_tokens example_apps/iqs_data_explorer/app-config.yml --cassette .cache/cassettes/iqs_data_explorer.json --show compact
+"""
+
+import argparse
+
+from neo4j_text2cypher.evaluation import Cassette, RecordedNeo4jGraph
+from neo4j_text2cypher.utils.config import ConfigLoader
+from neo4j_text2cypher.utils.schema_snapshot import load_neo4j_graph
+from neo4j_text2cypher.utils.schema_utils import (
+    get_schema_token_report,
+    retrieve_and_parse_schema_from_graph_for_prompts,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("config", help="Path to an app config")
+    parser.add_argument(
+        "--cassette", default=None, help="Read the schema recorded in this cassette"
+    )
+    parser.add_argument(
+        "--encoding", default="o200k_base", help="The tiktoken encoding to count with"
+    )
+    parser.add_argument(
+        "--show",
+        choices=["langchain", "compact"],
+        default=None,
+        help="Also print the schema in this format, at the detail of the app config",
+    )
+    args = parser.parse_args()
+
+    config_loader = ConfigLoader(args.config)
+    schema_prompt_config = config_loader.get_schema_prompt_config()
+    if args.cassette is not None:
+        graph = RecordedNeo4jGraph(Cassette(args.cassette))
+    else:
+        graph = load_neo4j_graph(
+            config_loader.get_neo4j_connection_params(),
+            config_loader.get_schema_snapshot_config(),
+            config_loader.get_schema_introspection_config(),
+        )
+
+    try:
+        report = get_schema_token_report(
+            graph, schema_prompt_config, args.encoding  # type: ignore[arg-type]
+        )
+        if args.show is not None:
+            print(
+                retrieve_and_parse_schema_from_graph_for_prompts(
+                    graph,  # type: ignore[arg-type]
+                    schema_prompt_config.model_copy(update={"format": args.show}),
+                )
+            )
+            print()
+    finally:
+        graph.close()
+
+    baseline = report[0]["tokens"] or 1
+    print(f"{'format':<12}{'detail':<8}{'characters':>12}{'tokens':>10}{'share':>8}")
+    for row in report:
+        print(
+            f"{row['format']:<12}{row['detail']:<8}{row['characters']:>12}{row['tokens']:>10}"
+            f"{row['tokens'] / baseline:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()